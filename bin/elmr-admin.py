@@ -21,13 +21,11 @@ Script for executing ELMR related management commands
 
 import os
 import sys
+import time
 import imp
 import argparse
 import importlib
 
-## Imports for database handling
-from migrate.versioning import api
-
 ## Important Paths
 ADMN_DIR = os.path.abspath(os.path.dirname(__file__))
 BASE_DIR = os.path.normpath(os.path.join(ADMN_DIR, ".."))
@@ -37,11 +35,11 @@ FIXTURES = os.path.join(BASE_DIR, "fixtures")
 sys.path.append(BASE_DIR)
 
 ## Import ELMR Libraries
+## Note: command specific imports are deferred to the command functions so
+## that each command only loads what it uses (see the importtime command).
 import elmr
 
-from elmr.ingest import ingest
 from elmr.config import get_settings_object
-from elmr.delta import deltas
 
 ##########################################################################
 ## Script Definition
@@ -77,7 +75,7 @@ def runserver(args):
     mode = get_settings_object("development")
     print "running ELMR with %s configuration" % mode
 
-    elmr.app.run()
+    elmr.configure().run()
     return ""
 
 
@@ -85,6 +83,7 @@ def ingest_data(args):
     """
     Ingest and wrangle data from BLS
     """
+    from elmr.ingest import ingest
 
     conf = get_config()
     opts = dict(vars(args))
@@ -100,10 +99,33 @@ def ingest_data(args):
     ) % (record.num_added, record.num_series, record.duration)
 
 
+def schedule(args):
+    """
+    Enqueue ingestion of the sources due by the release calendar
+    """
+    elmr.configure()
+    from elmr.schedule import schedule, parse_date
+
+    today    = parse_date(args.date) if args.date else None
+    job, due = schedule(today=today, dryrun=args.dry_run)
+
+    if not due:
+        return "No sources are due for ingestion"
+
+    output = ["%s is due for %s (released %s)" % (
+        source, period.strftime("%b %Y"), released.strftime("%b %d, %Y")
+    ) for source, period, released in due]
+
+    if job is not None:
+        output.append("Enqueued ingestion job %i" % job.id)
+    return "\n".join(output)
+
+
 def compute_deltas(args):
     """
     After ingestion, compute the delta series
     """
+    from elmr.delta import deltas
 
     if args.all:
         series = deltas(None, all=True, delete=args.delete)
@@ -121,10 +143,201 @@ def compute_deltas(args):
     return "\n".join(output)
 
 
+def snapshot(args):
+    """
+    Pre-render every read API response into a static snapshot
+    """
+    elmr.configure()
+    from elmr.snapshot import build_snapshot
+
+    path, count, nbyte, duration = build_snapshot(
+        root=args.root, base_url=args.base_url, link=not args.no_link
+    )
+
+    return (
+        "Wrote %i responses (%i bytes) to %s in %0.3f seconds"
+    ) % (count, nbyte, path, duration)
+
+
+def store(args):
+    """
+    Write the memory-mapped time series store for the current data
+    """
+    from elmr.store import build_store
+
+    path, nseries, nvalues, duration = build_store(root=args.root)
+
+    return (
+        "Stored %i values in %i time series to %s in %0.3f seconds"
+    ) % (nvalues, nseries, path, duration)
+
+
+def arrays(args):
+    """
+    Backfill or benchmark the array per series storage
+    """
+    from elmr.arrays import backfill, benchmark
+
+    if args.action == "backfill":
+        start = time.time()
+        count = backfill(args.series or None)
+        return "Wrote %i series arrays in %0.3f seconds" % (
+            count, time.time() - start
+        )
+
+    results = benchmark(args.series or None, repeat=args.repeat)
+    output  = ["Read %i series (best of %i):" % (results["series"], args.repeat)]
+    output.append("%-10s %12s %12s" % ("layout", "size", "read (ms)"))
+    for name in ("records", "arrays"):
+        output.append("%-10s %12i %12.1f" % (
+            name, results[name]["size"], results[name]["read"] * 1000
+        ))
+
+    return "\n".join(output)
+
+
+def partitions(args):
+    """
+    List the partitions of the records table or create one for a source
+    """
+    from elmr.partitions import create_partition, is_partitioned, partitions
+
+    if not is_partitioned():
+        raise Exception("The records table is not partitioned (run upgrade)")
+
+    if args.action == "create":
+        if not args.source:
+            raise Exception("Specify the source to create a partition for")
+        return "Created partition %s" % create_partition(args.source)
+
+    output = ["%-24s %-32s %12s %12s" % ("partition", "bound", "rows", "size")]
+    for part in partitions():
+        output.append("%-24s %-32s %12i %12i" % (
+            part["relname"], part["bound"],
+            part["estimated_rows"], part["total_size"]
+        ))
+
+    return "\n".join(output)
+
+
+def catalog(args):
+    """
+    Classify the LAUS and CESSM series by state into the states series table
+    """
+    from elmr.fips import GEO_SOURCES, build_state_series
+
+    report = build_state_series(args.sources or GEO_SOURCES)
+    output = ["Classified series: %i added, %i updated, %i unchanged" % (
+        report["added"], report["updated"], report["unchanged"]
+    )]
+
+    if report["failures"]:
+        output.append("%i series could not be classified:" % len(report["failures"]))
+        for blsid, title, reason in report["failures"]:
+            output.append("  %s %r: %s" % (blsid, title, reason))
+
+    return "\n".join(output)
+
+
+def loaddata(args):
+    """
+    Bulk load the shipped fixtures into the database with COPY
+    """
+    from elmr.fixtures import load_fixtures
+
+    def progress(name, rows, seconds):
+        sys.stderr.write("  %-24s %10i rows %12.0f rows/sec\n" % (
+            name, rows, rows / seconds if seconds else 0
+        ))
+
+    report, rebuild = load_fixtures(args.fixtures, progress=progress)
+
+    output = ["%-24s %10s %10s %10s %12s" % (
+        "fixture", "read", "loaded", "time (s)", "rows/sec"
+    )]
+    for name, rows, loaded, seconds in report:
+        output.append("%-24s %10i %10i %10.3f %12.0f" % (
+            name, rows, loaded, seconds, rows / seconds if seconds else 0
+        ))
+    output.append("Rebuilt the indexes in %0.3f seconds" % rebuild)
+
+    return "\n".join(output)
+
+
+def dbtemplate(args):
+    """
+    Capture, restore, list or drop the template databases of the database
+    """
+    from elmr.dbtemplates import capture, restore, templates, drop
+
+    if args.action == "capture":
+        return "Captured %s in %0.3f seconds" % capture(args.key)
+
+    if args.action == "restore":
+        return "Restored %s in %0.3f seconds" % restore(args.key)
+
+    if args.action == "drop":
+        if not args.key:
+            raise Exception("Specify the key of the template to drop")
+        return "Dropped %s" % drop(args.key)
+
+    output = ["%-40s %12s" % ("template", "size")]
+    for name, size in templates():
+        output.append("%-40s %12i" % (name, size))
+
+    return "\n".join(output)
+
+
+def worker(args):
+    """
+    Run the queued background jobs (e.g. from the admin page)
+    """
+    elmr.configure()
+    from elmr.jobs import work
+
+    count = work(poll=args.poll, once=args.once)
+    return "Ran %i background jobs" % count
+
+
+def importtime(args):
+    """
+    Report the cold start import time of the parts of ELMR
+    """
+    from elmr.importtime import report
+
+    output = ["%-15s %10s %8s" % ("target", "time (ms)", "modules")]
+    for name, seconds, modules in report(repeat=args.repeat):
+        output.append("%-15s %10.1f %8i" % (name, seconds * 1000, modules))
+
+    return "\n".join(output)
+
+
+def querytime(args):
+    """
+    Report the CPU time of the ORM and Core reads of a source and dataset
+    """
+    from elmr.queries import benchmark
+
+    results = benchmark(args.source, args.dataset, repeat=args.repeat)
+    output  = ["%-10s %8s %10s %10s" % ("read", "series", "orm (ms)", "core (ms)")]
+    for name in ("source", "geography"):
+        if name not in results:
+            continue
+
+        output.append("%-10s %8i %10.1f %10.1f" % (
+            name, results[name]["series"],
+            results[name]["orm"] * 1000, results[name]["core"] * 1000,
+        ))
+
+    return "\n".join(output)
+
+
 def createdb(args):
     """
     Creates the migrations repository and the database
     """
+    import elmr.models
+    from migrate.versioning import api
 
     # Get the configruation
     config = get_config()
@@ -150,6 +363,8 @@ def migrate(args):
     """
     Create DB migrations for current version
     """
+    import elmr.models
+    from migrate.versioning import api
 
     # Get the configruation
     config = get_config()
@@ -179,6 +394,7 @@ def upgrade(args):
     """
     Runs the database upgrade migration script (run migrate first)
     """
+    from migrate.versioning import api
 
     # Get the configruation
     config = get_config()
@@ -195,6 +411,7 @@ def downgrade(args):
     Restores the database one previous version, run multiple times to go
     back multiple versions if needed.
     """
+    from migrate.versioning import api
 
     # Get the configruation
     config = get_config()
@@ -229,8 +446,16 @@ if __name__ == '__main__':
     ingest_parser.add_argument('--per-page', dest='blocksize', type=int, default=10, help="number of series to fetch from the api at at time")
     ingest_parser.add_argument('--wait', dest='ratelimit', metavar='SEC', default=1, type=int, help="seconds to wait between API calls")
     ingest_parser.add_argument('--title', metavar='TEXT', default="ELMR Command Line Ingestion", help="specify a title for the ingestion record")
+    ingest_parser.add_argument('--source', dest='sources', action='append', metavar='SOURCE', default=None, help="only ingest the series of the source (repeatable)")
+    ingest_parser.add_argument('--reload', action="store_true", help="replace every record of the sources with a freshly loaded partition")
     ingest_parser.set_defaults(func=ingest_data)
 
+    # Schedule Command
+    schedule_parser = subparsers.add_parser('schedule', help='Enqueue ingestion of sources due by the release calendar')
+    schedule_parser.add_argument('--date', metavar='YYYY-MM-DD', default=None, help="check the calendar as of this date instead of today")
+    schedule_parser.add_argument('--dry-run', action="store_true", help="list the due sources without enqueuing a job")
+    schedule_parser.set_defaults(func=schedule)
+
     # Compute Deltas Command
     deltas_parser = subparsers.add_parser('deltas', help='Compute deltas for all or a single series.')
     deltas_parser.add_argument('--all', action="store_true", help="compute deltas for all series, not just one")
@@ -238,6 +463,64 @@ if __name__ == '__main__':
     deltas_parser.add_argument('blsid', type=unicode, nargs="*", help='bls series ids to compute the deltas for')
     deltas_parser.set_defaults(func=compute_deltas)
 
+    # Store Command
+    store_parser = subparsers.add_parser('store', help='Write the memory-mapped time series store')
+    store_parser.add_argument('--root', metavar='PATH', default=None, help="directory to write the store versions to")
+    store_parser.set_defaults(func=store)
+
+    # Snapshot Command
+    snapshot_parser = subparsers.add_parser('snapshot', help='Pre-render the read API to static files')
+    snapshot_parser.add_argument('--root', metavar='PATH', default=None, help="directory to write the snapshot versions to")
+    snapshot_parser.add_argument('--base-url', metavar='URL', default=None, help="public URL of the site for links in responses")
+    snapshot_parser.add_argument('--no-link', action="store_true", help="do not point the current symlink at the new snapshot")
+    snapshot_parser.set_defaults(func=snapshot)
+
+    # Arrays Command
+    arrays_parser = subparsers.add_parser('arrays', help='Backfill or benchmark the array per series storage')
+    arrays_parser.add_argument('action', choices=('backfill', 'benchmark'), help="backfill the arrays from the records or compare the layouts")
+    arrays_parser.add_argument('--series', type=int, action='append', metavar='ID', default=None, help="only backfill or read the series with this id (repeatable)")
+    arrays_parser.add_argument('--repeat', type=int, default=3, help="number of benchmark runs to take the best time of")
+    arrays_parser.set_defaults(func=arrays)
+
+    # Partitions Command
+    partitions_parser = subparsers.add_parser('partitions', help='List or create the partitions of the records table')
+    partitions_parser.add_argument('action', choices=('list', 'create'), nargs='?', default='list', help="list the partitions or create one for a new source")
+    partitions_parser.add_argument('source', nargs='?', default=None, help="source to create a partition for, e.g. LAUS")
+    partitions_parser.set_defaults(func=partitions)
+
+    # Catalog Command
+    catalog_parser = subparsers.add_parser('catalog', help='Classify the state series from their titles')
+    catalog_parser.add_argument('--source', dest='sources', action='append', metavar='SOURCE', default=None, help="only classify the series of the source (repeatable)")
+    catalog_parser.set_defaults(func=catalog)
+
+    # Load Data Command
+    loaddata_parser = subparsers.add_parser('loaddata', help='Bulk load the shipped fixtures with COPY')
+    loaddata_parser.add_argument('--fixtures', default=None, metavar='PATH', help="directory of the fixtures to load")
+    loaddata_parser.set_defaults(func=loaddata)
+
+    # DB Template Command
+    dbtemplate_parser = subparsers.add_parser('dbtemplate', help='Capture or restore the database from a template database')
+    dbtemplate_parser.add_argument('action', choices=('capture', 'restore', 'list', 'drop'), nargs='?', default='list', help="capture the database as a template, restore it, or list or drop the templates")
+    dbtemplate_parser.add_argument('--key', default=None, help="key of the template (the hash of the fixtures and schema by default)")
+    dbtemplate_parser.set_defaults(func=dbtemplate)
+
+    # Worker Command
+    worker_parser = subparsers.add_parser('worker', help='Run queued background jobs')
+    worker_parser.add_argument('--poll', metavar='SEC', type=float, default=5.0, help="seconds to wait between checks of an empty queue")
+    worker_parser.add_argument('--once', action="store_true", help="exit when the queue is empty")
+    worker_parser.set_defaults(func=worker)
+
+    # Import Time Command
+    importtime_parser = subparsers.add_parser('importtime', help='Report the cold start import time of ELMR')
+    importtime_parser.add_argument('--repeat', type=int, default=3, help="number of runs to take the best time of")
+    importtime_parser.set_defaults(func=importtime)
+
+    # Query Time Command
+    querytime_parser = subparsers.add_parser('querytime', help='Report the CPU time of the ORM and Core read queries')
+    querytime_parser.add_argument('--source', default='CPS', help="source whose series are read, as by the source endpoint")
+    querytime_parser.add_argument('--dataset', metavar='SLUG', default=None, help="LAUS geography dataset whose state series are read")
+    querytime_parser.add_argument('--repeat', type=int, default=3, help="number of runs to take the best time of")
+    querytime_parser.set_defaults(func=querytime)
 
     # CreateDB Command
     createdb_parser = subparsers.add_parser('createdb', help='Create database and migrations')
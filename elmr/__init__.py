@@ -12,8 +12,14 @@
 """
 Simple Flask Web Application to develop the Jobs Report
 
-This file contains Flask-specific details. All that's required is to import
-this module, and run the app.
+This file contains Flask-specific details. Importing this module creates the
+one app, the API and the database objects of the process but does not import
+the models, views or template filters (nor their dependencies) so that the
+admin script and other tools only load what they use. Call `configure` to
+make the app ready to serve requests:
+
+    import elmr
+    app = elmr.configure()
 """
 
 ##########################################################################
@@ -55,14 +61,31 @@ def shutdown_session(exception=None):
     db.session.remove()
 
 ##########################################################################
-## Import Resources
+## App Configuration
 ##########################################################################
 
-# Import views: must be after app config
-import elmr.views
 
-# Import models: must be after db config
-import elmr.models
+def configure(settings=None):
+    """
+    Applies the settings object (or import path to the object) if given to
+    the module's app, registers its models, views and template filters, and
+    returns it. This is not an application factory: every call configures
+    and returns the same app, and the resources are only imported the first
+    time. Settings that modules read when they are imported (e.g. the
+    `CACHE_TIMEOUT` of their caches) keep the values of the configuration at
+    that time, so choose the settings with ELMR_SETTINGS instead to change
+    them for the whole process.
+    """
+    if settings is not None:
+        app.config.from_object(settings)
+
+    # Import models: must be after db config
+    import elmr.models
+
+    # Import views: must be after app config
+    import elmr.views
+
+    # Import template filters: must be after app config
+    import elmr.filters
 
-# Import template filters: must be after app config
-import elmr.filters
+    return app
@@ -0,0 +1,194 @@
+# elmr.arrays
+# Array per series storage of the monthly values of every time series
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 13:05:41 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: arrays.py [] benjamin@bengfort.com $
+
+"""
+Array per series storage of the monthly values of every time series.
+
+The records table stores one row per series and month, which costs a tuple
+header, an id and an index entry for every data point, although the data
+is really a few thousand dense monthly vectors. The `series_arrays` table
+stores each series as a single row holding a `float8[]` of its values and
+the month ordinal of the first value (NULL for missing months), so reading
+a whole series fetches one tuple:
+
+    $ bin/elmr-admin.py arrays backfill
+    $ bin/elmr-admin.py arrays benchmark
+
+Ingestion updates the array of a series in place (if it has been backfilled)
+and reads use the arrays when `USE_SERIES_ARRAYS` is set, falling back to
+the records for any series without an array.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import elmr
+import numpy as np
+
+from sqlalchemy import text
+from elmr.npy import to_array
+from elmr.queries import series_array_row
+from elmr.models import Series, SeriesRecord, SeriesArray
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Builds the array of every series (or some series) from its records. The
+## latest record of a month wins if a month was ingested more than once.
+BACKFILL_SQL = """
+    INSERT INTO series_arrays (series_id, start, data, updated)
+    SELECT b.series_id, b.lo, array_agg(r.value ORDER BY g.month), now()
+      FROM (
+        SELECT series_id, min(month) AS lo, max(month) AS hi
+          FROM records %(where)s
+         GROUP BY series_id
+      ) b
+     CROSS JOIN LATERAL generate_series(b.lo, b.hi) AS g(month)
+      LEFT JOIN (
+        SELECT DISTINCT ON (series_id, month) series_id, month, value
+          FROM records %(where)s
+         ORDER BY series_id, month, id DESC
+      ) r ON r.series_id = b.series_id AND r.month = g.month
+     GROUP BY b.series_id, b.lo
+"""
+
+SIZE_SQL = text("SELECT pg_total_relation_size(CAST(:table AS regclass))")
+
+##########################################################################
+## Backfill
+##########################################################################
+
+
+def backfill(series_ids=None):
+    """
+    Rebuilds the arrays of the series (all series by default) from their
+    records and returns the number of arrays that were written.
+    """
+    session = elmr.db.session
+    params  = {}
+    where   = ""
+
+    if series_ids is not None:
+        series_ids = [int(sid) for sid in series_ids]
+        if not series_ids:
+            return 0
+
+        where  = "WHERE series_id IN :ids"
+        params = {"ids": tuple(series_ids)}
+        SeriesArray.query.filter(
+            SeriesArray.series_id.in_(series_ids)
+        ).delete(synchronize_session=False)
+    else:
+        SeriesArray.query.delete(synchronize_session=False)
+
+    result = session.execute(text(BACKFILL_SQL % {"where": where}), params)
+    session.commit()
+    return result.rowcount
+
+
+def has_arrays():
+    """
+    Returns True if any series has been backfilled into arrays.
+    """
+    query = elmr.db.session.query(SeriesArray.query.exists())
+    return query.scalar()
+
+##########################################################################
+## Reads and Writes
+##########################################################################
+
+
+def series_values(series_id):
+    """
+    Returns the month ordinal of the first value and the float64 array of
+    values (NaN for missing months) of the series, read from its array, or
+    None if the series does not have an array.
+    """
+    row = series_array_row(series_id)
+    if row is None:
+        return None
+
+    return row[0], np.array(row[1], dtype=np.float64)
+
+
+def update_array(series_id, values):
+    """
+    Writes the (month ordinal, value) pairs into the array of the series in
+    place, extending it as necessary. Does nothing if the series has no
+    array (it has not been backfilled). The caller commits the session.
+    """
+    values = np.array(values, dtype=np.float64).reshape(-1, 2)
+    array  = SeriesArray.query.get(series_id)
+    if array is None or not len(values):
+        return None
+
+    months = values[:, 0].astype(np.int64)
+    data   = np.array(array.data, dtype=np.float64)
+    start  = min(array.start, int(months.min()))
+    end    = max(array.start + len(data), int(months.max()) + 1)
+
+    # Shift the existing values into the (possibly) extended array
+    merged = np.full(end - start, np.nan)
+    merged[array.start - start:array.start - start + len(data)] = data
+    merged[months - start] = values[:, 1]
+
+    array.start = start
+    array.data  = [None if np.isnan(v) else float(v) for v in merged]
+    return array
+
+##########################################################################
+## Benchmark
+##########################################################################
+
+
+def relation_size(table):
+    """
+    Returns the total size in bytes of a table including its indices and
+    TOAST storage.
+    """
+    return elmr.db.session.execute(SIZE_SQL, {"table": table}).scalar()
+
+
+def benchmark(series_ids=None, repeat=3):
+    """
+    Compares the storage size and the latency of reading whole series from
+    the records table and from the series arrays. Returns a dictionary with
+    the size in bytes and the best total read time in seconds of each.
+    """
+    if series_ids is None:
+        series_ids = [sid for sid, in Series.query.with_entities(Series.id)]
+
+    def read_records():
+        for sid in series_ids:
+            to_array(SeriesRecord.query.filter_by(series_id=sid).with_entities(
+                SeriesRecord.month, SeriesRecord.value
+            ).order_by(SeriesRecord.month).all())
+
+    def read_arrays():
+        for sid in series_ids:
+            series_values(sid)
+
+    results = {"series": len(series_ids)}
+    for name, table, reader in (("records", "records", read_records),
+                                ("arrays", "series_arrays", read_arrays)):
+        best = None
+        for _ in xrange(repeat):
+            start   = time.time()
+            reader()
+            elapsed = time.time() - start
+            best    = elapsed if best is None else min(best, elapsed)
+
+        results[name] = {"size": relation_size(table), "read": best}
+
+    return results
@@ -0,0 +1,189 @@
+# elmr.breaks
+# Choropleth classification of the geographic datasets
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 11:18:43 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: breaks.py [] benjamin@bengfort.com $
+
+"""
+Choropleth classification of the geographic datasets.
+
+The map colors the states by classifying their values into a number of
+classes. Rather than have the client scan every row for the domain on each
+redraw, the class breaks of a dataset are computed once from the values of
+all of the states at all of the periods, so that every frame of the map is
+colored on the same scale:
+
+    >>> result = dataset_breaks("LAUS", "unemployment-rate", classes=5)
+    >>> result["breaks"]["jenks"]
+    [2.2, 4.1, 5.5, 7.3, 9.9, 14.9]
+
+The breaks of each method are the k + 1 boundaries of the k classes, from
+the minimum to the maximum value. The breaks are cached until the next
+ingestion or series change (see `elmr.signals`).
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+import numpy as np
+
+from elmr.cache import Cache
+from elmr.fips import states_matrix
+from elmr.signals import ingestion_finished, series_changed
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Classification methods in the order of the response
+METHODS      = ("quantile", "equal", "jenks")
+
+## Jenks is quadratic in the number of distinct values, larger datasets are
+## classified on this many evenly spaced quantiles of their values instead
+JENKS_SAMPLE = 1000
+
+##########################################################################
+## Classification
+##########################################################################
+
+
+def quantile_breaks(values, classes):
+    """
+    Returns the breaks that put the same number of values in each class.
+    """
+    return np.percentile(values, np.linspace(0, 100, classes + 1))
+
+
+def equal_breaks(values, classes):
+    """
+    Returns the breaks of classes of equal width between the extremes.
+    """
+    return np.linspace(values.min(), values.max(), classes + 1)
+
+
+def jenks_breaks(values, classes):
+    """
+    Returns the Jenks natural breaks: the breaks that minimize the sum of
+    the squared deviations of the values from the mean of their class. The
+    optimal classes are found by dynamic programming over the sorted
+    distinct values weighted by their counts, so repeated values (e.g. rates
+    to one decimal place) cost nothing.
+    """
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    if len(np.unique(values)) > JENKS_SAMPLE:
+        values = np.percentile(values, np.linspace(0, 100, JENKS_SAMPLE))
+
+    points, weights = np.unique(values, return_counts=True)
+    n = len(points)
+    classes = min(classes, n)
+
+    # Prefix sums of the weights and moments for the deviations of a class
+    W  = np.concatenate(([0.0], np.cumsum(weights)))
+    S1 = np.concatenate(([0.0], np.cumsum(weights * points)))
+    S2 = np.concatenate(([0.0], np.cumsum(weights * points ** 2)))
+
+    # ssd[i, j] is the squared deviation of the class of points i..j
+    i, j = np.triu_indices(n)
+    ssd  = np.empty((n, n))
+    ssd.fill(np.inf)
+    ws   = W[j + 1] - W[i]
+    s1   = S1[j + 1] - S1[i]
+    ssd[i, j] = np.maximum(S2[j + 1] - S2[i] - s1 ** 2 / ws, 0.0)
+
+    # cost[j] is the least deviation of the points 0..j in c classes, and
+    # starts[c][j] is the first point of the last of those classes
+    cost   = ssd[0]
+    starts = [np.zeros(n, dtype=np.int64)]
+    for _ in xrange(1, classes):
+        prev  = np.concatenate(([np.inf], cost[:-1]))
+        total = prev[:, np.newaxis] + ssd
+        start = total.argmin(axis=0)
+        cost  = total[start, np.arange(n)]
+        starts.append(start)
+
+    # Walk back through the starts of the classes of the last point
+    breaks = [points[-1]]
+    last   = n - 1
+    for c in xrange(classes - 1, 0, -1):
+        first = starts[c][last]
+        breaks.append(points[first - 1])
+        last  = first - 1
+    breaks.append(points[0])
+
+    return np.array(breaks[::-1])
+
+
+CLASSIFIERS = {
+    "quantile": quantile_breaks,
+    "equal": equal_breaks,
+    "jenks": jenks_breaks,
+}
+
+##########################################################################
+## Dataset Breaks
+##########################################################################
+
+breaks = Cache(int(elmr.app.config['CACHE_TIMEOUT']))
+ingestion_finished.connect(breaks.clear)
+series_changed.connect(breaks.clear)
+
+
+def period_extents(first, matrix):
+    """
+    Returns the (month index, minimum, maximum) of the values of the states
+    at each period of a states matrix that has any values.
+    """
+    present = ~np.isnan(matrix).all(axis=0)
+    columns = np.where(present)[0]
+    if not len(columns):
+        return []
+
+    lows  = np.nanmin(matrix[:, columns], axis=0)
+    highs = np.nanmax(matrix[:, columns], axis=0)
+    return zip((first + columns).tolist(), lows.tolist(), highs.tolist())
+
+
+def compute_breaks(source, slug, adjusted=True, delta=False, classes=9):
+    """
+    Classifies the values of all of the states at all of the configured
+    periods of the geographic dataset. Returns a dictionary of the domain
+    (the minimum and maximum value), the breaks of each of the METHODS and
+    the extents of each period; the domain and breaks are None if the
+    dataset has no values.
+    """
+    _, first, matrix = states_matrix(source, slug, adjusted=adjusted,
+                                     delta=delta)
+    values = matrix[~np.isnan(matrix)]
+
+    result = {
+        "domain": None,
+        "breaks": dict((method, None) for method in METHODS),
+        "extents": period_extents(first, matrix),
+    }
+
+    if len(values):
+        result["domain"] = [float(values.min()), float(values.max())]
+        for method in METHODS:
+            result["breaks"][method] = [
+                float(b) for b in CLASSIFIERS[method](values, classes)
+            ]
+
+    return result
+
+
+def dataset_breaks(source, slug, adjusted=True, delta=False, classes=9):
+    """
+    Returns the cached breaks of the geographic dataset (see compute_breaks),
+    computing them on the first request after an ingestion.
+    """
+    key = (source, slug, adjusted, delta, classes)
+    return breaks.get(
+        key, lambda: compute_breaks(source, slug, adjusted, delta, classes)
+    )
@@ -0,0 +1,95 @@
+# elmr.cache
+# Simple in-process caching of values computed from the database
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 13:35:50 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: cache.py [] benjamin@bengfort.com $
+
+"""
+Simple in-process caching of values computed from the database.
+
+The ELMR data only changes when it is ingested (monthly) or when an admin
+modifies a series, so expensive aggregates such as counts can be computed
+once and reused. Caches are cleared by the signals in `elmr.signals` in the
+process that modified the data; other processes (e.g. the web workers when
+the ingestion is run from the command line) pick up changes when entries
+expire after `timeout` seconds.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+
+from threading import Lock
+from collections import OrderedDict
+
+##########################################################################
+## Cache
+##########################################################################
+
+
+class Cache(object):
+    """
+    A dictionary of computed values that expire after `timeout` seconds, or
+    never if the timeout is None. Values are computed on demand by the
+    loader function passed to `get`. If maxsize is given, the oldest values
+    are evicted so that at most maxsize values are kept.
+    """
+
+    def __init__(self, timeout=None, maxsize=None):
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._store  = OrderedDict()
+        self._lock   = Lock()
+
+    def get(self, key, loader):
+        """
+        Returns the cached value for the key, calling loader() to compute
+        and store the value if it is missing or has expired.
+        """
+        entry = self._store.get(key)
+        if entry is not None:
+            value, expires = entry
+            if expires is None or expires > time.time():
+                return value
+
+        value   = loader()
+        expires = None
+        if self.timeout is not None:
+            expires = time.time() + self.timeout
+
+        with self._lock:
+            self._store.pop(key, None)
+            self._store[key] = (value, expires)
+            if self.maxsize is not None:
+                while len(self._store) > self.maxsize:
+                    self._store.popitem(last=False)
+
+        return value
+
+    def discard(self, key):
+        """
+        Removes the value for the key from the cache, if there is one.
+        """
+        with self._lock:
+            self._store.pop(key, None)
+
+    def clear(self, *args, **kwargs):
+        """
+        Removes all values from the cache. Accepts and ignores any arguments
+        so that it can be connected directly to a signal.
+        """
+        with self._lock:
+            self._store.clear()
+
+    def __contains__(self, key):
+        return key in self._store
+
+    def __len__(self):
+        return len(self._store)
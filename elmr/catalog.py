@@ -0,0 +1,246 @@
+# elmr.catalog
+# In-process catalog of the series and state metadata
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 09:12:06 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: catalog.py [] benjamin@bengfort.com $
+
+"""
+In-process catalog of the series and state metadata.
+
+Nearly every request resolves metadata before it reads any data: the series
+of a blsid, the series of a source ordered by title, the series of a state
+for a dataset. The metadata is small (a few thousand series, 51 states) and
+only changes on ingestion or when an admin edits a series, so the whole of
+it is loaded into an immutable, versioned snapshot indexed by blsid, id,
+source, state and slug:
+
+    >>> catalog = get_catalog()
+    >>> catalog.series(u"LNS14000000").title
+    u'Unemployment Rate'
+
+The snapshot is rebuilt on the next lookup after the signals in
+`elmr.signals` are sent; other processes pick up changes when it expires
+after `CACHE_TIMEOUT` seconds. Entries are read-only named tuples with the
+same attributes as the models, writes must still go through the models.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import elmr
+
+from itertools import count
+from operator import attrgetter
+from collections import namedtuple, defaultdict
+
+from elmr.cache import Cache
+from elmr.models import Series, USAState, StateSeries
+from elmr.signals import ingestion_finished, series_changed
+
+##########################################################################
+## Catalog Entries
+##########################################################################
+
+SeriesEntry = namedtuple("SeriesEntry", (
+    "id", "blsid", "title", "source", "is_primary", "is_delta",
+    "is_adjusted", "delta_id",
+))
+
+StateEntry  = namedtuple("StateEntry", (
+    "id", "fips", "name", "abbr", "region",
+))
+
+StateSeriesEntry = namedtuple("StateSeriesEntry", (
+    "id", "state_id", "series_id", "adjusted", "dataset", "source",
+    "category", "slug",
+))
+
+##########################################################################
+## Catalog
+##########################################################################
+
+
+class Catalog(object):
+    """
+    An immutable snapshot of the series, states and state series, indexed
+    for the lookups of the API. The version increases every time the
+    catalog is loaded, so anything derived from a catalog can tell if it
+    is stale by comparing versions.
+    """
+
+    def __init__(self, series, states, state_series, version=0):
+        self.version  = version
+        self.loaded   = time.time()
+
+        # Series by id, by blsid, and in id order per source
+        self.by_id    = dict((s.id, s) for s in series)
+        self.by_blsid = dict((s.blsid, s) for s in series)
+        self.ordered  = tuple(sorted(series, key=attrgetter('id')))
+
+        self.by_source = defaultdict(list)
+        for s in self.ordered:
+            self.by_source[s.source].append(s)
+
+        # States in name order and by id and FIPS code
+        self.states   = tuple(sorted(states, key=attrgetter('name')))
+        self.by_state = dict((s.id, s) for s in self.states)
+        self.by_fips  = dict((s.fips, s) for s in self.states)
+
+        # State series by series, and by (state, source, slug) preferring
+        # the lowest id
+        self.by_series    = dict((ss.series_id, ss) for ss in state_series)
+        self.state_series = defaultdict(list)
+        for ss in sorted(state_series, key=attrgetter('id')):
+            self.state_series[(ss.state_id, ss.source, ss.slug)].append(ss)
+
+        self.geo_fields = defaultdict(set)
+        for ss in state_series:
+            self.geo_fields[ss.source].update((
+                ("dataset", ss.dataset), ("category", ss.category),
+            ))
+
+    def series(self, blsid):
+        """
+        Returns the series with the blsid or None.
+        """
+        return self.by_blsid.get(blsid)
+
+    def get(self, series_id):
+        """
+        Returns the series with the id or None.
+        """
+        return self.by_id.get(series_id)
+
+    def delta(self, series):
+        """
+        Returns the delta series of a series or None if it has none.
+        """
+        if series.delta_id is None:
+            return None
+        return self.by_id.get(series.delta_id)
+
+    def source(self, source=None, order='id'):
+        """
+        Returns the list of series of a source (or every series if source is
+        None) ordered by the attribute, e.g. id, blsid or title.
+        """
+        if source is None:
+            series = self.ordered
+        else:
+            series = self.by_source.get(source, [])
+
+        if order == 'id':
+            return list(series)
+        return sorted(series, key=attrgetter(order))
+
+    def sources(self):
+        """
+        Returns a list of (source, number of series) for every source.
+        """
+        return sorted(
+            (source, len(series)) for source, series in self.by_source.items()
+        )
+
+    def state(self, fips):
+        """
+        Returns the state with the FIPS code or None.
+        """
+        return self.by_fips.get(fips)
+
+    def state_series_entry(self, state_id, source, slug, adjusted=None):
+        """
+        Returns the state series of the state for the source and slug,
+        preferring the seasonally adjusted (or not) one if adjusted is not
+        None, or None if there is none.
+        """
+        matches = self.state_series.get((state_id, source, slug), [])
+        if adjusted is not None:
+            for ss in matches:
+                if ss.adjusted == adjusted:
+                    return ss
+        return matches[0] if matches else None
+
+    def classification(self, series_id):
+        """
+        Returns the state series of the series (its state, seasonality,
+        dataset, category and slug) or None if it is not a state series.
+        """
+        return self.by_series.get(series_id)
+
+    def geo_series(self, source=None):
+        """
+        Returns the state series of the source (or of every source if None)
+        in id order.
+        """
+        return sorted((
+            ss for ss in self.by_series.values()
+            if source is None or ss.source == source
+        ), key=attrgetter('id'))
+
+    def geo_sources(self):
+        """
+        Returns the sorted sources that have state series.
+        """
+        return sorted(self.geo_fields.keys())
+
+    def datasets(self, source, field):
+        """
+        Returns the sorted distinct values of the field (dataset or
+        category) of the state series of the source.
+        """
+        return sorted(
+            value for name, value in self.geo_fields.get(source, ())
+            if name == field and value is not None
+        )
+
+    def __len__(self):
+        return len(self.by_id)
+
+##########################################################################
+## Loading
+##########################################################################
+
+## Increases every time a catalog is loaded
+versions = count(1)
+
+
+def fetch(model, entry):
+    """
+    Returns the entries of every row of the model, selecting only the
+    columns of the entry rather than loading model instances.
+    """
+    columns = [getattr(model, field) for field in entry._fields]
+    query   = elmr.db.session.query(*columns)
+    return [entry(*row) for row in query]
+
+
+def load_catalog():
+    """
+    Loads a new catalog from the database.
+    """
+    return Catalog(
+        fetch(Series, SeriesEntry),
+        fetch(USAState, StateEntry),
+        fetch(StateSeries, StateSeriesEntry),
+        next(versions),
+    )
+
+
+# The current catalog, cleared whenever the metadata changes
+catalogs = Cache(int(elmr.app.config['CACHE_TIMEOUT']))
+ingestion_finished.connect(catalogs.clear)
+series_changed.connect(catalogs.clear)
+
+
+def get_catalog():
+    """
+    Returns the current catalog, loading it if it is missing or expired.
+    """
+    return catalogs.get("catalog", load_catalog)
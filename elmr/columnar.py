@@ -0,0 +1,123 @@
+# elmr.columnar
+# Compact columnar representations of monthly time series
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 09:12:44 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: columnar.py [] benjamin@bengfort.com $
+
+"""
+Compact columnar representations of monthly time series.
+
+Rather than serializing a `{"period": "Jan 2000", "value": 1.0}` object for
+every data point, a monthly series is fully described by its first period,
+its frequency, and a flat array of values (with explicit nulls for gaps).
+The period labels can be reconstructed on the client from the start and the
+position of the value in the array.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from elmr.ordinal import ordinal as month_index
+from elmr.ordinal import iso_label as month_label
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+FORMATS   = ("records", "columnar", "npy")  # Formats accepted by the API
+FREQUENCY = "monthly"                         # The only frequency in ELMR
+
+##########################################################################
+## Helper Functions
+##########################################################################
+
+
+def align(records):
+    """
+    Expects an iterable of (period, value) tuples ordered by period and
+    returns the month index of the first period along with a flat list of
+    values. Missing months are filled in with None.
+    """
+    start  = None
+    values = []
+
+    for period, value in records:
+        idx = month_index(period)
+        if start is None:
+            start = idx
+
+        # Fill any gaps in the series with explicit nulls
+        gap = idx - start - len(values)
+        if gap > 0:
+            values.extend([None] * gap)
+
+        values.append(value)
+
+    return start, values
+
+
+def columnar(records):
+    """
+    Expects an iterable of (period, value) tuples ordered by period and
+    returns a columnar dictionary with the start and end periods, the
+    frequency and a flat list of values (with None for gaps).
+    """
+    start, values = align(records)
+
+    if start is None:
+        return {
+            "start": None, "end": None, "frequency": FREQUENCY, "values": [],
+        }
+
+    return {
+        "start": month_label(start),
+        "end": month_label(start + len(values) - 1),
+        "frequency": FREQUENCY,
+        "values": values,
+    }
+
+
+def columnar_frame(series):
+    """
+    Expects a dictionary mapping keys to iterables of (period, value) tuples
+    ordered by period and returns a single columnar dictionary whose values
+    are aligned to a common start period, so that the same position in each
+    array refers to the same month.
+    """
+    aligned = dict((key, align(records)) for key, records in series.items())
+    starts  = [s for s, _ in aligned.values() if s is not None]
+
+    if not starts:
+        return {
+            "start": None,
+            "end": None,
+            "frequency": FREQUENCY,
+            "values": dict((key, []) for key in aligned),
+        }
+
+    start  = min(starts)
+    values = {}
+
+    for key, (first, vals) in aligned.items():
+        if first is None:
+            values[key] = []
+        else:
+            values[key] = [None] * (first - start) + vals
+
+    # Pad all of the arrays to the same length
+    length = max(len(vals) for vals in values.values())
+    for vals in values.values():
+        vals.extend([None] * (length - len(vals)))
+
+    return {
+        "start": month_label(start),
+        "end": month_label(start + length - 1),
+        "frequency": FREQUENCY,
+        "values": values,
+    }
@@ -19,7 +19,7 @@ The ELMR configuration file.
 
 import os
 
-from elmr.utils import classproperty
+from elmr.utils import classproperty, parse_bool
 from elmr.exceptions import ImproperlyConfigured
 
 ##########################################################################
@@ -31,6 +31,8 @@ ENVIRON_PREFIX = "ELMR"
 BASE_PATH      = os.path.join(os.path.dirname(__file__), "..")
 FIXTURES       = os.path.join(BASE_PATH, "fixtures")
 MIGRATIONS     = os.path.join(os.path.dirname(__file__), "migrations")
+SNAPSHOTS      = os.path.join(BASE_PATH, "snapshots")
+STORE          = os.path.join(BASE_PATH, "store")
 
 
 def settings(name, default=None, required=False, prefix=ENVIRON_PREFIX):
@@ -105,6 +107,32 @@ class Config(object):
     ENDYEAR      = settings("endyear", "2015")
     FIXTURES     = settings("fixtures", FIXTURES)
 
+    ## Ingestion Schedule Settings
+    RELEASE_CALENDAR = settings("release_calendar", os.path.join(FIXTURES, "calendar.json"))
+    SCHEDULE_RETRY   = settings("schedule_retry", "3600")
+
+    ## Background Job Settings
+    JOB_TIMEOUT  = settings("job_timeout", "14400")
+
+    ## Cache Settings
+    CACHE_TIMEOUT = settings("cache_timeout", "3600")
+
+    ## Static Snapshot Settings
+    SNAPSHOT_ROOT     = settings("snapshot_root", SNAPSHOTS)
+    SNAPSHOT_BASE_URL = settings("snapshot_base_url", "http://localhost:5000/")
+    SERVE_SNAPSHOT    = parse_bool(settings("serve_snapshot", False))
+
+    ## Time Series Store Settings
+    STORE_ROOT = settings("store_root", STORE)
+    USE_STORE  = parse_bool(settings("use_store", True))
+
+    ## Series Array Settings
+    USE_SERIES_ARRAYS = parse_bool(settings("use_series_arrays", False))
+
+    ## JSON Response Settings
+    JSON_ENCODER = settings("json_encoder", "auto")
+    PRETTY_JSON  = parse_bool(settings("pretty_json", False))
+
     @classproperty
     def SQLALCHEMY_DATABASE_URI(klass):
         """
@@ -139,6 +167,7 @@ class DevelopmentConfig(Config):
     """
 
     DEBUG        = True
+    PRETTY_JSON  = parse_bool(settings("pretty_json", True))
 
 
 class TestingConfig(DevelopmentConfig):
@@ -152,3 +181,6 @@ class TestingConfig(DevelopmentConfig):
 
     STARTYEAR    = settings("startyear", "2006")
     ENDYEAR      = settings("endyear", "2007")
+
+    USE_STORE    = False          # the store is enabled by its own tests
+    PRETTY_JSON  = False          # test the production representation
@@ -0,0 +1,141 @@
+# elmr.dbstats
+# Cheap database statistics from the PostgreSQL catalog
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 15:04:18 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: dbstats.py [] benjamin@bengfort.com $
+
+"""
+Cheap database statistics from the PostgreSQL catalog.
+
+A `COUNT(*)` on the records table is a sequential scan over the largest
+table in the database, so the admin dashboard reads the row counters that
+PostgreSQL maintains in `pg_stat_user_tables` (falling back to the planner
+estimate in `pg_class`) instead. Exact counts are only computed on request.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+
+from sqlalchemy import text
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## The tables reported on the admin dashboard
+TABLES = ("series", "records", "series_arrays", "ingestions", "states_series")
+
+## Partitioned tables (e.g. records since migration 014) have no storage or
+## statistics of their own, so each table is reported as the sum of itself
+## and all of its partitions.
+TABLE_STATS_SQL = text("""
+    WITH RECURSIVE tree (root, relid) AS (
+        SELECT c.oid, c.oid
+        FROM pg_class c
+        WHERE c.relkind IN ('r', 'p')
+          AND c.relname IN :tables
+          AND pg_table_is_visible(c.oid)
+      UNION ALL
+        SELECT tree.root, i.inhrelid
+        FROM tree JOIN pg_inherits i ON i.inhparent = tree.relid
+    )
+    SELECT r.relname,
+           SUM(COALESCE(s.n_live_tup, 0))::bigint AS live_rows,
+           SUM(GREATEST(c.reltuples, 0))::bigint AS estimated_rows,
+           SUM(pg_relation_size(c.oid))::bigint AS table_size,
+           SUM(pg_indexes_size(c.oid))::bigint AS index_size,
+           SUM(pg_total_relation_size(c.oid))::bigint AS total_size,
+           SUM(COALESCE(io.heap_blks_hit, 0))::bigint AS heap_hit,
+           SUM(COALESCE(io.heap_blks_read, 0))::bigint AS heap_read,
+           SUM(COALESCE(io.idx_blks_hit, 0))::bigint AS idx_hit,
+           SUM(COALESCE(io.idx_blks_read, 0))::bigint AS idx_read,
+           SUM(COALESCE(s.seq_scan, 0))::bigint AS seq_scan,
+           SUM(COALESCE(s.idx_scan, 0))::bigint AS idx_scan
+    FROM tree
+    JOIN pg_class r ON r.oid = tree.root
+    JOIN pg_class c ON c.oid = tree.relid
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    LEFT JOIN pg_statio_user_tables io ON io.relid = c.oid
+    GROUP BY r.relname
+""")
+
+DATABASE_STATS_SQL = text("""
+    SELECT blks_hit, blks_read, pg_database_size(datname) AS size
+    FROM pg_stat_database
+    WHERE datname = current_database()
+""")
+
+##########################################################################
+## Statistics Functions
+##########################################################################
+
+
+def hit_ratio(hit, read):
+    """
+    Returns the fraction of block requests served from the buffer cache, or
+    None if there were no block requests at all.
+    """
+    total = hit + read
+    if not total:
+        return None
+    return float(hit) / float(total)
+
+
+def table_statistics(tables=TABLES, exact=False):
+    """
+    Returns a dictionary of statistics for each table keyed by table name,
+    summed over the partitions of partitioned tables. Row counts come from
+    the statistics collector unless `exact` is True, in which case a
+    `COUNT(*)` is run against every table.
+    """
+    session = elmr.db.session
+    stats   = {}
+
+    result  = session.execute(TABLE_STATS_SQL, {"tables": tuple(tables)})
+    for row in result:
+        rows = row.live_rows
+        if not rows and row.estimated_rows > 0:
+            rows = row.estimated_rows
+
+        stats[row.relname] = {
+            "name": row.relname,
+            "rows": rows,
+            "exact": False,
+            "table_size": row.table_size,
+            "index_size": row.index_size,
+            "total_size": row.total_size,
+            "heap_hit_ratio": hit_ratio(row.heap_hit, row.heap_read),
+            "index_hit_ratio": hit_ratio(row.idx_hit, row.idx_read),
+            "seq_scans": row.seq_scan,
+            "index_scans": row.idx_scan,
+        }
+
+    if exact:
+        for table in stats:
+            sql = "SELECT count(*) FROM %s" % table
+            stats[table]["rows"]  = session.execute(sql).scalar()
+            stats[table]["exact"] = True
+
+    return stats
+
+
+def database_statistics():
+    """
+    Returns the size and the buffer cache hit ratio of the current database.
+    """
+    row = elmr.db.session.execute(DATABASE_STATS_SQL).first()
+    if row is None:
+        return {"size": None, "hit_ratio": None}
+
+    return {
+        "size": row.size,
+        "hit_ratio": hit_ratio(row.blks_hit, row.blks_read),
+    }
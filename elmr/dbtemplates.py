@@ -0,0 +1,241 @@
+# elmr.dbtemplates
+# Capture and restore of populated databases as template databases
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 23 14:02:19 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: dbtemplates.py [] benjamin@bengfort.com $
+
+"""
+Capture and restore of populated databases as template databases.
+
+Seeding a database from the fixtures (`loaddata`, or the CSV fixtures of the
+tests) takes far longer than copying one: PostgreSQL creates a database from
+a template by copying its files, so a populated database is captured once as
+a template and restored from it whenever a fresh copy is needed:
+
+    $ bin/elmr-admin.py loaddata
+    $ bin/elmr-admin.py dbtemplate capture
+    $ bin/elmr-admin.py dbtemplate restore
+
+Templates are named for the database and a key, by default the hash of the
+fixtures and of the schema of the models (see `fixture_key`), so that a
+template is never restored for different data or tables. Restoring drops
+the database, so both capture and restore disconnect every other session
+of the database first (and force them off on PostgreSQL 13 or later); the
+role needs the CREATEDB privilege.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import glob
+import time
+import hashlib
+import elmr
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable, CreateIndex
+from elmr.signals import series_changed
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Templates are named <database>_tpl_<key> (at most 63 characters)
+TEMPLATE_FMT   = "%s_tpl_%s"
+KEY_LENGTH     = 16
+
+## The database to connect to in order to create and drop the others
+MAINTENANCE_DB = "postgres"
+
+## The shipped fixtures that key the templates of loaddata
+FIXTURE_GLOB   = "*.gz"
+
+## The first server version (13) with DROP DATABASE ... WITH (FORCE)
+FORCE_VERSION  = 130000
+
+DISCONNECT_SQL = """
+    SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+    WHERE datname = :name AND pid <> pg_backend_pid()
+"""
+
+##########################################################################
+## Keys and Names
+##########################################################################
+
+
+def schema_ddl():
+    """
+    Returns the CREATE statements of the tables and indexes of the models,
+    ordered by name (the order of the sorted tables varies between runs).
+    """
+    import elmr.models
+
+    dialect    = postgresql.dialect()
+    statements = []
+    tables     = elmr.db.metadata.tables
+    for table in sorted(tables.values(), key=lambda table: table.name):
+        statements.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            statements.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return "\n".join(statements)
+
+
+def fixture_key(paths=None, *extra):
+    """
+    Returns the hash of the contents of the fixture paths (by default the
+    shipped fixtures), of the schema of the models and of any extra strings,
+    e.g. which of the fixtures were loaded.
+    """
+    if paths is None:
+        root  = elmr.app.config['FIXTURES']
+        paths = sorted(glob.glob(os.path.join(root, FIXTURE_GLOB)))
+
+    digest = hashlib.sha1(schema_ddl())
+    for path in paths:
+        digest.update(os.path.basename(path))
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), ""):
+                digest.update(chunk)
+
+    for value in extra:
+        digest.update(str(value))
+
+    return digest.hexdigest()[:KEY_LENGTH]
+
+
+def database_name(uri=None):
+    """
+    Returns the name of the database of the URI (the DATABASE_URI setting).
+    """
+    return make_url(uri or elmr.app.config['DATABASE_URI']).database
+
+
+def template_name(key, database=None):
+    """
+    Returns the name of the template of the database with the key.
+    """
+    return TEMPLATE_FMT % (database or database_name(), key)
+
+##########################################################################
+## Template Databases
+##########################################################################
+
+
+def maintenance_engine(uri=None):
+    """
+    Returns an engine to the maintenance database of the server of the URI
+    that runs every statement outside of a transaction, as CREATE DATABASE
+    and DROP DATABASE require.
+    """
+    url = make_url(uri or elmr.app.config['DATABASE_URI'])
+    url.database = MAINTENANCE_DB
+    return create_engine(url, poolclass=NullPool, isolation_level="AUTOCOMMIT")
+
+
+def disconnect(engine, name):
+    """
+    Closes the connections of the app to the database and terminates any
+    other sessions connected to it.
+    """
+    elmr.db.session.remove()
+    elmr.db.engine.dispose()
+    engine.execute(text(DISCONNECT_SQL), name=name)
+
+
+def drop_database(engine, name):
+    """
+    Drops the database if it exists, forcing any remaining sessions off it
+    where the server supports that (see FORCE_VERSION).
+    """
+    sql     = 'DROP DATABASE IF EXISTS "%s"' % name
+    version = engine.execute("SHOW server_version_num").scalar()
+    if int(version) >= FORCE_VERSION:
+        sql += " WITH (FORCE)"
+    engine.execute(sql)
+
+
+def templates(database=None):
+    """
+    Returns the (name, size in bytes) of the templates of the database.
+    """
+    engine  = maintenance_engine()
+    pattern = template_name("", database).replace("_", r"\_") + "%"
+    return [tuple(row) for row in engine.execute(text(
+        "SELECT datname, pg_database_size(datname) FROM pg_database "
+        "WHERE datname LIKE :pattern ORDER BY datname"
+    ), pattern=pattern)]
+
+
+def has_template(key, database=None):
+    """
+    Returns True if a template of the database with the key exists.
+    """
+    engine = maintenance_engine()
+    return engine.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_database WHERE datname = :name)"
+    ), name=template_name(key, database)).scalar()
+
+
+def capture(key=None, database=None):
+    """
+    Captures the database (the DATABASE_URI setting by default) as its
+    template with the key (the hash of the shipped fixtures by default),
+    replacing any template with the key. Returns the name of the template
+    and the seconds it took.
+    """
+    start    = time.time()
+    database = database or database_name()
+    name     = template_name(key or fixture_key(), database)
+    engine   = maintenance_engine()
+
+    disconnect(engine, database)
+    drop_database(engine, name)
+    engine.execute('CREATE DATABASE "%s" TEMPLATE "%s"' % (name, database))
+
+    return name, time.time() - start
+
+
+def restore(key=None, database=None):
+    """
+    Replaces the database (the DATABASE_URI setting by default) with a copy
+    of its template with the key (the hash of the shipped fixtures by
+    default). Raises a LookupError if there is no such template. Returns
+    the name of the template and the seconds it took.
+    """
+    start    = time.time()
+    database = database or database_name()
+    key      = key or fixture_key()
+    name     = template_name(key, database)
+
+    if not has_template(key, database):
+        raise LookupError("No template %s, capture it first" % name)
+
+    engine   = maintenance_engine()
+    disconnect(engine, database)
+    drop_database(engine, database)
+    engine.execute('CREATE DATABASE "%s" TEMPLATE "%s"' % (database, name))
+
+    # Everything cached from the previous database is stale
+    series_changed.send(None)
+    return name, time.time() - start
+
+
+def drop(key, database=None):
+    """
+    Drops the template of the database with the key, returning its name.
+    """
+    name   = template_name(key, database)
+    engine = maintenance_engine()
+    engine.execute(text(DISCONNECT_SQL), name=name)
+    drop_database(engine, name)
+    return name
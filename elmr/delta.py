@@ -21,6 +21,8 @@ creates more data in the database, but makes faster computation.
 
 from elmr import db
 from elmr.models import Series, SeriesRecord
+from elmr.signals import series_changed
+from elmr.arrays import has_arrays, backfill
 
 ##########################################################################
 ## Functions
@@ -106,18 +108,26 @@ def compute_delta(series, delete=True):
         db.session.flush()
 
         last_value = None
-        for record in series.records.order_by('period'):
+        for record in series.records.order_by('month'):
             if last_value is None:
                 last_value = record.value
                 continue
 
             delta_record = SeriesRecord(**{
                 "series": delta,
+                "source": delta.source,
                 "period": record.period,
+                "month": record.month,
                 "value": ((record.value - last_value) / record.value) * 100,
                 "footnote": None,
             })
             db.session.add(delta_record)
 
     db.session.commit()
+
+    # Rebuild the array of the delta series if arrays are in use
+    if has_arrays():
+        backfill([delta.id])
+
+    series_changed.send(delta)
     return delta
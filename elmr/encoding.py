@@ -0,0 +1,302 @@
+# elmr.encoding
+# Fast JSON representation of the API responses
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 14:10:52 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: encoding.py [] benjamin@bengfort.com $
+
+"""
+Fast JSON representation of the API responses.
+
+Flask-RESTful encodes every response with the standard library `json`
+module, pretty printed in debug mode, although the series responses are
+lists of thousands of small {"period": ..., "value": ...} objects. This
+module replaces its JSON representation:
+
+* Responses are encoded compactly with the fastest encoder installed
+  (`ujson`, then `simplejson`, then `json`), or with the `JSON_ENCODER`
+  setting. They are only pretty printed if `PRETTY_JSON` is set.
+
+* The data of a series is left as an `EncodedArray` of (first month,
+  values) by the views. Its periods are encoded from a precomputed table of
+  the quoted label of every month and its values from a table of the
+  distinct values of the array, and it is streamed to the client in chunks
+  rather than joined into one string with the rest of the response.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import re
+import json
+import uuid
+import importlib
+import numpy as np
+
+from functools import partial
+from flask import Response, current_app, make_response
+from elmr.ordinal import DISPLAY_LABELS, FIRST_ORDINAL, LAST_ORDINAL, label
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Encoders in order of preference when the JSON_ENCODER setting is auto
+ENCODERS  = ("ujson", "simplejson", "json")
+
+## Number of array items encoded into each chunk of a streamed response
+CHUNKSIZE = 1024
+
+## The quoted JSON string of the display label of every month
+JSON_LABELS = np.array(['"%s"' % text for text in DISPLAY_LABELS],
+                       dtype=object)
+
+## Placeholders for the encoded arrays in the rest of the response
+NONCE     = uuid.uuid4().hex
+TOKEN     = "__elmr_array_%s_%%i__" % NONCE
+TOKENRE   = re.compile(r'"__elmr_array_%s_(\d+)__"' % NONCE)
+
+##########################################################################
+## Encoders
+##########################################################################
+
+encoders = {}
+
+
+def get_encoder(name="auto"):
+    """
+    Returns the name and compact dumps function of the JSON encoder, the
+    first of ENCODERS that can be imported if name is auto. Raises an
+    ImportError if a specific encoder is requested but not installed.
+    """
+    if name in encoders:
+        return encoders[name]
+
+    for module in (ENCODERS if name == "auto" else (name,)):
+        try:
+            encoder = importlib.import_module(module)
+        except ImportError:
+            if name != "auto":
+                raise
+            continue
+
+        if module == "ujson":
+            dumps = encoder.dumps
+        else:
+            dumps = partial(encoder.dumps, separators=(',', ':'))
+
+        encoders[name] = (module, dumps)
+        return encoders[name]
+
+
+def json_labels(ordinals):
+    """
+    Returns an object array of the quoted JSON labels of the ordinals.
+    """
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    if len(ordinals) and FIRST_ORDINAL <= ordinals.min() \
+            and ordinals.max() <= LAST_ORDINAL:
+        return JSON_LABELS[ordinals - FIRST_ORDINAL]
+
+    return np.array(['"%s"' % label(int(idx)) for idx in ordinals],
+                    dtype=object)
+
+
+def json_floats(values):
+    """
+    Returns an object array of the JSON numbers of the values, encoding
+    each distinct value only once (NaN is encoded as null).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if not values.size:
+        return np.array([], dtype=object).reshape(values.shape)
+
+    table, inverse = np.unique(values, return_inverse=True)
+    table = np.array([
+        "null" if np.isnan(value) else repr(float(value)) for value in table
+    ], dtype=object)
+
+    return table[inverse].reshape(values.shape)
+
+##########################################################################
+## Encoded Arrays
+##########################################################################
+
+
+class EncodedArray(object):
+    """
+    The months with values of a series array, as a JSON array that is
+    encoded from precomputed tables and streamed. Each item is the label
+    and the value of a month between OPEN, SEPARATOR and CLOSE, which
+    subclasses set to change the encoding (a [label, value] pair here).
+    """
+
+    OPEN      = '['
+    SEPARATOR = ','
+    CLOSE     = ']'
+
+    def __init__(self, first, values):
+        self.first   = first
+        self.values  = values
+        self.offsets = np.flatnonzero(~np.isnan(values))
+
+    def items(self, offsets):
+        """
+        Returns an object array of the JSON encoded items of the offsets.
+        """
+        labels = json_labels(self.first + offsets)
+        values = json_floats(self.values[offsets])
+        return self.OPEN + labels + self.SEPARATOR + values + self.CLOSE
+
+    def tolist(self):
+        """
+        Returns the items as Python objects, e.g. for pretty printing.
+        """
+        return json.loads("".join(self.iterencode()))
+
+    def iterencode(self):
+        """
+        Generates the JSON array, encoding CHUNKSIZE items at a time.
+        """
+        yield "["
+        for idx in xrange(0, len(self.offsets), CHUNKSIZE):
+            items = self.items(self.offsets[idx:idx + CHUNKSIZE])
+            chunk = ",".join(items)
+            yield chunk if idx == 0 else "," + chunk
+        yield "]"
+
+    def __len__(self):
+        return len(self.offsets)
+
+
+class RecordsArray(EncodedArray):
+    """
+    Encodes a series as [{"period": "Jan 2006", "value": 4.7}, ...].
+    """
+
+    OPEN      = '{"period":'
+    SEPARATOR = ',"value":'
+    CLOSE     = '}'
+
+
+class PairsArray(EncodedArray):
+    """
+    Encodes a series as [["Jan 2006", 4.7], ...].
+    """
+
+    OPEN      = '['
+    SEPARATOR = ','
+    CLOSE     = ']'
+
+
+class RowsArray(EncodedArray):
+    """
+    Encodes a matrix of aligned series (one column per series) as one
+    object per month that has any values, mapping the column names to the
+    values along with the YEAR, MONTH and DATE of the month.
+    """
+
+    def __init__(self, first, columns, matrix):
+        self.first   = first
+        self.columns = columns
+        self.matrix  = matrix
+        self.present = ~np.isnan(matrix)
+        self.offsets = np.flatnonzero(self.present.any(axis=1))
+
+    def items(self, offsets):
+        ordinals = self.first + offsets
+        labels   = json_labels(ordinals)
+        values   = json_floats(self.matrix[offsets])
+        present  = self.present[offsets]
+        keys     = np.array([json.dumps(col) + ":" for col in self.columns],
+                            dtype=object)
+
+        items = []
+        for row, idx in enumerate(ordinals):
+            fields = (keys[present[row]] + values[row][present[row]]).tolist()
+            fields.append('"YEAR":%i,"MONTH":%i,"DATE":%s' % (
+                idx // 12, idx % 12 + 1, labels[row]
+            ))
+            items.append("{" + ",".join(fields) + "}")
+
+        return items
+
+##########################################################################
+## Representation
+##########################################################################
+
+
+def substitute(data, arrays):
+    """
+    Returns a copy of the data with every encoded array replaced by a
+    placeholder string, appending the arrays to the list.
+    """
+    if isinstance(data, EncodedArray):
+        arrays.append(data)
+        return TOKEN % (len(arrays) - 1)
+
+    if isinstance(data, dict):
+        return dict((key, substitute(val, arrays)) for key, val in data.items())
+
+    if isinstance(data, (list, tuple)):
+        # Lists of scalars (e.g. columnar values) cannot contain arrays
+        if data and not isinstance(data[0], (dict, list, tuple, EncodedArray)):
+            return data
+        return [substitute(val, arrays) for val in data]
+
+    return data
+
+
+def iterencode(encoded, arrays):
+    """
+    Generates the JSON encoding of a response from the encoding of the rest
+    of the response and its encoded arrays, streaming each array in place
+    of its placeholder.
+    """
+    position = 0
+    for match in TOKENRE.finditer(encoded):
+        yield encoded[position:match.start()]
+        for chunk in arrays[int(match.group(1))].iterencode():
+            yield chunk
+        position = match.end()
+
+    yield encoded[position:]
+
+
+def pretty_default(obj):
+    """
+    Encodes the objects the json module cannot when pretty printing.
+    """
+    if isinstance(obj, EncodedArray):
+        return obj.tolist()
+    raise TypeError("%r is not JSON serializable" % obj)
+
+
+def output_json(data, code, headers=None):
+    """
+    Makes a Flask response with the JSON encoded data, streaming the body if
+    it has encoded arrays. Registered as the Flask-RESTful representation of
+    application/json by the views.
+    """
+    if current_app.config.get('PRETTY_JSON'):
+        dumped = json.dumps(data, indent=4, sort_keys=True,
+                            default=pretty_default) + "\n"
+        resp   = make_response(dumped, code)
+    else:
+        _, dumps = get_encoder(current_app.config.get('JSON_ENCODER', 'auto'))
+        arrays   = []
+        encoded  = dumps(substitute(data, arrays))
+
+        if not arrays:
+            resp = make_response(encoded, code)
+        else:
+            resp = Response(iterencode(encoded, arrays), status=code,
+                            mimetype="application/json")
+
+    resp.headers.extend(headers or {})
+    return resp
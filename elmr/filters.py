@@ -45,3 +45,23 @@ def naturaldelta_filter(number, months=True):
     readable fuzzy time representation, e.g. "three seconds".
     """
     return humanize.naturaldelta(number, months)
+
+
+@elmr.app.template_filter('naturalsize')
+def naturalsize_filter(number, binary=True):
+    """
+    Formats a number of bytes as a human readable file size, e.g. "3.1 MiB".
+    """
+    if number is None:
+        return "unknown"
+    return humanize.naturalsize(number, binary=binary)
+
+
+@elmr.app.template_filter('percent')
+def percent_filter(ratio, precision=1):
+    """
+    Formats a ratio between 0 and 1 as a percentage, e.g. "99.2%".
+    """
+    if ratio is None:
+        return "n/a"
+    return "%0.*f%%" % (precision, ratio * 100)
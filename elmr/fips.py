@@ -21,10 +21,18 @@ Helper methods for FIPS codes and extracting FIPS info from the database.
 import re
 import csv
 import elmr
+import numpy as np
 
 from datetime import date
-from sqlalchemy import extract
-from elmr.models import USAState, SeriesRecord
+from elmr.utils import slugify
+from elmr.catalog import get_catalog
+from elmr.models import Series, USAState, StateSeries
+from elmr.signals import series_changed
+from elmr.period import period_range
+from elmr.ordinal import ordinal, from_ordinal, labels
+from elmr.queries import cross_section
+from elmr.store import get_store, series_array, array_labels, array_rows
+from elmr.npy import to_matrix
 
 ##########################################################################
 ## Compiled Regex
@@ -34,19 +42,23 @@ from elmr.models import USAState, SeriesRecord
 LAUSTRE = re.compile(r'^([\w\s]+),\s+([\w\s]+)\s+\-\s+([\w\s]+$)', re.I)
 CESSMRE = re.compile(r'^([\w\s]+),\s+([\w\s,\-]+),\s+([\w\s]+)\s+\-\s+([\w\s]+$)', re.I)
 
+## The sources whose series are classified by state
+GEO_SOURCES = ("LAUS", "CESSM")
+
 ##########################################################################
 ## Per-State CSV Data Set Generators
 ##########################################################################
 
 
 def write_states_dataset(fobj, source, slug,
-                         start_year=None, end_year=None,
+                         start=None, end=None,
                          adjusted=True, delta=False):
     """
     Writes a geographic csv of the series to the open file-like object passed
     in as `fobj`. Each row is an individual state, and each column is the
     period for the series. You may also specify seasonally adjusted with the
-    `adjusted` boolean.
+    `adjusted` boolean. The start and end of the periods may be years, dates
+    or `YYYY-MM` strings and default to the configured years.
 
     The source can be either "LAUS" or "CESSM". The slug should be the URL-safe
     slug that groups similar datasets by state/category.
@@ -54,52 +66,136 @@ def write_states_dataset(fobj, source, slug,
     This will write in place to the fobj that is passed to it.
     """
 
-    fields = ["fips", "State"]
-
-    start_year = start_year or int(elmr.app.config['STARTYEAR'])
-    end_year   = end_year or int(elmr.app.config['ENDYEAR'])
+    start, end = get_period_range(start, end)
 
     ## TODO: Somehow get this from the database, not hardcoded logic.
-    for year in xrange(start_year, end_year + 1):
-        for month in xrange(1, 13):
-            if year == 2015 and month > 3:
-                break
-            fields.append(date(year, month, 1).strftime("%b %Y"))
+    last   = min(ordinal(end), ordinal(date(2015, 3, 1)))
+    fields = ["fips", "State"] + labels(np.arange(ordinal(start), last + 1))
 
     # Create the CSV writer
     writer = csv.DictWriter(fobj, fieldnames=fields)
     writer.writeheader()
 
     # Create the database query - note, there is no checking
-    for state in USAState.query.order_by('name'):
-        ss = state.series.filter_by(adjusted=adjusted, source=source, slug=slug)
+    for state in get_catalog().states:
+        series = get_state_series(state, source, slug, adjusted, delta)
+        if series is None:
+            continue
 
-        ss = ss.first()  # TODO: Check to make sure this returns a single result
-        if ss is None:
-            ss = state.series.filter_by(source=source, slug=slug).first()
+        row = {
+            "fips": state.fips,
+            "State": state.name,
+        }
 
-        if ss is None:
+        row.update(array_labels(*series_array(
+            series.id, start, end, source=series.source
+        )))
+
+        writer.writerow(row)
+
+
+def states_matrix(source, slug, start=None, end=None,
+                  adjusted=True, delta=False):
+    """
+    Returns the geographic dataset as a tuple of the states (as a list of
+    (fips, name) pairs), the month index of the first period, and a 2D float
+    array with one row per state and one column per period. Missing values
+    are NaN. The arguments are the same as `write_states_dataset`.
+    """
+
+    start, end = get_period_range(start, end)
+
+    states  = []
+    columns = []
+
+    for state in get_catalog().states:
+        series = get_state_series(state, source, slug, adjusted, delta)
+        if series is None:
             continue
-        # TODO: above was just a temporary fix
 
-        series = ss.series.delta if delta else ss.series
+        states.append((state.fips, state.name))
+        columns.append(array_rows(*series_array(
+            series.id, start, end, source=series.source
+        )))
 
+    start, matrix = to_matrix(columns)
+    return states, start, matrix.T
 
 
-        row = {
-            "fips": state.fips,
-            "State": state.name,
-        }
+def states_window(source, slug, period, before=0, after=0,
+                  adjusted=True, delta=False):
+    """
+    Returns the cross section of the geographic dataset at a single period,
+    widened by the number of months before and after it, in the same form
+    as `states_matrix`: the states (fips, name) pairs, the month index of the
+    first period of the window, and a 2D float array with one row per state
+    and one column per month of the window (NaN for missing values).
+
+    The records of every state are read with a single query for the window
+    rather than a query per state, unless the arrays are served from the
+    time series store or the series arrays.
+    """
+    first  = ordinal(period) - before
+    last   = ordinal(period) + after
+    states = []
+    series = []
+
+    for state in get_catalog().states:
+        s = get_state_series(state, source, slug, adjusted, delta)
+        if s is None:
+            continue
 
-        field   = SeriesRecord.period
-        records = series.records
+        states.append((state.fips, state.name))
+        series.append(s)
 
-        records = records.filter(extract('year', field) >= start_year)
-        records = records.filter(extract('year', field) <= end_year)
-        for record in records:
-            row[record.period.strftime("%b %Y")] = record.value
+    matrix = np.empty((len(series), last - first + 1))
+    matrix.fill(np.nan)
 
-        writer.writerow(row)
+    if get_store() is not None or elmr.app.config.get('USE_SERIES_ARRAYS'):
+        for row, s in enumerate(series):
+            start, values = series_array(
+                s.id, from_ordinal(first), from_ordinal(last), source=s.source
+            )
+            if len(values):
+                matrix[row, start - first:start - first + len(values)] = values
+        return states, first, matrix
+
+    rows = dict((s.id, row) for row, s in enumerate(series))
+    for series_id, month, value in cross_section(
+            rows.keys(), [s.source for s in series], first, last):
+        if value is not None:
+            matrix[rows[series_id], month - first] = value
+
+    return states, first, matrix
+
+
+def get_period_range(start=None, end=None):
+    """
+    Returns the (start, end) dates of the geographic datasets, defaulting to
+    the configured start and end years.
+    """
+    return period_range(
+        start, end,
+        int(elmr.app.config['STARTYEAR']),
+        int(elmr.app.config['ENDYEAR']),
+    )
+
+
+def get_state_series(state, source, slug, adjusted=True, delta=False):
+    """
+    Returns the series for a state given the source and the slug, preferring
+    the seasonally adjusted (or not) series as specified. If delta is True,
+    then the delta series is returned instead. Returns None if the state has
+    no series for the source and slug. The series are looked up in the
+    catalog (`elmr.catalog`) rather than the database.
+    """
+    catalog = get_catalog()
+    ss = catalog.state_series_entry(state.id, source, slug, adjusted)
+    if ss is None:
+        return None
+
+    series = catalog.get(ss.series_id)
+    return catalog.delta(series) if delta else series
 
 
 ##########################################################################
@@ -124,12 +220,15 @@ def get_fips_codes(include_dc=False):
 
 def get_conus_states(include_dc=False):
     """
-    Returns an alphabetical list of States from the database, excluding
-    territories (and the District of Columbia) to match FIPS codes.
+    Returns an alphabetical list of the States with classified series in the
+    catalog, excluding territories (and the District of Columbia) to match
+    FIPS codes.
     """
-    query   = "SELECT title FROM series WHERE source IN ('LAUS', 'CESSM')"
-    result  = elmr.db.session.execute(query)
-    states  = set([parse_series_title(row[0])['state'] for row in result])
+    catalog = get_catalog()
+    states  = set(
+        catalog.by_state[ss.state_id].name for ss in catalog.geo_series()
+        if ss.state_id in catalog.by_state
+    )
 
     exclude = {u'Puerto Rico', u'Virgin Islands'}
     if not include_dc:
@@ -185,13 +284,14 @@ def parse_series_title(title):
 def get_state_series_info(source="both"):
     """
     Returns a dictionary of state series information for use in dumping related
-    records to a CSV file or to create SQL migrations.
+    records to a CSV file or to create SQL migrations, read from the catalog of
+    the classified series (see `build_state_series`).
     """
 
     source_jump = {
-        "both": "('LAUS', 'CESSM')",
-        "laus": "('LAUS')",
-        "cessm": "('CESSM')",
+        "both": None,
+        "laus": "LAUS",
+        "cessm": "CESSM",
     }
 
     source = source.lower()
@@ -201,15 +301,88 @@ def get_state_series_info(source="both"):
             % (source, ", ".join(source_jump.keys()))
         )
 
-    pred = source_jump[source]
-    query = "SELECT blsid, title, source FROM series WHERE source IN %s" % pred
+    catalog = get_catalog()
+    for ss in catalog.geo_series(source_jump[source]):
+        state  = catalog.by_state.get(ss.state_id)
+        series = catalog.get(ss.series_id)
+
+        yield {
+            "state": state.name if state else None,
+            "category": ss.category,
+            "adjusted": ss.adjusted,
+            "dataset": ss.dataset,
+            "blsid": series.blsid if series else None,
+            "source": ss.source,
+        }
+
 
-    for blsid, title, source in elmr.db.session.execute(query):
-        row = parse_series_title(title)
-        row["blsid"]  = blsid
-        row["source"] = source
+def classify_series(title):
+    """
+    Returns the state, category, seasonality, dataset and slug (the category
+    for CESSM, otherwise the dataset) of a LAUS or CESSM series title. Raises
+    a ValueError if the title cannot be parsed.
+    """
+    info = parse_series_title(title)
+    info["slug"] = slugify(info["category"] or info["dataset"])
+    return info
+
+
+def build_state_series(sources=GEO_SOURCES):
+    """
+    Classifies every series of the sources (other than the deltas) once from
+    its title into the states_series table, so that geography lookups read
+    the classification rather than parsing the titles. Series that are not
+    yet classified are added, and those whose classification has changed
+    (e.g. a corrected title) are updated.
+
+    Returns a dictionary with the number of series added, updated and
+    unchanged, and the (blsid, title, reason) failures of the series whose
+    title could not be parsed or names an unknown state.
+    """
+    states   = dict((state.name, state.id) for state in USAState.query)
+    existing = dict((ss.series_id, ss) for ss in StateSeries.query)
+    report   = {"added": 0, "updated": 0, "unchanged": 0, "failures": []}
+
+    query = Series.query.filter(Series.source.in_(sources))
+    query = query.filter(Series.is_delta == False).order_by(Series.id)
+
+    for series in query:
+        try:
+            info = classify_series(series.title)
+        except ValueError as e:
+            report["failures"].append((series.blsid, series.title, str(e)))
+            continue
+
+        if info["state"] not in states:
+            report["failures"].append((
+                series.blsid, series.title,
+                "Unknown state '%s'" % info["state"],
+            ))
+            continue
+
+        fields = {
+            "state_id": states[info["state"]],
+            "adjusted": info["adjusted"],
+            "dataset": info["dataset"],
+            "source": series.source,
+            "category": info["category"],
+            "slug": info["slug"],
+        }
+
+        ss = existing.get(series.id)
+        if ss is None:
+            elmr.db.session.add(StateSeries(series_id=series.id, **fields))
+            report["added"] += 1
+        elif any(getattr(ss, key) != val for key, val in fields.items()):
+            for key, val in fields.items():
+                setattr(ss, key, val)
+            report["updated"] += 1
+        else:
+            report["unchanged"] += 1
 
-        yield row
+    elmr.db.session.commit()
+    series_changed.send(None)
+    return report
 
 
 def dump_state_series(path="state_series.csv", source="both"):
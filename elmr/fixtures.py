@@ -0,0 +1,352 @@
+# elmr.fixtures
+# Bulk loading of the shipped fixtures into the database with COPY
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 23 10:12:48 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: fixtures.py [] benjamin@bengfort.com $
+
+"""
+Bulk loading of the shipped fixtures into the database with COPY.
+
+Bootstrapping a database from the migrations executes thousands of single
+row statements. Instead, the fixtures in the fixtures directory can be
+streamed straight from their gzip files into COPY:
+
+    $ bin/elmr-admin.py loaddata
+
+The datasets are loaded in the order of their foreign keys:
+
+* `seriesids.json.gz`: the titles of the series of each source
+* `*.csv.gz`: the records of the series, one column per BLS ID and one row
+  per month (YEAR, MONTH) as in `cps_dataset.csv.gz`
+* `state_series.csv.gz`: the state, dataset and category of every state
+  series (requires the states of migration 004)
+
+Each dataset is copied into a temporary staging table first, and rows that
+are already in the database are pruned, so loading twice adds nothing. The
+non-unique indexes of the records and states series tables are dropped
+while they are filled and rebuilt once at the end, all in one transaction.
+Deltas are not shipped; compute them after loading (`deltas --all`).
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import csv
+import glob
+import gzip
+import json
+import time
+import elmr
+
+from StringIO import StringIO
+from elmr.utils import slugify
+from elmr.arrays import backfill, has_arrays
+from elmr.signals import series_changed
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+SERIES_FIXTURE = "seriesids.json.gz"
+STATES_FIXTURE = "state_series.csv.gz"
+RECORD_GLOB    = "*.csv.gz"
+
+## Report progress every so many rows read from a fixture
+PROGRESS_ROWS  = 50000
+
+## Prefixes of the BLS IDs of the seasonally adjusted state series; the
+## CPS and CESN series are not flagged as adjusted (see migration 009).
+ADJUSTED       = ("LASST", "SMS")
+
+## The tables whose non-unique indexes are rebuilt after the load
+DEFERRED       = ("records", "states_series")
+
+STAGING_SQL = (
+    "CREATE TEMP TABLE load_series (blsid text, title text, source text, "
+    "is_adjusted boolean) ON COMMIT DROP",
+    "CREATE TEMP TABLE load_records (fixture text, blsid text, period date, "
+    "month integer, value double precision) ON COMMIT DROP",
+    "CREATE TEMP TABLE load_states (state text, blsid text, adjusted boolean, "
+    "dataset text, source text, category text, slug text) ON COMMIT DROP",
+)
+
+SERIES_SQL = """
+    INSERT INTO series (blsid, title, source, is_primary, is_delta, is_adjusted)
+    SELECT DISTINCT ON (l.blsid) l.blsid, l.title, l.source, true, false,
+           l.is_adjusted
+    FROM load_series l
+    WHERE NOT EXISTS (SELECT 1 FROM series s WHERE s.blsid = l.blsid)
+"""
+
+## Records of series that already have records are not loaded again
+PRUNE_RECORDS_SQL = """
+    DELETE FROM load_records l USING series s
+    WHERE s.blsid = l.blsid AND EXISTS (
+        SELECT 1 FROM records r WHERE r.series_id = s.id
+    )
+"""
+
+PRUNE_STATES_SQL = """
+    DELETE FROM load_states l USING series s, states_series ss
+    WHERE s.blsid = l.blsid AND ss.series_id = s.id
+"""
+
+RECORDS_SQL = """
+    INSERT INTO records (series_id, source, period, month, value)
+    SELECT s.id, s.source, l.period, l.month, l.value
+    FROM load_records l JOIN series s ON s.blsid = l.blsid
+    WHERE l.fixture = %s
+"""
+
+STATES_SQL = """
+    INSERT INTO states_series
+        (state_id, series_id, adjusted, dataset, source, category, slug)
+    SELECT DISTINCT ON (s.id) u.id, s.id, l.adjusted, l.dataset, l.source,
+           l.category, l.slug
+    FROM load_states l
+    JOIN series s ON s.blsid = l.blsid
+    JOIN usa_states u ON u.name = l.state
+"""
+
+INDEXES_SQL = """
+    SELECT i.relname, pg_get_indexdef(i.oid)
+    FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid
+    WHERE x.indrelid = CAST(%s AS regclass)
+      AND NOT x.indisunique AND NOT x.indisprimary
+    ORDER BY i.relname
+"""
+
+##########################################################################
+## Streaming COPY
+##########################################################################
+
+
+class CopyStream(object):
+    """
+    A file-like object over an iterable of rows that COPY can read from,
+    encoding the rows as CSV only as they are read so that nothing is held
+    in memory. Calls progress with the number of rows read so far every
+    PROGRESS_ROWS rows.
+    """
+
+    def __init__(self, rows, progress=None):
+        self.rows     = iter(rows)
+        self.progress = progress
+        self.count    = 0
+        self.buffer   = StringIO()
+        self.writer   = csv.writer(self.buffer)
+
+    def read(self, size=8192):
+        while self.buffer.tell() < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+
+            self.writer.writerow([
+                field.encode('utf-8') if isinstance(field, unicode) else field
+                for field in row
+            ])
+
+            self.count += 1
+            if self.progress is not None and self.count % PROGRESS_ROWS == 0:
+                self.progress(self.count)
+
+        data  = self.buffer.getvalue()
+        chunk = data[:size]
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.buffer.write(data[size:])
+        return chunk
+
+##########################################################################
+## Fixture Readers
+##########################################################################
+
+
+def series_rows(path):
+    """
+    Yields the (blsid, title, source, is_adjusted) of every series in the
+    series IDs fixture, whose sources map either BLS IDs to titles or the
+    names of states to the BLS IDs and titles of the state.
+    """
+    with gzip.open(path, 'rb') as f:
+        data = json.load(f)
+
+    for source, series in sorted(data.items()):
+        for key, value in sorted(series.items()):
+            items = value.items() if isinstance(value, dict) else [(key, value)]
+            for blsid, title in sorted(items):
+                yield blsid, title, source, blsid.startswith(ADJUSTED)
+
+
+def record_rows(path):
+    """
+    Yields the (fixture, blsid, period, month, value) of every value in a
+    dataset fixture with a column per BLS ID and a row per YEAR and MONTH.
+    Empty values are skipped.
+    """
+    name = os.path.basename(path)
+    with gzip.open(path, 'rb') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        blsids = header[2:]
+
+        for row in reader:
+            year, month = int(row[0]), int(row[1])
+            period = "%04i-%02i-01" % (year, month)
+            month  = year * 12 + month - 1
+
+            for blsid, value in zip(blsids, row[2:]):
+                if value:
+                    yield name, blsid, period, month, value
+
+
+def state_rows(path):
+    """
+    Yields the (state, blsid, adjusted, dataset, source, category, slug) of
+    every series in the state series fixture, where the slug is that of the
+    category (CESSM) or otherwise of the dataset as in `elmr.fips`.
+    """
+    with gzip.open(path, 'rb') as f:
+        for row in csv.DictReader(f):
+            category = row["category"].decode('utf-8') or None
+            dataset  = row["dataset"].decode('utf-8')
+            yield (
+                row["state"], row["blsid"], row["adjusted"], dataset,
+                row["source"], category, slugify(category or dataset),
+            )
+
+##########################################################################
+## Loading
+##########################################################################
+
+
+def copy_rows(cursor, table, rows, progress=None):
+    """
+    Copies the rows into the table, reporting progress as (rows, seconds).
+    Returns the number of rows and the seconds it took.
+    """
+    start  = time.time()
+    report = None
+    if progress is not None:
+        report = lambda count: progress(count, time.time() - start)
+
+    stream = CopyStream(rows, report)
+    cursor.copy_expert("COPY %s FROM STDIN WITH CSV" % table, stream)
+    if report is not None:
+        report(stream.count)
+    return stream.count, time.time() - start
+
+
+def drop_indexes(cursor, table):
+    """
+    Drops the non-unique indexes of the table, returning the statements
+    that recreate them. Indexes of a partitioned table are recreated on the
+    partitions as well.
+    """
+    cursor.execute(INDEXES_SQL, (table,))
+    indexes = cursor.fetchall()
+
+    for name, _ in indexes:
+        cursor.execute("DROP INDEX %s" % name)
+
+    return [sql.replace(" ON ONLY ", " ON ") for _, sql in indexes]
+
+
+def load_fixtures(root=None, progress=None):
+    """
+    Bulk loads the series, records and state series fixtures in the root
+    directory (the FIXTURES setting by default) in a single transaction.
+    Progress is called with the name of the dataset, the rows read so far
+    and the seconds elapsed.
+
+    Returns a list of the (dataset, rows read, rows loaded, seconds) of each
+    fixture and the seconds it took to rebuild the indexes.
+    """
+    root    = root or elmr.app.config['FIXTURES']
+    session = elmr.db.session
+    cursor  = session.connection().connection.cursor()
+    report  = []
+
+    def stage(name, table, rows):
+        callback = None
+        if progress is not None:
+            callback = lambda count, seconds: progress(name, count, seconds)
+        return copy_rows(cursor, table, rows, callback)
+
+    datasets = sorted(
+        path for path in glob.glob(os.path.join(root, RECORD_GLOB))
+        if os.path.basename(path) != STATES_FIXTURE
+    )
+
+    try:
+        for sql in STAGING_SQL:
+            cursor.execute(sql)
+
+        # Stage and insert the series, which the other datasets refer to
+        path = os.path.join(root, SERIES_FIXTURE)
+        rows, seconds = stage(SERIES_FIXTURE, "load_series", series_rows(path))
+        start = time.time()
+        cursor.execute(SERIES_SQL)
+        report.append((
+            SERIES_FIXTURE, rows, cursor.rowcount, seconds + time.time() - start
+        ))
+
+        # Stage the records and the state series, then prune what is loaded
+        staged = []
+        for path in datasets:
+            name = os.path.basename(path)
+            staged.append((name, RECORDS_SQL, (name,)) + stage(
+                name, "load_records", record_rows(path)
+            ))
+
+        path = os.path.join(root, STATES_FIXTURE)
+        staged.append((STATES_FIXTURE, STATES_SQL, None) + stage(
+            STATES_FIXTURE, "load_states", state_rows(path)
+        ))
+
+        cursor.execute(PRUNE_RECORDS_SQL)
+        cursor.execute(PRUNE_STATES_SQL)
+
+        # Fill the tables without their indexes and rebuild them at the end
+        indexes = []
+        for table in DEFERRED:
+            indexes.extend(drop_indexes(cursor, table))
+
+        records = 0
+        for name, sql, params, rows, seconds in staged:
+            start = time.time()
+            cursor.execute(sql, params)
+            if sql is RECORDS_SQL:
+                records += cursor.rowcount
+            report.append((
+                name, rows, cursor.rowcount, seconds + time.time() - start
+            ))
+
+        start = time.time()
+        for sql in indexes:
+            cursor.execute(sql)
+        for table in ("series",) + DEFERRED:
+            cursor.execute("ANALYZE %s" % table)
+        rebuild = time.time() - start
+
+        session.commit()
+    except:
+        session.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    # Write the arrays of the loaded series if arrays are in use
+    if records and has_arrays():
+        backfill()
+
+    series_changed.send(None)
+    return report, rebuild
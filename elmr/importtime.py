@@ -0,0 +1,88 @@
+# elmr.importtime
+# Measures the cold start import time of the parts of ELMR
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 22:37:51 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: importtime.py [] benjamin@bengfort.com $
+
+"""
+Measures the cold start import time of the parts of ELMR.
+
+Every statement is timed in a fresh Python interpreter (so nothing is
+already imported) and the best of several runs is reported along with the
+number of modules that were loaded, e.g. to track the time it takes a web
+dyno to boot:
+
+    $ bin/elmr-admin.py importtime
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import sys
+import json
+import subprocess
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+BASE_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+
+## The (name, statement) pairs that are measured by default
+TARGETS = (
+    ("elmr", "import elmr"),
+    ("elmr.config", "import elmr.config"),
+    ("elmr.models", "import elmr.models"),
+    ("configure", "import elmr; elmr.configure()"),
+    ("elmr.ingest", "import elmr.ingest"),
+    ("migrate", "from migrate.versioning import api"),
+)
+
+## Run in the child interpreter to time the statement
+TIMER = """
+import sys, time, json
+sys.path.insert(0, %(path)r)
+base = len(sys.modules)
+start = time.time()
+%(statement)s
+print(json.dumps([time.time() - start, len(sys.modules) - base]))
+"""
+
+##########################################################################
+## Measurement
+##########################################################################
+
+
+def measure(statement, repeat=3, python=None):
+    """
+    Returns the best time in seconds to execute the statement in a fresh
+    interpreter, along with the number of modules that it imported.
+    """
+    python = python or sys.executable
+    script = TIMER % {"path": BASE_PATH, "statement": statement}
+    best   = None
+
+    for _ in xrange(repeat):
+        output = subprocess.check_output([python, "-c", script])
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result[0] < best[0]:
+            best = result
+
+    return best[0], best[1]
+
+
+def report(targets=TARGETS, repeat=3):
+    """
+    Returns a list of (name, seconds, modules) for each target.
+    """
+    return [
+        (name,) + measure(statement, repeat)
+        for name, statement in targets
+    ]
@@ -23,6 +23,7 @@ from elmr.config import Config
 from datetime import date, datetime
 from elmr.models import IngestionRecord
 from elmr.ingest import fetch, wrangle
+from elmr.signals import ingestion_finished
 
 
 def ingest(**kwargs):
@@ -33,12 +34,20 @@ def ingest(**kwargs):
 
     Note: all work is logged in the database as an IngestionRecord.
 
+    If reload is passed, every record of the sources is replaced by the
+    fetched data (see `wrangle.reload`) instead of adding the new rows, so
+    the years should cover the whole history of the sources.
+
     :param kwargs: should be the keyword arguments to `fetch_all`
     """
 
     startyear = int(kwargs.get('startyear', Config.STARTYEAR))
-    endyear   = int(kwargs.get('endyear', Config.STARTYEAR))
+    endyear   = int(kwargs.get('endyear', Config.ENDYEAR))
     title     = kwargs.pop("title", "ELMR Ingestion Library")
+    reload    = kwargs.pop("reload", False)
+
+    if reload and not kwargs.get('sources'):
+        raise ValueError("Reloading requires the sources to replace")
 
     ## Create the log record
     log  = IngestionRecord(
@@ -53,7 +62,11 @@ def ingest(**kwargs):
     elmr.db.session.commit()
 
     ## Initiate the callback chain
-    kwargs['callback'] = wrangle.wrangle
+    if reload:
+        sources = kwargs['sources']
+        kwargs['callback'] = lambda path: wrangle.reload(path, sources)
+    else:
+        kwargs['callback'] = wrangle.wrangle
     duration, num_series, num_rows = fetch.fetch_all(**kwargs)
 
     ## Update the log record
@@ -64,4 +77,25 @@ def ingest(**kwargs):
     log.num_fetched = num_rows[1]
     elmr.db.session.commit()
 
+    ## Notify caches that the data has changed
+    ingestion_finished.send(log)
+
     return log
+
+
+@ingestion_finished.connect
+def enqueue_jobs(sender, **kwargs):
+    """
+    Enqueues the jobs that follow an ingestion: writing the store for the
+    new version of the data if the store is enabled, and rendering a new
+    snapshot if the snapshot is served. Connected here so that every
+    ingestion enqueues them, however it was run.
+    """
+    from elmr.jobs import enqueue
+
+    jobs = []
+    if elmr.app.config.get('USE_STORE'):
+        jobs.append(enqueue(u"store"))
+    if elmr.app.config.get('SERVE_SNAPSHOT'):
+        jobs.append(enqueue(u"snapshot"))
+    return jobs
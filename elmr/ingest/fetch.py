@@ -79,7 +79,7 @@ def fetch_series(sids, path, startyear=STARTYEAR, endyear=ENDYEAR):
     """
 
     # Make API call for series id set
-    data   = bls_series(sids, startyear=STARTYEAR, endyear=ENDYEAR)
+    data   = bls_series(sids, startyear=startyear, endyear=endyear)
 
     # Upon response, write results to disk
     for dataset in data['Results']['series']:
@@ -89,11 +89,13 @@ def fetch_series(sids, path, startyear=STARTYEAR, endyear=ENDYEAR):
 
 
 def fetch_all(startyear=STARTYEAR, endyear=ENDYEAR, fixtures=FIXTURES,
-              blocksize=10, cleanup=True, ratelimit=1, callback=None):
+              blocksize=10, cleanup=True, ratelimit=1, callback=None,
+              sources=None, progress=None):
     """
     Fetches the data for all series ids that are in the database by ingesting
     them in blocks of 10 time series at a time for the given start and end
-    years. The method is implemented as follows:
+    years. If sources is given, only the series of those sources (e.g. CPS
+    and CESN) are fetched. The method is implemented as follows:
 
         1. Determine disk directory to write to via fixtures
         2. Look up series ids from the database
@@ -102,22 +104,31 @@ def fetch_all(startyear=STARTYEAR, endyear=ENDYEAR, fixtures=FIXTURES,
         5. Call the callback function, passing the directory of data
         6. If cleanup, delete the directory and its contents
 
-    The callback methodology allows you to create a fetch-wrangle chain.
+    The callback methodology allows you to create a fetch-wrangle chain. If
+    progress is given, it is called with the number of series fetched so far
+    and the total number of series after each block is fetched.
 
     This method returns the duration and the number of timeseries fetched,
     as well as any results from the callback.
     """
 
-    start = time.time()
-    store = ingest_path(fixtures)
-    count = Series.query.count()
-    pages = count / blocksize
+    start  = time.time()
+    store  = ingest_path(fixtures)
+    series = Series.query.order_by(Series.id)
+
+    if sources:
+        series = series.filter(Series.source.in_(sources))
+
+    count  = series.count()
+    pages  = count / blocksize
 
     for pagenum in xrange(1, pages + 2):
-        page = Series.query.paginate(pagenum, blocksize, False)
+        page = series.paginate(pagenum, blocksize, False)
         sids = [s.blsid for s in page.items]
 
         fetch_series(sids, store, startyear, endyear)
+        if progress is not None:
+            progress(min(pagenum * blocksize, count), count)
         time.sleep(ratelimit)
 
     cbres = None
@@ -26,6 +26,9 @@ from datetime import datetime
 from operator import itemgetter
 
 from elmr.models import SeriesRecord, Series
+from elmr.arrays import backfill, has_arrays, update_array
+from elmr.ordinal import ordinal
+from elmr.partitions import load_partition
 
 ##########################################################################
 ## Module Constants
@@ -80,6 +83,7 @@ def wrangle(path):
 
         # Fetch the series from the database
         series = Series.query.filter_by(blsid=series_id).first()
+        added  = []
 
         # Insert data into the database in order
         for date, value in sorted(values.items(), key=itemgetter(0)):
@@ -93,14 +97,55 @@ def wrangle(path):
             if not elmr.db.session.query(q.exists()).scalar():
                 r = SeriesRecord(
                     series_id=series.id,
+                    source=series.source,
                     period=date,
                     value=float(value),
                 )
                 elmr.db.session.add(r)
+                added.append((ordinal(date), float(value)))
 
                 rows_added += 1
 
+        # Update the series array in place (if it has been backfilled)
+        update_array(series.id, added)
+
         # Commit each series individually
         elmr.db.session.commit()
 
     return rows_added, rows_fetched
+
+
+def reload(path, sources):
+    """
+    Takes a path to ingested data and replaces every record of the sources
+    with the data found in that directory, swapping in a freshly loaded
+    partition per source rather than inserting the new rows one by one.
+    Requires the partitioned records table. A source that nothing was found
+    for is left as it is. Returns the number of rows loaded and the number
+    of rows found (which are the same).
+    """
+
+    rows = dict((source, []) for source in sources)
+
+    for path in glob.glob(os.path.join(path, "*.json")):
+        series_id, values = extract(path)
+        series = Series.query.filter_by(blsid=series_id).first()
+
+        if series.source not in rows:
+            continue
+
+        for date, value in sorted(values.items(), key=itemgetter(0)):
+            rows[series.source].append((series.id, date, float(value), None))
+
+    rows_loaded = 0
+    for source, records in rows.items():
+        if not records:
+            continue
+
+        rows_loaded += load_partition(source, records)
+
+        # Rebuild the arrays of the reloaded series if arrays are in use
+        if has_arrays():
+            backfill(set(record[0] for record in records))
+
+    return rows_loaded, rows_loaded
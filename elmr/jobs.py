@@ -0,0 +1,314 @@
+# elmr.jobs
+# A database backed queue of background jobs and the worker that runs them
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 23:40:16 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: jobs.py [] benjamin@bengfort.com $
+
+"""
+A database backed queue of background jobs and the worker that runs them.
+
+Ingestion takes the better part of an hour, far too long to run inside a
+web request, so the admin page enqueues a `Job` row instead and a separate
+worker process (`elmr-admin.py worker`, the `worker` in the Procfile) runs
+it, recording its progress on the row as it goes so the page can poll it.
+
+Workers claim a job with an optimistic `UPDATE ... WHERE status = 'queued'`
+so that several workers can share the queue without running a job twice.
+Before claiming, a worker fails the running jobs whose worker has died: those
+of a worker process on the same host that no longer exists, and any job that
+has run for longer than the `JOB_TIMEOUT` setting.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import json
+import time
+import errno
+import socket
+import traceback
+
+from datetime import datetime, timedelta
+from elmr import app, db
+from elmr.models import Job, Series
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+QUEUED   = u"queued"
+RUNNING  = u"running"
+FINISHED = u"finished"
+FAILED   = u"failed"
+
+STATUSES = (QUEUED, RUNNING, FINISHED, FAILED)
+
+## Maps the kind of job to the function that runs it
+HANDLERS = {}
+
+##########################################################################
+## Job Handlers
+##########################################################################
+
+
+def handler(kind):
+    """
+    Decorator that registers a function to run jobs of the given kind. The
+    function is called with the job and the job's parameters as keyword
+    arguments and returns a message describing the result.
+    """
+    def decorator(func):
+        HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+@handler(u"ingest")
+def run_ingest(job, **params):
+    """
+    Ingests and wrangles the data from BLS for the configured years unless
+    the job specifies them, recording the share of the series fetched.
+    """
+    from elmr.ingest import ingest
+
+    def progress(fetched, total):
+        update(job, progress=float(fetched) / total,
+               message=u"Fetched %i of %i series from the BLS API" % (
+                   fetched, total
+               ))
+
+    update(job, message=u"Fetching series from the BLS API")
+    params.setdefault("title", u"ELMR Background Job %i Ingestion" % job.id)
+    params.setdefault("startyear", app.config['STARTYEAR'])
+    params.setdefault("endyear", app.config['ENDYEAR'])
+
+    log = ingest(progress=progress, **params)
+    job.ingestion_id = log.id
+
+    return u"Ingested %i rows in %i time series" % (
+        log.num_added, log.num_series
+    )
+
+
+@handler(u"deltas")
+def run_deltas(job, delete=True):
+    """
+    Computes the delta series of every (non delta) series.
+    """
+    from elmr.delta import compute_delta
+
+    ids   = [sid for sid, in Series.query.filter_by(is_delta=False)
+                                   .with_entities(Series.id)]
+    total = len(ids)
+
+    for idx, sid in enumerate(ids):
+        compute_delta(sid, delete=delete)
+        if idx % 25 == 0:
+            update(job, progress=float(idx) / total,
+                   message=u"Computed %i of %i deltas" % (idx, total))
+
+    db.session.commit()
+    return u"Computed deltas for %i series" % total
+
+
+@handler(u"store")
+def run_store(job):
+    """
+    Writes the memory-mapped time series store.
+    """
+    from elmr.store import build_store
+
+    path, nseries, nvalues, _ = build_store()
+    return u"Stored %i values in %i time series" % (nvalues, nseries)
+
+
+@handler(u"snapshot")
+def run_snapshot(job, base_url=None):
+    """
+    Pre-renders the read API into a static snapshot.
+    """
+    from elmr.snapshot import build_snapshot
+
+    path, count, nbyte, _ = build_snapshot(base_url=base_url)
+    return u"Wrote %i responses to %s" % (count, os.path.basename(path))
+
+##########################################################################
+## Queue Operations
+##########################################################################
+
+
+def enqueue(kind, **params):
+    """
+    Adds a job of the given kind to the queue and returns it. Raises a
+    ValueError if there is no handler for the kind of job.
+    """
+    if kind not in HANDLERS:
+        raise ValueError("Unknown kind of job '%s'" % kind)
+
+    job = Job(kind=kind, status=QUEUED, params=unicode(json.dumps(params)),
+              message=u"Waiting for a worker")
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def claim(worker):
+    """
+    Claims the oldest queued job for the worker and returns it, or returns
+    None if the queue is empty. If another worker claims the same job first
+    the update matches no rows and the next oldest job is tried.
+    """
+    while True:
+        job = Job.query.filter_by(status=QUEUED).order_by(Job.id).first()
+        if job is None:
+            return None
+
+        claimed = Job.query.filter_by(id=job.id, status=QUEUED).update({
+            "status": RUNNING,
+            "worker": worker,
+            "started": datetime.now(),
+            "message": u"Started by %s" % worker,
+        }, synchronize_session=False)
+        db.session.commit()
+
+        if claimed:
+            db.session.refresh(job)
+            return job
+
+
+def is_alive(worker):
+    """
+    Returns False if the worker (named host:pid) is a process on this host
+    that no longer exists, True otherwise (it cannot be checked elsewhere).
+    """
+    host, _, pid = (worker or u"").rpartition(u":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+
+    try:
+        os.kill(int(pid), 0)
+    except OSError as e:
+        return e.errno != errno.ESRCH
+    return True
+
+
+def reap():
+    """
+    Fails the running jobs whose worker has died or that have been running
+    for longer than the JOB_TIMEOUT setting, so that they are not reported
+    as running forever. Returns the number of jobs that were failed.
+    """
+    timeout = int(app.config['JOB_TIMEOUT'])
+    running = Job.query.filter_by(status=RUNNING)
+    expired = set(jid for jid, in running.filter(
+        Job.started < datetime.now() - timedelta(seconds=timeout)
+    ).with_entities(Job.id))
+    count   = 0
+
+    for job in running.order_by(Job.id).all():
+        if not is_alive(job.worker):
+            message = u"Worker %s stopped before the job finished" % job.worker
+        elif job.id in expired:
+            message = u"Timed out after %i seconds" % timeout
+        else:
+            continue
+
+        # The job may have finished since it was read
+        count += Job.query.filter_by(id=job.id, status=RUNNING).update({
+            "status": FAILED,
+            "message": message,
+            "finished": datetime.now(),
+        }, synchronize_session=False)
+
+    db.session.commit()
+    return count
+
+
+def update(job, **fields):
+    """
+    Records the progress of a running job (e.g. progress, message).
+    """
+    for key, val in fields.items():
+        setattr(job, key, val)
+    db.session.commit()
+
+
+def run(job):
+    """
+    Runs a claimed job with its handler and records the result. Exceptions
+    are recorded on the job rather than raised so the worker keeps going.
+    """
+    params = json.loads(job.params or "{}")
+    params = dict((str(key), val) for key, val in params.items())
+
+    try:
+        message = HANDLERS[job.kind](job, **params)
+    except Exception as e:
+        db.session.rollback()
+        job.status  = FAILED
+        job.message = unicode(e)[:255]
+        job.error   = traceback.format_exc().decode('utf-8', 'replace')
+    else:
+        job.status   = FINISHED
+        job.progress = 1.0
+        job.message  = message
+
+    job.finished = datetime.now()
+    db.session.commit()
+    return job
+
+
+def work(worker=None, poll=5.0, once=False):
+    """
+    Claims and runs jobs until stopped, sleeping for poll seconds when the
+    queue is empty. If once is True, returns when the queue is empty.
+    Returns the number of jobs that were run.
+    """
+    worker = worker or u"%s:%i" % (socket.gethostname(), os.getpid())
+    count  = 0
+
+    while True:
+        reap()
+        job = claim(worker)
+        if job is None:
+            if once:
+                return count
+
+            db.session.remove()
+            time.sleep(poll)
+            continue
+
+        run(job)
+        count += 1
+
+##########################################################################
+## Serialization
+##########################################################################
+
+
+def serialize(job):
+    """
+    Returns the JSON representation of a job for the API.
+    """
+    def ts(dt):
+        return dt.isoformat() if dt is not None else None
+
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "ingestion": job.ingestion_id,
+        "worker": job.worker,
+        "created": ts(job.created),
+        "started": ts(job.started),
+        "finished": ts(job.finished),
+    }
@@ -0,0 +1,10 @@
+--
+-- Downgrade from database version 010: remove composite index on records
+-- Created: Mon Oct 19 20:41:12 2026 -0400
+--
+
+BEGIN;
+
+DROP INDEX IF EXISTS records_series_period_value_idx;
+
+COMMIT;
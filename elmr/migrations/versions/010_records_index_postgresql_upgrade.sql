@@ -0,0 +1,17 @@
+--
+-- Upgrade to database version 010: composite index on records
+-- Created: Mon Oct 19 20:41:12 2026 -0400
+--
+-- Nearly every read filters records by series_id and orders by period, but
+-- the only indices were on period and the primary key. The value is the
+-- trailing key of the index so that series reads are index only scans.
+--
+
+BEGIN;
+
+CREATE INDEX records_series_period_value_idx
+    ON records (series_id, period, value);
+
+ANALYZE records;
+
+COMMIT;
@@ -0,0 +1,10 @@
+--
+-- Downgrade from database version 011: remove background jobs table
+-- Created: Mon Oct 19 23:31:52 2026 -0400
+--
+
+BEGIN;
+
+DROP TABLE jobs;
+
+COMMIT;
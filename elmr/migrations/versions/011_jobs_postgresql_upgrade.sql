@@ -0,0 +1,29 @@
+--
+-- Upgrade to database version 011: background jobs table
+-- Created: Mon Oct 19 23:31:52 2026 -0400
+--
+
+BEGIN;
+
+CREATE TABLE jobs (
+    id serial NOT NULL,
+    kind varchar(20) NOT NULL,
+    status varchar(10) NOT NULL DEFAULT 'queued',
+    params text,
+    progress float NOT NULL DEFAULT 0.0,
+    message varchar(255),
+    error text,
+    worker varchar(255),
+    ingestion_id integer,
+    created timestamp with time zone NOT NULL DEFAULT now(),
+    started timestamp with time zone,
+    finished timestamp with time zone,
+    CONSTRAINT jobs_pkey PRIMARY KEY (id),
+    CONSTRAINT jobs_ingestion_id_fkey
+        FOREIGN KEY (ingestion_id)
+        REFERENCES ingestions(id)
+);
+
+CREATE INDEX ix_jobs_status ON jobs (status);
+
+COMMIT;
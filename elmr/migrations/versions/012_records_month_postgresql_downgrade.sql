@@ -0,0 +1,15 @@
+--
+-- Downgrade from database version 012: integer month ordinal of records
+-- Created: Tue Oct 20 11:42:08 2026 -0400
+--
+
+BEGIN;
+
+DROP INDEX IF EXISTS records_series_month_value_idx;
+
+ALTER TABLE records DROP COLUMN month;
+
+CREATE INDEX records_series_period_value_idx
+    ON records (series_id, period, value);
+
+COMMIT;
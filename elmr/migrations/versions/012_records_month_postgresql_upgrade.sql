@@ -0,0 +1,28 @@
+--
+-- Upgrade to database version 012: integer month ordinal of records
+-- Created: Tue Oct 20 11:42:08 2026 -0400
+--
+-- Records store the month ordinal of their period (year * 12 + month - 1)
+-- so that range checks, gaps and alignment are integer arithmetic. Series
+-- reads filter and order on the ordinal, so the composite index is rebuilt
+-- on (series_id, month, value) to keep them index only scans.
+--
+
+BEGIN;
+
+ALTER TABLE records ADD COLUMN month integer;
+
+UPDATE records SET month = CAST(
+    EXTRACT(year FROM period) * 12 + EXTRACT(month FROM period) - 1 AS integer
+);
+
+ALTER TABLE records ALTER COLUMN month SET NOT NULL;
+
+DROP INDEX IF EXISTS records_series_period_value_idx;
+
+CREATE INDEX records_series_month_value_idx
+    ON records (series_id, month, value);
+
+ANALYZE records;
+
+COMMIT;
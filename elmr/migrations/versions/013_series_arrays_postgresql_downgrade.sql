@@ -0,0 +1,10 @@
+--
+-- Downgrade from database version 013: array per series storage
+-- Created: Tue Oct 20 13:31:52 2026 -0400
+--
+
+BEGIN;
+
+DROP TABLE IF EXISTS series_arrays;
+
+COMMIT;
@@ -0,0 +1,23 @@
+--
+-- Upgrade to database version 013: array per series storage
+-- Created: Tue Oct 20 13:31:52 2026 -0400
+--
+-- Stores every monthly value of a series in a single row as a float8[]
+-- beginning at the month ordinal in start (NULL for missing months). The
+-- table is empty until it is backfilled from the records:
+--
+--     $ bin/elmr-admin.py arrays backfill
+--
+
+BEGIN;
+
+CREATE TABLE series_arrays (
+    series_id integer NOT NULL
+        REFERENCES series (id) ON DELETE CASCADE,
+    start integer NOT NULL,
+    data double precision[] NOT NULL,
+    updated timestamp with time zone NOT NULL DEFAULT now(),
+    CONSTRAINT series_arrays_pkey PRIMARY KEY (series_id)
+);
+
+COMMIT;
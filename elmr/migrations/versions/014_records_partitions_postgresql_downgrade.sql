@@ -0,0 +1,36 @@
+--
+-- Downgrade from database version 014: partition records by source
+-- Created: Tue Oct 20 15:02:19 2026 -0400
+--
+
+BEGIN;
+
+ALTER TABLE records RENAME TO records_partitioned;
+ALTER TABLE records_partitioned
+    RENAME CONSTRAINT records_pkey TO records_partitioned_pkey;
+ALTER SEQUENCE records_id_seq OWNED BY NONE;
+
+CREATE TABLE records (
+    id integer NOT NULL DEFAULT nextval('records_id_seq'),
+    series_id integer REFERENCES series (id),
+    period date NOT NULL,
+    month integer NOT NULL,
+    value double precision NOT NULL,
+    footnote varchar(255),
+    CONSTRAINT records_pkey PRIMARY KEY (id)
+);
+
+INSERT INTO records (id, series_id, period, month, value, footnote)
+SELECT id, series_id, period, month, value, footnote
+  FROM records_partitioned;
+
+DROP TABLE records_partitioned;
+
+ALTER SEQUENCE records_id_seq OWNED BY records.id;
+
+CREATE INDEX records_series_month_value_idx
+    ON records (series_id, month, value);
+
+CREATE INDEX ix_records_period ON records (period);
+
+COMMIT;
@@ -0,0 +1,65 @@
+--
+-- Upgrade to database version 014: partition records by source
+-- Created: Tue Oct 20 15:02:19 2026 -0400
+--
+-- Records are declaratively partitioned by the source of their series (a
+-- partition per source and per delta source, plus a default partition),
+-- so that vacuuming, reindexing or reloading one source does not touch the
+-- others and queries that filter on the source only scan its partition.
+-- Requires PostgreSQL 11 or later.
+--
+-- The source of each record is denormalized from its series; the primary
+-- key of a partitioned table must include the partition key.
+--
+
+BEGIN;
+
+ALTER TABLE records RENAME TO records_unpartitioned;
+ALTER TABLE records_unpartitioned
+    RENAME CONSTRAINT records_pkey TO records_unpartitioned_pkey;
+ALTER SEQUENCE records_id_seq OWNED BY NONE;
+
+CREATE TABLE records (
+    id integer NOT NULL DEFAULT nextval('records_id_seq'),
+    series_id integer NOT NULL REFERENCES series (id),
+    source varchar(255) NOT NULL,
+    period date NOT NULL,
+    month integer NOT NULL,
+    value double precision NOT NULL,
+    footnote varchar(255),
+    CONSTRAINT records_pkey PRIMARY KEY (source, id)
+) PARTITION BY LIST (source);
+
+CREATE TABLE records_cps PARTITION OF records FOR VALUES IN ('CPS');
+CREATE TABLE records_cesn PARTITION OF records FOR VALUES IN ('CESN');
+CREATE TABLE records_laus PARTITION OF records FOR VALUES IN ('LAUS');
+CREATE TABLE records_cessm PARTITION OF records FOR VALUES IN ('CESSM');
+CREATE TABLE records_cps_analysis PARTITION OF records
+    FOR VALUES IN ('CPS-ANALYSIS');
+CREATE TABLE records_cesn_analysis PARTITION OF records
+    FOR VALUES IN ('CESN-ANALYSIS');
+CREATE TABLE records_laus_analysis PARTITION OF records
+    FOR VALUES IN ('LAUS-ANALYSIS');
+CREATE TABLE records_cessm_analysis PARTITION OF records
+    FOR VALUES IN ('CESSM-ANALYSIS');
+CREATE TABLE records_default PARTITION OF records DEFAULT;
+
+INSERT INTO records (id, series_id, source, period, month, value, footnote)
+SELECT r.id, r.series_id, s.source, r.period, r.month, r.value, r.footnote
+  FROM records_unpartitioned r
+  JOIN series s ON s.id = r.series_id;
+
+DROP TABLE records_unpartitioned;
+
+ALTER SEQUENCE records_id_seq OWNED BY records.id;
+
+-- The source is included so that series reads that filter on it for
+-- partition pruning are still answered by an index only scan.
+CREATE INDEX records_series_month_value_idx
+    ON records (series_id, month, value, source);
+
+CREATE INDEX ix_records_period ON records (period);
+
+ANALYZE records;
+
+COMMIT;
@@ -0,0 +1,11 @@
+--
+-- Downgrade from database version 015: index the state series catalog
+-- Created: Thu Oct 22 17:32:48 2026 -0400
+--
+
+BEGIN;
+
+DROP INDEX IF EXISTS states_series_lookup_idx;
+DROP INDEX IF EXISTS states_series_series_idx;
+
+COMMIT;
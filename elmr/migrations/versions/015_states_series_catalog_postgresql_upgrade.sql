@@ -0,0 +1,22 @@
+--
+-- Upgrade to database version 015: index the state series catalog
+-- Created: Thu Oct 22 17:32:48 2026 -0400
+--
+-- The state, seasonality, dataset, category and slug of every LAUS and
+-- CESSM series are classified once from the series title into
+-- states_series, and are looked up by series or by (source, slug, state)
+-- rather than parsed from the titles on every request. Rebuild the
+-- classification after ingesting new state series with:
+--
+--     $ bin/elmr-admin.py catalog
+--
+
+BEGIN;
+
+CREATE UNIQUE INDEX states_series_series_idx
+    ON states_series (series_id);
+
+CREATE INDEX states_series_lookup_idx
+    ON states_series (source, slug, state_id, adjusted);
+
+COMMIT;
@@ -19,6 +19,9 @@ Database models for the ELMR application
 
 from elmr import db
 from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import ARRAY
+from elmr.ordinal import ordinal
 
 ##########################################################################
 ## Ingestion Models
@@ -51,6 +54,36 @@ class IngestionRecord(db.Model):
         return ("<Ingestion on %s with %i records added from %i series>"
                 % (ts, self.num_added, self.num_series))
 
+
+class Job(db.Model):
+    """
+    A background job (e.g. an ingestion or the computation of deltas) that
+    is queued by the web app and run by a worker process. See `elmr.jobs`.
+    """
+
+    __tablename__ = "jobs"
+
+    id          = db.Column(db.Integer, primary_key=True)
+    kind        = db.Column(db.Unicode(20), nullable=False)
+    status      = db.Column(db.Unicode(10), nullable=False,
+                            default=u"queued", index=True)
+    params      = db.Column(db.UnicodeText, nullable=True)
+    progress    = db.Column(db.Float, nullable=False, default=0.0)
+    message     = db.Column(db.Unicode(255), nullable=True)
+    error       = db.Column(db.UnicodeText, nullable=True)
+    worker      = db.Column(db.Unicode(255), nullable=True)
+    ingestion_id = db.Column(db.Integer, db.ForeignKey('ingestions.id'),
+                             nullable=True)
+    ingestion   = db.relationship('IngestionRecord', backref=db.backref(
+                                  'jobs', lazy='dynamic'))
+    created     = db.Column(db.DateTime(timezone=True), nullable=False,
+                            default=datetime.now)
+    started     = db.Column(db.DateTime(timezone=True), nullable=True)
+    finished    = db.Column(db.DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return "<Job %i %s (%s)>" % (self.id, self.kind, self.status)
+
 ##########################################################################
 ## Time Series Information
 ##########################################################################
@@ -78,21 +111,54 @@ class Series(db.Model):
                                   lazy='dynamic', cascade='all')
     states      = db.relationship('StateSeries', backref='series',
                                   lazy='dynamic', cascade='all')
+    array       = db.relationship('SeriesArray', backref='series',
+                                  uselist=False, cascade='all')
 
     def __repr__(self):
         return "<Series %s>" % self.blsid
 
 
+def period_ordinal(context):
+    """
+    Default for the month of a record: the month ordinal of its period.
+    """
+    return ordinal(context.current_parameters['period'])
+
+
+def series_source(context):
+    """
+    Default for the source of a record: the source of its series.
+    """
+    query = select([Series.source]).where(
+        Series.id == context.current_parameters['series_id']
+    )
+    return context.connection.execute(query).scalar()
+
+
 class SeriesRecord(db.Model):
     """
     Stores individual data points for each time series.
+
+    In production the table is partitioned by the source of the series,
+    which is denormalized onto every record (see `elmr.partitions`).
     """
 
     __tablename__ = "records"
+    __table_args__ = (
+        # Series reads filter by series (and source, for partition pruning)
+        # and order by month; including the value and the source lets them
+        # be answered by an index only scan.
+        db.Index("records_series_month_value_idx",
+                 "series_id", "month", "value", "source"),
+    )
 
     id          = db.Column(db.Integer, primary_key=True)
     series_id   = db.Column(db.Integer, db.ForeignKey('series.id'))
+    source      = db.Column(db.Unicode(255), nullable=False,
+                            default=series_source)
     period      = db.Column(db.Date, nullable=False, index=True)
+    month       = db.Column(db.Integer, nullable=False,
+                            default=period_ordinal)
     value       = db.Column(db.Float, nullable=False)
     footnote    = db.Column(db.Unicode(255), nullable=True)
 
@@ -101,6 +167,29 @@ class SeriesRecord(db.Model):
         return ("<Record for %s - %0.2f on %s>" %
                 (self.series.blsid, self.value, my))
 
+
+class SeriesArray(db.Model):
+    """
+    Stores every monthly value of a series in a single row, as an array
+    that begins at the month ordinal in start (NULL for missing months).
+    An alternative to the row per data point layout of records, see
+    `elmr.arrays`.
+    """
+
+    __tablename__ = "series_arrays"
+
+    series_id   = db.Column(db.Integer, db.ForeignKey('series.id',
+                            ondelete='CASCADE'), primary_key=True)
+    start       = db.Column(db.Integer, nullable=False)
+    data        = db.Column(ARRAY(db.Float), nullable=False)
+    updated     = db.Column(db.DateTime(timezone=True), nullable=False,
+                            default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self):
+        return "<SeriesArray for series %i with %i months>" % (
+            self.series_id, len(self.data)
+        )
+
 ##########################################################################
 ## Per-State Information
 ##########################################################################
@@ -152,6 +241,13 @@ class StateSeries(db.Model):
     """
 
     __tablename__ = "states_series"
+    __table_args__ = (
+        # The classification of each series is looked up by the series, and
+        # the series of a dataset by the source, slug and state.
+        db.Index("states_series_series_idx", "series_id", unique=True),
+        db.Index("states_series_lookup_idx",
+                 "source", "slug", "state_id", "adjusted"),
+    )
 
     id          = db.Column(db.Integer, primary_key=True)
     state_id    = db.Column(db.Integer, db.ForeignKey('usa_states.id'))
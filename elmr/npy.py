@@ -0,0 +1,131 @@
+# elmr.npy
+# Binary NumPy (.npy) responses for bulk data export
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 11:02:37 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: npy.py [] benjamin@bengfort.com $
+
+"""
+Binary NumPy (.npy) responses for bulk data export.
+
+Analysts that pull whole sources or geographic datasets into pandas can ask
+for an `application/x-npy` response (either with the Accept header or with
+`format=npy`) and load the body directly with `numpy.load` rather than
+parsing JSON or CSV. Values are float64 with NaN for missing months, and a
+small JSON header describing the axes is returned in `X-ELMR-Meta`:
+
+    >>> response = requests.get(url, headers={"Accept": NPY_MIMETYPE})
+    >>> values = np.load(io.BytesIO(response.content))
+    >>> meta = json.loads(response.headers["X-ELMR-Meta"])
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import io
+import json
+import numpy as np
+
+from flask import request, make_response
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+JSON_MIMETYPE = "application/json"
+NPY_MIMETYPE  = "application/x-npy"
+META_HEADER   = "X-ELMR-Meta"
+
+##########################################################################
+## Content Negotiation
+##########################################################################
+
+
+def wants_npy(fmt=None):
+    """
+    Returns True if the request asked for a NumPy response, either by passing
+    `format=npy` or by preferring the NumPy mimetype in the Accept header.
+    """
+    if fmt == "npy":
+        return True
+
+    accept = request.accept_mimetypes
+    return accept.best_match([JSON_MIMETYPE, NPY_MIMETYPE]) == NPY_MIMETYPE
+
+##########################################################################
+## Array Construction
+##########################################################################
+
+
+def to_array(rows, start=None, length=None):
+    """
+    Expects a sequence of (month index, value) rows as returned by a query
+    on the `month` of the records (see `elmr.ordinal.ordinal_column`) and
+    returns the month index of the first element along with a float64 array
+    that is NaN where months are missing.
+    """
+    data = np.array(rows, dtype=np.float64).reshape(-1, 2)
+    idx  = data[:, 0].astype(np.int64)
+
+    if start is None:
+        start = int(idx.min()) if len(idx) else 0
+
+    idx = idx - start
+    if length is None:
+        length = int(idx.max()) + 1 if len(idx) else 0
+
+    values = np.full(length, np.nan)
+    mask   = (idx >= 0) & (idx < length)
+    values[idx[mask]] = data[mask, 1]
+
+    return start, values
+
+
+def to_matrix(columns):
+    """
+    Expects a list of sequences of (month index, value) rows and returns the
+    month index of the first period along with a 2D float64 array with one
+    row per period and one column per sequence, aligned on the period.
+    """
+    columns = [np.array(rows, dtype=np.float64).reshape(-1, 2) for rows in columns]
+    indices = [col[:, 0] for col in columns if len(col) > 0]
+
+    if not indices:
+        return 0, np.full((0, len(columns)), np.nan)
+
+    start  = int(min(idx.min() for idx in indices))
+    length = int(max(idx.max() for idx in indices)) - start + 1
+    matrix = np.full((length, len(columns)), np.nan)
+
+    for jdx, col in enumerate(columns):
+        _, matrix[:, jdx] = to_array(col, start, length)
+
+    return start, matrix
+
+##########################################################################
+## Response Helpers
+##########################################################################
+
+
+def npy_response(array, meta, filename):
+    """
+    Serializes the array in the .npy format and returns a Flask response
+    with the JSON metadata in the `X-ELMR-Meta` header.
+    """
+    meta = dict(meta)
+    meta["shape"] = list(array.shape)
+    meta["dtype"] = array.dtype.str
+
+    buf = io.BytesIO()
+    np.save(buf, array)
+
+    output = make_response(buf.getvalue())
+    output.headers["Content-Type"] = NPY_MIMETYPE
+    output.headers["Content-Disposition"] = "attachment; filename=%s.npy" % filename
+    output.headers[META_HEADER] = json.dumps(meta)
+    return output
@@ -0,0 +1,170 @@
+# elmr.ordinal
+# Integer month ordinals, the canonical representation of a period
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 11:03:25 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: ordinal.py [] benjamin@bengfort.com $
+
+"""
+Integer month ordinals, the canonical representation of a period.
+
+Every period in ELMR is a month, so a period is fully described by the
+number of months since year zero (year * 12 + month - 1); consecutive months
+have consecutive ordinals. Records store the ordinal alongside the date in
+the `month` column, so that alignment, gaps, range checks and differences in
+months are integer arithmetic rather than date manipulation:
+
+    >>> ordinal(date(2008, 9, 1))
+    24104
+    >>> label(24104 + 4)
+    'Jan 2009'
+
+The display and ISO labels of every month from 1900 through 2099 are
+precomputed, so labelling a series is an array lookup instead of a call to
+strftime for every data point.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from datetime import date
+from sqlalchemy import Integer, cast, extract
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Abbreviated month names, the same as strftime("%b") in the C locale
+MONTHS   = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+            "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+DISPLAY_FMT = "%s %04i"     # e.g. Sep 2008, as strftime("%b %Y")
+ISO_FMT     = "%04i-%02i"   # e.g. 2008-09, ISO 8601 year and month
+
+## The years of the precomputed label tables
+FIRST_YEAR  = 1900
+LAST_YEAR   = 2099
+
+## Offset of datetime64[M] (months since 1970) from the ordinal
+EPOCH_OFFSET = 1970 * 12
+
+##########################################################################
+## Scalar Conversion
+##########################################################################
+
+
+def ordinal(period):
+    """
+    Returns the month ordinal of a date (or datetime).
+    """
+    return period.year * 12 + period.month - 1
+
+
+def from_ordinal(idx):
+    """
+    Returns the date of the first day of the month of an ordinal.
+    """
+    idx = int(idx)
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def ordinal_column(column):
+    """
+    Returns a SQL expression that computes the month ordinal of a date
+    column in the database, e.g. to backfill the `month` of records.
+    """
+    year  = extract('year', column)
+    month = extract('month', column)
+    return cast(year * 12 + month - 1, Integer)
+
+##########################################################################
+## Vectorized Conversion
+##########################################################################
+
+
+def ordinals(periods):
+    """
+    Returns an int64 array of the month ordinals of a sequence of dates.
+    """
+    months = np.asarray(periods, dtype='datetime64[M]')
+    return months.astype(np.int64) + EPOCH_OFFSET
+
+
+def datetimes(ordinals):
+    """
+    Returns a datetime64[M] array of the months of an array of ordinals.
+    """
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    return (ordinals - EPOCH_OFFSET).astype('datetime64[M]')
+
+
+def years(ordinals):
+    """
+    Returns the year of each ordinal in an array.
+    """
+    return np.asarray(ordinals, dtype=np.int64) // 12
+
+
+def months(ordinals):
+    """
+    Returns the month (1 - 12) of each ordinal in an array.
+    """
+    return np.asarray(ordinals, dtype=np.int64) % 12 + 1
+
+##########################################################################
+## Label Tables
+##########################################################################
+
+FIRST_ORDINAL = FIRST_YEAR * 12
+LAST_ORDINAL  = LAST_YEAR * 12 + 11
+
+DISPLAY_LABELS = np.array([
+    DISPLAY_FMT % (MONTHS[idx % 12], idx // 12)
+    for idx in xrange(FIRST_ORDINAL, LAST_ORDINAL + 1)
+], dtype=object)
+
+ISO_LABELS = np.array([
+    ISO_FMT % (idx // 12, idx % 12 + 1)
+    for idx in xrange(FIRST_ORDINAL, LAST_ORDINAL + 1)
+], dtype=object)
+
+
+def label(idx):
+    """
+    Returns the display label of an ordinal, e.g. Sep 2008.
+    """
+    if FIRST_ORDINAL <= idx <= LAST_ORDINAL:
+        return DISPLAY_LABELS[idx - FIRST_ORDINAL]
+    return DISPLAY_FMT % (MONTHS[idx % 12], idx // 12)
+
+
+def iso_label(idx):
+    """
+    Returns the ISO 8601 year and month of an ordinal, e.g. 2008-09.
+    """
+    if FIRST_ORDINAL <= idx <= LAST_ORDINAL:
+        return ISO_LABELS[idx - FIRST_ORDINAL]
+    return ISO_FMT % (idx // 12, idx % 12 + 1)
+
+
+def labels(ordinals, table=DISPLAY_LABELS):
+    """
+    Returns the list of labels of an array of ordinals, looked up in the
+    table (the display labels by default, or ISO_LABELS).
+    """
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    if not len(ordinals):
+        return []
+
+    if ordinals.min() < FIRST_ORDINAL or ordinals.max() > LAST_ORDINAL:
+        single = label if table is DISPLAY_LABELS else iso_label
+        return [single(int(idx)) for idx in ordinals]
+
+    return table[ordinals - FIRST_ORDINAL].tolist()
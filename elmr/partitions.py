@@ -0,0 +1,188 @@
+# elmr.partitions
+# Management of the partitions of the records table by source
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 15:24:50 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: partitions.py [] benjamin@bengfort.com $
+
+"""
+Management of the partitions of the records table by source.
+
+Since migration 014 the records table is partitioned by the source of each
+record's series (`records_cps`, `records_laus`, `records_cps_analysis` and so
+on, plus `records_default`), so that maintenance of one source never touches
+the others and reads that filter on the source only scan its partition.
+
+A whole source can be reloaded without readers ever seeing a partial load:
+the new records are written into a detached staging table which then
+replaces the source's partition in a single transaction:
+
+    $ bin/elmr-admin.py ingest --source LAUS --reload
+
+These functions require the partitioned table (PostgreSQL 11 or later).
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import re
+import csv
+import elmr
+
+from StringIO import StringIO
+from sqlalchemy import text
+from elmr.ordinal import ordinal
+from elmr.signals import series_changed
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+PARENT   = "records"
+SOURCERE = re.compile(r'^[A-Z0-9][A-Z0-9\-]*$')
+
+PARTITIONED_SQL = text("""
+    SELECT relkind = 'p' FROM pg_class
+     WHERE oid = to_regclass(:parent)
+""")
+
+PARTITIONS_SQL  = text("""
+    SELECT c.relname,
+           pg_get_expr(c.relpartbound, c.oid) AS bound,
+           c.reltuples::bigint AS estimated_rows,
+           pg_total_relation_size(c.oid) AS total_size
+      FROM pg_inherits i
+      JOIN pg_class c ON c.oid = i.inhrelid
+     WHERE i.inhparent = to_regclass(:parent)
+     ORDER BY c.relname
+""")
+
+## The columns of the records that are loaded into a partition
+COLUMNS  = ("series_id", "source", "period", "month", "value", "footnote")
+
+##########################################################################
+## Helper Functions
+##########################################################################
+
+
+def partition_name(source):
+    """
+    Returns the name of the partition of the records of a source, e.g.
+    records_cps_analysis for CPS-ANALYSIS. Raises ValueError if the source
+    cannot be used in a partition bound.
+    """
+    if not SOURCERE.match(source or ""):
+        raise ValueError("'%s' is not a valid source for a partition" % source)
+    return "%s_%s" % (PARENT, source.lower().replace("-", "_"))
+
+
+def is_partitioned():
+    """
+    Returns True if the records table is partitioned.
+    """
+    result = elmr.db.session.execute(PARTITIONED_SQL, {"parent": PARENT})
+    return bool(result.scalar())
+
+
+def partitions():
+    """
+    Returns the name, bound, estimated rows and total size of every partition
+    of the records table.
+    """
+    result = elmr.db.session.execute(PARTITIONS_SQL, {"parent": PARENT})
+    return [dict(zip(result.keys(), row)) for row in result]
+
+
+def create_partition(source):
+    """
+    Creates the partition for a new source (e.g. county level LAUS) if it
+    does not exist, so that its records are kept apart from the default
+    partition. The default partition must not have records of the source.
+    """
+    name = partition_name(source)
+    elmr.db.session.execute(
+        "CREATE TABLE IF NOT EXISTS %s PARTITION OF %s FOR VALUES IN ('%s')"
+        % (name, PARENT, source)
+    )
+    elmr.db.session.commit()
+    return name
+
+##########################################################################
+## Partition Reload
+##########################################################################
+
+
+def load_partition(source, rows):
+    """
+    Replaces every record of the source with the (series_id, period, value,
+    footnote) rows. The rows are copied into a detached staging table that
+    is then swapped for the source's partition in a single transaction, so
+    readers see either all of the old records or all of the new ones.
+    Returns the number of records that were loaded.
+    """
+    name    = partition_name(source)
+    staging = name + "_staging"
+    session = elmr.db.session
+
+    # The staging table has the columns, defaults and indices of the parent
+    # and a constraint that lets the attach skip its validation scan.
+    session.execute("DROP TABLE IF EXISTS %s" % staging)
+    session.execute(
+        "CREATE TABLE %s (LIKE %s INCLUDING DEFAULTS INCLUDING INDEXES)"
+        % (staging, PARENT)
+    )
+    session.execute(
+        "ALTER TABLE %s ADD CONSTRAINT %s_source_check CHECK (source = '%s')"
+        % (staging, staging, source)
+    )
+
+    # Copy the rows into the staging table, writing floats with repr() so
+    # that none is rounded to the 12 significant digits of str()
+    data   = StringIO()
+    writer = csv.writer(data)
+    count  = 0
+    for series_id, period, value, footnote in rows:
+        writer.writerow((
+            series_id, source, period.isoformat(), ordinal(period),
+            repr(value) if isinstance(value, float) else value,
+            footnote.encode('utf-8') if footnote else "",
+        ))
+        count += 1
+
+    data.seek(0)
+    cursor = session.connection().connection.cursor()
+    cursor.copy_expert(
+        "COPY %s (%s) FROM STDIN WITH CSV" % (staging, ", ".join(COLUMNS)),
+        data
+    )
+
+    # Swap the staging table in for the partition
+    exists = session.execute(
+        "SELECT to_regclass(:name) IS NOT NULL", {"name": name}
+    ).scalar()
+
+    if exists:
+        session.execute("ALTER TABLE %s DETACH PARTITION %s" % (PARENT, name))
+        session.execute("DROP TABLE %s" % name)
+    else:
+        # Records of a source without a partition are in the default one
+        session.execute(
+            text("DELETE FROM %s WHERE source = :source" % PARENT),
+            {"source": source}
+        )
+
+    session.execute("ALTER TABLE %s RENAME TO %s" % (staging, name))
+    session.execute(
+        "ALTER TABLE %s ATTACH PARTITION %s FOR VALUES IN ('%s')"
+        % (PARENT, name, source)
+    )
+    session.execute("ANALYZE %s" % name)
+    session.commit()
+
+    series_changed.send(None)
+    return count
@@ -0,0 +1,160 @@
+# elmr.period
+# Index friendly filtering of records by period
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 19:31:07 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: period.py [] benjamin@bengfort.com $
+
+"""
+Index friendly filtering of records by period.
+
+Records are stored with the first day of their month as the period, so any
+range of months can be expressed as `period BETWEEN start AND end` on the
+raw column, which (unlike `extract('year', period) >= year`) can be answered
+by an index on the period. The last N periods of a series are selected by
+finding the Nth most recent period with a descending scan of the index.
+
+The same predicates work on the integer month ordinal of records (see
+`elmr.ordinal`), in which case the dates are compared as ordinals.
+
+Periods are accepted at year (`2008`) or month (`2008-09`) precision; a year
+starts in January when used as the start of a range, and ends in December
+when used as the end of a range.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import re
+
+from datetime import date
+from sqlalchemy import Integer, func
+from elmr.ordinal import ordinal
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Matches YYYY or YYYY-MM (optionally with a day, which is ignored)
+PERIODRE = re.compile(r'^\s*(\d{4})(?:-(\d{1,2})(?:-\d{1,2})?)?\s*$')
+
+## Earlier than any period, used when there is no cutoff for the last N
+EPOCH    = date(1, 1, 1)
+
+##########################################################################
+## Parsing
+##########################################################################
+
+
+def parse_period(value, end=False):
+    """
+    Parses a year or a year and month into the date of the period. If end
+    is True, a year is the last month of the year, otherwise the first.
+    Dates and integer years are also accepted. Raises ValueError.
+    """
+    if isinstance(value, date):
+        return date(value.year, value.month, 1)
+
+    if isinstance(value, (int, long)):
+        return date(value, 12 if end else 1, 1)
+
+    match = PERIODRE.match(value or "")
+    if match is None:
+        raise ValueError(
+            "Could not parse '%s' as a period, use YYYY or YYYY-MM" % value
+        )
+
+    year, month = match.groups()
+    if month is None:
+        month = 12 if end else 1
+
+    month = int(month)
+    if not 1 <= month <= 12:
+        raise ValueError("'%s' is not a valid month" % value)
+
+    return date(int(year), month, 1)
+
+
+def period_start(value):
+    """
+    Argument type for the start of a period range.
+    """
+    return parse_period(value, end=False)
+
+
+def period_end(value):
+    """
+    Argument type for the end of a period range.
+    """
+    return parse_period(value, end=True)
+
+
+def period_range(start=None, end=None, start_year=None, end_year=None):
+    """
+    Returns the (start, end) dates of a range from the month precision start
+    and end, falling back to the year precision arguments. Either date may
+    be None for an open range.
+    """
+    if start is None and start_year is not None:
+        start = start_year
+    if end is None and end_year is not None:
+        end = end_year
+
+    if start is not None:
+        start = parse_period(start, end=False)
+    if end is not None:
+        end = parse_period(end, end=True)
+
+    return start, end
+
+
+def months(start, end):
+    """
+    Generates the first day of every month from start to end inclusive.
+    """
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield date(year, month, 1)
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+##########################################################################
+## Query Helpers
+##########################################################################
+
+
+def filter_periods(query, column, start=None, end=None, last=None):
+    """
+    Filters the query on the period column with range predicates that can
+    use the index on the column. Start and end are dates (or None) and are
+    converted to ordinals if the column is an integer month ordinal. If last
+    is given, only the last N periods of the range are selected, by finding
+    the earliest of them with a descending scan of the index.
+    """
+    epoch = EPOCH
+    if isinstance(column.type, Integer):
+        epoch = ordinal(EPOCH)
+        start = ordinal(start) if start is not None else None
+        end   = ordinal(end) if end is not None else None
+
+    if start is not None and end is not None:
+        query = query.filter(column.between(start, end))
+    elif start is not None:
+        query = query.filter(column >= start)
+    elif end is not None:
+        query = query.filter(column <= end)
+
+    if last is not None:
+        cutoff = query.with_entities(column).order_by(column.desc())
+        cutoff = cutoff.offset(last - 1).limit(1).correlate(None).as_scalar()
+
+        # With fewer than N periods there is no cutoff and all are selected
+        query  = query.filter(column >= func.coalesce(cutoff, epoch))
+
+    return query
@@ -0,0 +1,234 @@
+# elmr.queries
+# Read-only Core queries for the hot read paths of the API
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 11:20:37 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: queries.py [] benjamin@bengfort.com $
+
+"""
+Read-only Core queries for the hot read paths of the API.
+
+The read endpoints only need the (month, value) pairs of a series, but an
+ORM query builds a Query, compiles it and processes its rows on every call.
+The statements here are plain SQL that is compiled once per combination of
+predicates and executed directly on the session's connection, returning
+plain tuples:
+
+    >>> series_records(1636, start=date(2007, 10, 1))
+    [(24093, 4.7), (24094, 4.7), (24095, 5.0)]
+
+The CPU time of the ORM and the Core reads of a source and of a geography
+dataset can be compared with:
+
+    $ bin/elmr-admin.py querytime --source CPS --dataset unemployment-rate
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import elmr
+
+from threading import Lock
+from sqlalchemy import text
+from elmr.npy import to_array
+from elmr.period import EPOCH, filter_periods
+from elmr.ordinal import ordinal
+from elmr.models import SeriesRecord
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## The (month, value) pairs of a series, optionally limited to the last N
+## months of the range with a descending scan of the index
+RECORDS_SQL = "SELECT month, value FROM records WHERE %(where)s"
+CUTOFF_SQL  = (
+    "month >= coalesce((SELECT month FROM records WHERE %(where)s "
+    "ORDER BY month DESC OFFSET :offset LIMIT 1), :epoch)"
+)
+
+## The predicates on the records for each of the optional arguments
+PREDICATES  = (
+    ("source", "source = :source"),
+    ("start", "month >= :start"),
+    ("end", "month <= :end"),
+)
+
+## The first value and the array of values of a series
+ARRAY_SQL   = "SELECT start, data FROM series_arrays WHERE series_id = :series_id"
+
+## The records of many series in a window of months, e.g. the cross section
+## of the states of a geographic dataset at a period
+SECTION_SQL = (
+    "SELECT series_id, month, value FROM records "
+    "WHERE series_id = ANY(:series_ids) AND source = ANY(:sources) "
+    "AND month >= :start AND month <= :end"
+)
+
+##########################################################################
+## Compiled Statements
+##########################################################################
+
+statements = {}
+compiling  = Lock()
+
+
+def compiled(key, build):
+    """
+    Returns the statement for the key, compiling the SQL returned by build()
+    for the database dialect the first time it is requested.
+    """
+    statement = statements.get(key)
+    if statement is None:
+        statement = text(build()).compile(dialect=elmr.db.engine.dialect)
+        with compiling:
+            statements[key] = statement
+    return statement
+
+
+def records_sql(source=False, start=False, end=False, last=False):
+    """
+    Returns the SQL that selects the records of a series with the predicates
+    of the arguments that are True.
+    """
+    flags = {"source": source, "start": start, "end": end}
+    where = ["series_id = :series_id"]
+    where.extend(pred for name, pred in PREDICATES if flags[name])
+    where = " AND ".join(where)
+
+    if last:
+        where = "%s AND %s" % (where, CUTOFF_SQL % {"where": where})
+
+    return RECORDS_SQL % {"where": where}
+
+##########################################################################
+## Queries
+##########################################################################
+
+
+def execute(statement, params):
+    """
+    Executes a compiled statement on the connection of the session (so it
+    sees the session's uncommitted writes) and returns the rows as tuples.
+    """
+    connection = elmr.db.session.connection()
+    return [tuple(row) for row in connection.execute(statement, params)]
+
+
+def series_records(series_id, start=None, end=None, last=None, source=None):
+    """
+    Returns the (month ordinal, value) pairs of the series, optionally
+    limited to the periods between the start and end dates and to the last
+    N periods, in no particular order. Passing the source of the series lets
+    the database only scan that source's records partition.
+    """
+    params = {"series_id": series_id}
+    if source is not None:
+        params["source"] = source
+    if start is not None:
+        params["start"] = ordinal(start)
+    if end is not None:
+        params["end"] = ordinal(end)
+    if last is not None:
+        params["offset"] = last - 1
+        params["epoch"]  = ordinal(EPOCH)
+
+    key = ("records", source is not None, start is not None,
+           end is not None, last is not None)
+    statement = compiled(key, lambda: records_sql(*key[1:]))
+    return execute(statement, params)
+
+
+def series_array_row(series_id):
+    """
+    Returns the (start, data) of the array of the series or None.
+    """
+    statement = compiled(("array",), lambda: ARRAY_SQL)
+    rows = execute(statement, {"series_id": series_id})
+    return rows[0] if rows else None
+
+
+def cross_section(series_ids, sources, start, end):
+    """
+    Returns the (series id, month ordinal, value) of the records of all of
+    the series between the start and end month ordinals (inclusive) with a
+    single query, in no particular order. The sources of the series limit
+    the scan to their records partitions, and the (series_id, month) index
+    answers the query without reading the rest of each series.
+    """
+    if not series_ids:
+        return []
+
+    statement = compiled(("section",), lambda: SECTION_SQL)
+    return execute(statement, {
+        "series_ids": list(series_ids),
+        "sources": sorted(set(sources)),
+        "start": start,
+        "end": end,
+    })
+
+##########################################################################
+## Benchmark
+##########################################################################
+
+
+def orm_series_records(series_id, start=None, end=None, last=None,
+                       source=None):
+    """
+    Reads the records of a series with an ORM query, as the read path did
+    before the Core queries, for comparison in the benchmark.
+    """
+    records = SeriesRecord.query.filter_by(series_id=series_id)
+    if source is not None:
+        records = records.filter_by(source=source)
+    records = filter_periods(records, SeriesRecord.month, start, end, last)
+    records = records.with_entities(SeriesRecord.month, SeriesRecord.value)
+    return records.all()
+
+
+def benchmark(source="CPS", dataset=None, geo_source="LAUS", repeat=3):
+    """
+    Compares the CPU time of reading every series that the source endpoint
+    and the geography dataset (a slug, e.g. unemployment-rate) read, with
+    the ORM and with the Core queries. Returns a dictionary with the number
+    of series and the best CPU time in seconds of each read.
+    """
+    from elmr.catalog import get_catalog
+    from elmr.fips import get_period_range, get_state_series
+
+    catalog = get_catalog()
+    start, end = get_period_range()
+
+    workloads = [("source", [(s.id, s.source) for s in catalog.source(source)])]
+    if dataset is not None:
+        states = [
+            get_state_series(state, geo_source, dataset)
+            for state in catalog.states
+        ]
+        workloads.append(
+            ("geography", [(s.id, s.source) for s in states if s is not None])
+        )
+
+    results = {}
+    for name, series in workloads:
+        results[name] = {"series": len(series)}
+        for reader in (orm_series_records, series_records):
+            best = None
+            for _ in xrange(repeat):
+                begin   = time.clock()
+                for series_id, series_source in series:
+                    to_array(reader(series_id, start, end,
+                                    source=series_source))
+                elapsed = time.clock() - begin
+                best    = elapsed if best is None else min(best, elapsed)
+
+            label = "orm" if reader is orm_series_records else "core"
+            results[name][label] = best
+
+    return results
@@ -0,0 +1,166 @@
+# elmr.regions
+# Aggregation of the state series by BEA region
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 15:26:09 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: regions.py [] benjamin@bengfort.com $
+
+"""
+Aggregation of the state series by BEA region.
+
+Every state belongs to one of the eight BEA regions (`USAState.region`,
+see `fixtures/regions.json`). The regional series of a geographic dataset
+are computed from the matrix of its state series in a single pass: levels
+(labor force, employment) are summed over the states of the region, and
+rates are averaged weighted by the level they are a rate of, e.g. the
+unemployment rate by the labor force:
+
+    >>> result = region_series("LAUS", "unemployment-rate")
+    >>> [name for name, _, _ in result["regions"]]
+    [u'Far West', u'Great Lakes', u'Mideast', ...]
+
+A region has no value for a month if any of its states has no value (or
+no weight) for that month. The regional series are cached until the next
+ingestion or series change (see `elmr.signals`).
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+import numpy as np
+
+from elmr.cache import Cache
+from elmr.npy import to_matrix
+from elmr.catalog import get_catalog
+from elmr.fips import get_state_series
+from elmr.store import series_array, array_rows
+from elmr.signals import ingestion_finished, series_changed
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## The datasets that are rates, mapped to the dataset of their weights
+RATES  = {
+    "unemployment-rate": "labor-force",
+}
+
+## Aggregation methods of levels and of rates
+SUM    = "sum"
+WMEAN  = "weighted mean"
+
+##########################################################################
+## Aggregation
+##########################################################################
+
+
+def aggregate(members, values, weights=None):
+    """
+    Aggregates a matrix of values with one row per state and one column per
+    month into one row per region, where members is the 0/1 matrix of the
+    states (columns) of each region (rows). Values are summed, or averaged
+    by the weights of the same shape. Months where any state of a region
+    has no value or weight are NaN.
+    """
+    missing = np.isnan(values)
+    if weights is not None:
+        missing |= np.isnan(weights)
+
+    incomplete = members.dot(missing) > 0
+
+    values = np.where(missing, 0.0, values)
+    if weights is None:
+        result = members.dot(values)
+    else:
+        weights = np.where(missing, 0.0, weights)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = members.dot(values * weights) / members.dot(weights)
+
+    result[incomplete] = np.nan
+    return result
+
+
+def compute_regions(source, slug, adjusted=True):
+    """
+    Computes the regional series of the geographic dataset from the series
+    of the states. Returns a dictionary of the aggregation method, the
+    dataset of the weights (or None), the month index of the first period,
+    and a list of the (region, number of states, values) of each region
+    that has states with the dataset, ordered by region name.
+    """
+    weight = RATES.get(slug)
+    states = []
+    series = []
+
+    for state in get_catalog().states:
+        if not state.region:
+            continue
+
+        found = [get_state_series(state, source, slug, adjusted)]
+        if weight is not None:
+            found.append(get_state_series(state, source, weight, adjusted))
+        if None in found:
+            continue
+
+        states.append(state)
+        series.append(found)
+
+    result = {
+        "method": WMEAN if weight is not None else SUM,
+        "weights": weight,
+        "first": 0,
+        "regions": [],
+    }
+
+    if not states:
+        return result
+
+    # Align the values (and the weights) of all of the states at once
+    width   = len(series[0])
+    first, matrix = to_matrix([
+        array_rows(*series_array(s.id, source=s.source))
+        for found in series for s in found
+    ])
+    matrix  = matrix.T.reshape(len(states), width, matrix.shape[0])
+
+    names   = sorted(set(state.region for state in states))
+    members = np.array([
+        [state.region == name for state in states] for name in names
+    ], dtype=np.float64)
+
+    values  = aggregate(
+        members, matrix[:, 0, :], matrix[:, 1, :] if width > 1 else None
+    )
+
+    result["first"]   = first
+    result["regions"] = [
+        (name, int(members[idx].sum()), values[idx])
+        for idx, name in enumerate(names)
+    ]
+    return result
+
+##########################################################################
+## Cached Regions
+##########################################################################
+
+regions = Cache(int(elmr.app.config['CACHE_TIMEOUT']))
+ingestion_finished.connect(regions.clear)
+series_changed.connect(regions.clear)
+
+
+def region_series(source, slug, adjusted=True):
+    """
+    Returns the cached regional series of the geographic dataset (see
+    compute_regions), computing them on the first request after an
+    ingestion.
+    """
+    return regions.get(
+        (source, slug, adjusted),
+        lambda: compute_regions(source, slug, adjusted)
+    )
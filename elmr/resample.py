@@ -0,0 +1,203 @@
+# elmr.resample
+# Vectorized resampling and downsampling of monthly time series
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 18:20:33 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: resample.py [] benjamin@bengfort.com $
+
+"""
+Vectorized resampling and downsampling of monthly time series.
+
+Charts rarely need every month of a series, so the API can aggregate the
+monthly values to a lower frequency (quarterly or annual by the mean, last
+or sum of the months in the period) and/or reduce the series to at most
+`max_points` points with the Largest Triangle Three Buckets (LTTB) method,
+which keeps the visual shape of the series (peaks and troughs) intact.
+
+Both operate on the float64 value arrays built by `elmr.npy.to_array`, in
+which a value's position is its offset in months from the start and gaps
+are NaN.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import numpy as np
+
+from elmr.columnar import month_label
+from elmr.ordinal import label
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Number of months in a period of each frequency
+FREQUENCIES = {
+    "monthly": 1,
+    "quarterly": 3,
+    "annual": 12,
+}
+
+AGGREGATES  = ("mean", "last", "sum")   # Methods to aggregate the months
+MONTHLY     = "monthly"                 # The native frequency of the data
+
+##########################################################################
+## Period Labels
+##########################################################################
+
+
+def period_label(index, frequency=MONTHLY):
+    """
+    Returns the ISO style label for the period starting at the month index,
+    e.g. 2008-09 (monthly), 2008-Q3 (quarterly) or 2008 (annual).
+    """
+    if frequency == "annual":
+        return "%04i" % (index // 12)
+    if frequency == "quarterly":
+        return "%04i-Q%i" % (index // 12, index % 12 // 3 + 1)
+    return month_label(index)
+
+
+def period_display(index, frequency=MONTHLY):
+    """
+    Returns the human readable label for the period starting at the month
+    index, e.g. Sep 2008 (monthly), Q3 2008 (quarterly) or 2008 (annual).
+    """
+    year = index // 12
+    if frequency == "annual":
+        return "%i" % year
+    if frequency == "quarterly":
+        return "Q%i %i" % (index % 12 // 3 + 1, year)
+
+    return label(index)
+
+##########################################################################
+## Resampling
+##########################################################################
+
+
+def resample(start, values, frequency=MONTHLY, how="mean"):
+    """
+    Aggregates a monthly value array that begins at month index start to
+    the given frequency. Returns the month index of the first period and
+    the aggregated array. Periods that are only partially covered by the
+    data are aggregated from the months that are present, periods with no
+    data at all are NaN.
+    """
+    if frequency not in FREQUENCIES:
+        raise ValueError("Unknown frequency '%s'" % frequency)
+
+    if how not in AGGREGATES:
+        raise ValueError("Unknown aggregate '%s'" % how)
+
+    values = np.asarray(values, dtype=np.float64)
+    step   = FREQUENCIES[frequency]
+    if step == 1 or len(values) == 0:
+        return start, values
+
+    # Pad the array with NaN so that it covers whole periods
+    head   = start % step
+    tail   = -(head + len(values)) % step
+    blocks = np.concatenate((
+        np.full(head, np.nan), values, np.full(tail, np.nan)
+    )).reshape(-1, step)
+
+    mask   = ~np.isnan(blocks)
+    counts = mask.sum(axis=1)
+    empty  = counts == 0
+
+    if how == "last":
+        # Position of the last present month in each period
+        last   = step - 1 - np.argmax(mask[:, ::-1], axis=1)
+        result = blocks[np.arange(len(blocks)), last]
+    else:
+        result = np.where(mask, blocks, 0.0).sum(axis=1)
+        if how == "mean":
+            result = result / np.maximum(counts, 1)
+
+    result[empty] = np.nan
+    return start - head, result
+
+##########################################################################
+## Downsampling
+##########################################################################
+
+
+def lttb(values, threshold):
+    """
+    Largest Triangle Three Buckets downsampling. Returns the sorted indices
+    of at most threshold points of the value array (ignoring NaN) that best
+    preserve the shape of the series. The first and last points are always
+    kept; within each bucket the point forming the largest triangle with the
+    previously selected point and the average of the next bucket is chosen.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    index  = np.flatnonzero(~np.isnan(values))
+
+    if threshold is None or len(index) <= threshold:
+        return index
+
+    if threshold < 3:
+        return index[[0, -1]][:max(threshold, 0)]
+
+    x = index.astype(np.float64)
+    y = values[index]
+
+    # Bucket boundaries for every point except the first and last
+    edges    = np.linspace(1, len(index) - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0]  = 0
+    selected[-1] = len(index) - 1
+
+    prev = 0
+    for bucket in xrange(threshold - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+
+        # The average of the next bucket (or the last point)
+        if bucket + 2 < len(edges):
+            nlo, nhi = edges[bucket + 1], edges[bucket + 2]
+            cx, cy   = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        else:
+            cx, cy   = x[-1], y[-1]
+
+        # Twice the area of the triangles for every point in the bucket
+        areas = np.abs(
+            (x[prev] - cx) * (y[lo:hi] - y[prev]) -
+            (x[prev] - x[lo:hi]) * (cy - y[prev])
+        )
+
+        prev = lo + int(np.argmax(areas))
+        selected[bucket + 1] = prev
+
+    return index[selected]
+
+
+def periods(start, values, offsets=None, frequency=MONTHLY):
+    """
+    Returns the month index of the period of each value in the array, given
+    the offsets returned by `downsample` (or None for consecutive periods).
+    """
+    if offsets is None:
+        offsets = np.arange(len(values))
+    return start + FREQUENCIES[frequency] * np.asarray(offsets, dtype=np.int64)
+
+
+def downsample(start, values, frequency=MONTHLY, how="mean", max_points=None):
+    """
+    Resamples the monthly value array to the frequency, then downsamples it
+    to at most max_points points. Returns the month index of the first
+    period, the array of values and the array of offsets of each value (in
+    periods from the first period), or None if every period is included.
+    """
+    start, values = resample(start, values, frequency, how)
+
+    if max_points is None or max_points >= len(values):
+        return start, values, None
+
+    offsets = lttb(values, max_points)
+    return start, values[offsets], offsets
@@ -0,0 +1,221 @@
+# elmr.schedule
+# Schedules ingestion of each source by the BLS release calendar
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 09:14:32 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: schedule.py [] benjamin@bengfort.com $
+
+"""
+Schedules ingestion of each source by the BLS release calendar.
+
+BLS publishes each source on a fixed release: CPS and CESN with the
+Employment Situation on the first Friday of the month, LAUS and CESSM with
+State Employment and Unemployment later in the month. The dates are kept in
+a locally maintained calendar file (`fixtures/calendar.json` by default),
+which maps the reference period of each release to its release date:
+
+    {
+      "releases": [
+        {
+          "name": "The Employment Situation",
+          "sources": ["CPS", "CESN"],
+          "schedule": {"2015-05": "2015-06-05", ...}
+        }
+      ]
+    }
+
+A source is due once a release date has passed and the database does not
+yet have that release's period for the source. Running the scheduler often
+(e.g. hourly from cron) enqueues an ingestion job for only the due sources,
+and retries (at most once per `SCHEDULE_RETRY` seconds) until the new period
+appears, since BLS data is not always available through the API the moment
+it is released.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import elmr
+
+from sqlalchemy import func
+from datetime import date, datetime, timedelta
+from elmr.models import Job, Series, SeriesRecord
+from elmr.period import parse_period
+from elmr.jobs import QUEUED, RUNNING, enqueue
+
+##########################################################################
+## Release Calendar
+##########################################################################
+
+
+class Release(object):
+    """
+    A BLS release: the sources it publishes and the release date of each
+    reference period, e.g. the Employment Situation.
+    """
+
+    def __init__(self, name, sources, schedule):
+        self.name     = name
+        self.sources  = tuple(sources)
+        self.schedule = sorted(
+            (parse_period(period), parse_date(released))
+            for period, released in schedule.items()
+        )
+
+    def latest(self, today):
+        """
+        Returns the (period, released) of the latest release on or before
+        today, or None if nothing in the calendar has been released yet.
+        """
+        released = [item for item in self.schedule if item[1] <= today]
+        if not released:
+            return None
+        return max(released, key=lambda item: item[1])
+
+    def upcoming(self, today):
+        """
+        Returns the (period, released) of the next release after today, or
+        None if the calendar has run out (and needs to be updated).
+        """
+        upcoming = [item for item in self.schedule if item[1] > today]
+        if not upcoming:
+            return None
+        return min(upcoming, key=lambda item: item[1])
+
+
+class ReleaseCalendar(object):
+    """
+    The releases of every source, loaded from the calendar file.
+    """
+
+    @classmethod
+    def load(klass, path=None):
+        """
+        Loads the calendar from the path (the RELEASE_CALENDAR setting).
+        """
+        path = path or elmr.app.config['RELEASE_CALENDAR']
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        return klass([
+            Release(release['name'], release['sources'], release['schedule'])
+            for release in data['releases']
+        ])
+
+    def __init__(self, releases):
+        self.releases = list(releases)
+        self.sources  = {}
+
+        for release in self.releases:
+            for source in release.sources:
+                if source in self.sources:
+                    raise ValueError(
+                        "Source '%s' is in more than one release" % source
+                    )
+                self.sources[source] = release
+
+    def release(self, source):
+        """
+        Returns the release that publishes the source.
+        """
+        return self.sources[source]
+
+##########################################################################
+## Helper Functions
+##########################################################################
+
+
+def parse_date(value):
+    """
+    Parses a YYYY-MM-DD release date.
+    """
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def latest_period(source):
+    """
+    Returns the latest period in the database for the source, or None.
+    """
+    query = elmr.db.session.query(func.max(SeriesRecord.period))
+    query = query.join(Series).filter(Series.source == source)
+    return query.scalar()
+
+
+def recent_jobs(since):
+    """
+    Returns the ingestion jobs that are still pending or that were created
+    after since, along with the sources that each of them ingests.
+    """
+    jobs = Job.query.filter_by(kind=u"ingest").filter(
+        (Job.status.in_((QUEUED, RUNNING))) | (Job.created >= since)
+    )
+
+    for job in jobs:
+        params = json.loads(job.params or "{}")
+        yield job, params.get("sources") or []
+
+##########################################################################
+## Scheduling
+##########################################################################
+
+
+def due_sources(calendar=None, today=None):
+    """
+    Returns a list of (source, period, released) for every source with a
+    release on or before today whose period is not yet in the database.
+    """
+    calendar = calendar or ReleaseCalendar.load()
+    today    = today or date.today()
+    due      = []
+
+    for source in sorted(calendar.sources):
+        latest = calendar.release(source).latest(today)
+        if latest is None:
+            continue
+
+        period, released = latest
+        current = latest_period(source)
+        if current is None or current < period:
+            due.append((source, period, released))
+
+    return due
+
+
+def schedule(calendar=None, today=None, now=None, retry=None, dryrun=False):
+    """
+    Enqueues an ingestion job for the sources that are due, skipping any
+    source that is already being ingested or that was tried less than retry
+    seconds ago. Returns the job (None if nothing is due) and the list of
+    (source, period, released) that it ingests.
+    """
+    now   = now or datetime.now()
+    retry = int(retry or elmr.app.config['SCHEDULE_RETRY'])
+    due   = due_sources(calendar, today)
+
+    # Sources that an ingestion is pending for or was recently tried
+    tried = set()
+    for job, sources in recent_jobs(now - timedelta(seconds=retry)):
+        tried.update(sources)
+
+    due = [item for item in due if item[0] not in tried]
+    if not due or dryrun:
+        return None, due
+
+    # Fetch from the year before the earliest period to pick up revisions
+    job = enqueue(
+        u"ingest",
+        sources=[source for source, _, _ in due],
+        startyear=min(period.year for _, period, _ in due) - 1,
+        endyear=max(period.year for _, period, _ in due),
+        title=u"ELMR Scheduled Ingestion of %s" % ", ".join(
+            source for source, _, _ in due
+        ),
+    )
+
+    return job, due
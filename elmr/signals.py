@@ -0,0 +1,39 @@
+# elmr.signals
+# Signals that are sent when the data behind the API changes
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 13:21:09 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: signals.py [] benjamin@bengfort.com $
+
+"""
+Signals that are sent when the data behind the API changes.
+
+Anything that caches data derived from the database in process should
+connect to these signals and invalidate itself when they are sent, e.g.:
+
+    @ingestion_finished.connect
+    def clear_my_cache(sender, **kwargs):
+        my_cache.clear()
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from blinker import Namespace
+
+##########################################################################
+## Signals
+##########################################################################
+
+signals = Namespace()
+
+# Sent with the IngestionRecord as the sender when an ingestion completes
+ingestion_finished = signals.signal('ingestion-finished')
+
+# Sent with the Series as the sender when series are created or modified
+series_changed = signals.signal('series-changed')
@@ -0,0 +1,325 @@
+# elmr.snapshot
+# Pre-renders every public API response to precompressed static files
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 16:55:12 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: snapshot.py [] benjamin@bengfort.com $
+
+"""
+Pre-renders every public API response to precompressed static files.
+
+The ELMR data only changes monthly, so after ingestion every response of
+the read API can be rendered once into a versioned snapshot directory:
+
+    snapshots/
+        current -> 0007-20150410T021428
+        0007-20150410T021428/
+            api/source/cps/index.json
+            api/source/cps/index.json.gz
+            api/geo/laus/unemployment-rate/index.is_delta=false.csv
+            ...
+
+Each response is stored at the path of the request, in a file named
+`index.<query>.<ext>` where the query is the sorted query string, or simply
+`index.<ext>` if there is no query. Paths are case sensitive, as BLS IDs
+are in the API; since sources are not, the paths of a source are rendered
+both as the source and in lowercase (e.g. `/api/geo/LAUS/` and
+`/api/geo/laus/`). The snapshot can be served by
+the app itself (set `ELMR_SERVE_SNAPSHOT`) or by nginx, so that read
+traffic never reaches the database. When the app serves the snapshot, every
+finished ingestion enqueues a `snapshot` job (see `elmr.ingest`).
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import gzip
+import time
+import elmr
+
+from urllib import urlencode
+from datetime import datetime
+from flask import request, send_file
+from werkzeug.security import safe_join
+
+from elmr.models import Series, StateSeries, IngestionRecord
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+CURRENT   = "current"          # The name of the symlink to the latest snapshot
+EXTENSION = {
+    "application/json": "json",
+    "text/csv": "csv",
+}
+MIMETYPES = dict((v, k) for k, v in EXTENSION.items())
+
+## Paths that must always be served live
+EXCLUDE   = ("/api/status/", "/api/jobs/")
+
+##########################################################################
+## Snapshot Paths
+##########################################################################
+
+
+def source_cases(source):
+    """
+    Returns the spellings of a source in the snapshot paths: the source (as
+    in the database) and, if it differs, the lowercased source.
+    """
+    if source.lower() == source:
+        return (source,)
+    return (source, source.lower())
+
+
+def snapshot_requests():
+    """
+    Generates every (path, query) pair of the public read API, where query
+    is a dictionary of query string arguments (possibly empty).
+    """
+    # Imported here to avoid a circular import with the views module
+    from elmr.views import SourceView, ALLOWED_GEO_SOURCES
+
+    yield "/api/", {}
+
+    # Sources
+    yield "/api/source/", {}
+    for source in sorted(SourceView.ALLOWED_SOURCES):
+        for name in source_cases(source):
+            yield "/api/source/%s/" % name, {}
+
+    # Series list (with the default pagination) and series detail
+    total = Series.query.count()
+    for page in xrange(1, (total + 19) // 20 + 1):
+        yield "/api/series/", ({"page": page} if page > 1 else {})
+
+    for blsid, delta_id in Series.query.with_entities(Series.blsid,
+                                                      Series.delta_id):
+        yield "/api/series/%s/" % blsid, {}
+        if delta_id is not None:
+            yield "/api/series/%s/" % blsid, {"delta": "true"}
+
+    # Geography
+    yield "/api/geo/", {}
+    for source in sorted(ALLOWED_GEO_SOURCES):
+        for name in source_cases(source):
+            yield "/api/geo/%s/" % name, {}
+
+    slugs = StateSeries.query.with_entities(
+        StateSeries.source, StateSeries.slug
+    ).distinct()
+
+    for source, slug in slugs:
+        if source not in ALLOWED_GEO_SOURCES or not slug:
+            continue
+
+        for name in source_cases(source):
+            yield "/api/geo/%s/%s/" % (name, slug), {}
+            for adjusted in ("true", "false"):
+                for delta in ("true", "false"):
+                    yield "/api/geo/%s/%s/" % (name, slug), {
+                        "is_adjusted": adjusted,
+                        "is_delta": delta,
+                    }
+                    yield "/api/geo/%s/%s/breaks/" % (name, slug), {
+                        "is_adjusted": adjusted,
+                        "is_delta": delta,
+                    }
+
+    # Wealth of Nations and the regional series
+    yield "/api/regions/", {}
+    yield "/api/regions/", {"regions": "true"}
+    for source, slug in slugs:
+        if source not in ALLOWED_GEO_SOURCES or not slug:
+            continue
+
+        for name in source_cases(source):
+            for adjusted in ("true", "false"):
+                yield "/api/regions/%s/%s/" % (name, slug), {
+                    "is_adjusted": adjusted,
+                }
+
+
+def encode(value):
+    """
+    Encodes unicode as utf-8 for the paths and query strings of the files.
+    """
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+
+def snapshot_filename(path, query, ext):
+    """
+    Returns the relative path of the file in the snapshot for the request.
+    Raises a ValueError if the path has a `.` or `..` segment, which could
+    point outside of the snapshot.
+    """
+    parts = [encode(part) for part in path.split("/") if part]
+    name  = "index"
+
+    if any(part in (".", "..") for part in parts):
+        raise ValueError("cannot snapshot the relative path %r" % path)
+
+    if query:
+        name += "." + urlencode(sorted(
+            (encode(key), encode(value)) for key, value in query.items()
+        ))
+
+    parts.append("%s.%s" % (name, ext))
+    return os.path.join(*parts)
+
+##########################################################################
+## Snapshot Build
+##########################################################################
+
+
+def snapshot_version():
+    """
+    Returns the version name of a snapshot from the latest ingestion.
+    """
+    latest = IngestionRecord.query.order_by(IngestionRecord.id.desc()).first()
+    stamp  = datetime.now().strftime("%Y%m%dT%H%M%S")
+
+    if latest is None:
+        return "0000-%s" % stamp
+    return "%04i-%s" % (latest.id, stamp)
+
+
+def write_file(path, data):
+    """
+    Writes the data to the path as well as a gzipped copy at path + ".gz".
+    """
+    dirname = os.path.dirname(path)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    with gzip.open(path + ".gz", 'wb', 9) as f:
+        f.write(data)
+
+
+def build_snapshot(root=None, base_url=None, link=True, requests=None):
+    """
+    Renders every public API response (or only the (path, query) pairs in
+    requests if given) into a new versioned directory in the root directory,
+    and points the `current` symlink at it if link is True. Returns the path
+    of the snapshot, the number of files written, the number of bytes
+    (uncompressed) and the duration of the build.
+    """
+    app      = elmr.app
+    root     = root or app.config['SNAPSHOT_ROOT']
+    base_url = base_url or app.config['SNAPSHOT_BASE_URL']
+    target   = os.path.join(root, snapshot_version())
+    client   = app.test_client()
+
+    start = time.time()
+    count = 0
+    nbyte = 0
+
+    if requests is None:
+        requests = snapshot_requests()
+
+    for path, query in requests:
+        if path.startswith(EXCLUDE):
+            continue
+
+        response = client.get(path, query_string=query, base_url=base_url)
+        if response.status_code != 200:
+            continue
+
+        ext = EXTENSION.get(response.mimetype)
+        if ext is None:
+            continue
+
+        fname = os.path.join(target, snapshot_filename(path, query, ext))
+        write_file(fname, response.data)
+
+        count += 1
+        nbyte += len(response.data)
+
+    if link:
+        link_current(root, target)
+
+    return target, count, nbyte, time.time() - start
+
+
+def link_current(root, target):
+    """
+    Atomically points the `current` symlink in the root at the target.
+    """
+    current = os.path.join(root, CURRENT)
+    tmplink = current + ".tmp"
+
+    if os.path.lexists(tmplink):
+        os.remove(tmplink)
+
+    os.symlink(os.path.basename(target), tmplink)
+    os.rename(tmplink, current)
+
+##########################################################################
+## Snapshot Serving
+##########################################################################
+
+
+def snapshot_response():
+    """
+    A `before_request` handler that serves the response from the current
+    snapshot if `SERVE_SNAPSHOT` is set and the snapshot contains the
+    request. Returns None to fall through to the live view otherwise.
+    """
+    app = elmr.app
+    if not app.config.get('SERVE_SNAPSHOT'):
+        return None
+
+    if request.method not in ("GET", "HEAD"):
+        return None
+
+    path = request.path
+    if not path.startswith("/api/") or path.startswith(EXCLUDE):
+        return None
+
+    # Binary responses are not part of the snapshot
+    accept = request.accept_mimetypes
+    if accept and accept.best_match(EXTENSION.keys()) is None:
+        return None
+
+    current = os.path.join(app.config['SNAPSHOT_ROOT'], CURRENT)
+    query   = request.args.to_dict()
+
+    for ext, mimetype in MIMETYPES.items():
+        try:
+            fname = safe_join(current, snapshot_filename(path, query, ext))
+        except ValueError:
+            return None
+
+        if fname is None or not os.path.exists(fname):
+            continue
+
+        gzipped  = fname + ".gz"
+        encoding = request.headers.get("Accept-Encoding", "")
+        if "gzip" in encoding and os.path.exists(gzipped):
+            response = send_file(gzipped, mimetype=mimetype)
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = send_file(fname, mimetype=mimetype)
+
+        response.headers["Vary"] = "Accept-Encoding"
+        if ext == "csv":
+            name = os.path.basename(os.path.dirname(fname))
+            response.headers["Content-Disposition"] = (
+                "attachment; filename=%s.csv" % name
+            )
+
+        return response
+
+    return None
@@ -6,6 +6,7 @@ $(function() {
 
   // Important Variables
   var map       = null;  // The D3 Chloropeth map object
+  var frames    = null;  // The period endpoint of the dataset and its frames
   var geoSlider = new YearSlider().init("#formGeographyPeriodRange", {
     minDate: "Jan 2000",
     maxDate: "Feb 2015",
@@ -13,11 +14,17 @@ $(function() {
       // Update the map to the current year
       if (map) {
         map.column(slider.current_date());
-        drawMap();
+        fetchFrames(slider.current_date(), drawMap);
       }
     }
   });
 
+  // Number of months fetched on either side of the shown period
+  var PREFETCH  = 3;
+
+  // Classification of the map colors by the breaks of the dataset
+  var CLASSIFY  = "jenks";
+
   // Important endpoints
   var topo = "/static/data/topojson/countries/USA.json";
   // var geodata = "/api/geo/laus/unemployment-rate/";
@@ -41,21 +48,23 @@ $(function() {
   });
 
   console.log("Fetching data for chloropeth map ...");
-  // Load the CSV data for the map
+  // Load the CSV data for the map and the breaks of its colors
   d3.csv(geodata, function(error, data) {
       d3.select('#map')
           .datum(data);
 
-      // Turn off the loader and indicate application started
-      toggleLoading(false, function() {
-        drawMap(); // Draw the map
+      loadBreaks(geobreaks(), function() {
+        // Turn off the loader and indicate application started
+        toggleLoading(false, function() {
+          drawMap(); // Draw the map
 
-        // Add the event handler to draw the map on tab toggle
-        $('a[href=#geography]').on('shown.bs.tab', function(e) {
-          drawMap();
-        });
+          // Add the event handler to draw the map on tab toggle
+          $('a[href=#geography]').on('shown.bs.tab', function(e) {
+            drawMap();
+          });
 
-        console.log("Geography Application Started");
+          console.log("Geography Application Started");
+        });
       });
   });
 
@@ -125,23 +134,104 @@ $(function() {
     var chk_adjust = $("#chkGeoIsAdjust").is(":checked");
     var chk_delta  = $("#chkGeoIsDelta").is(":checked");
 
-    href += "?is_adjusted=" + chk_adjust + "&is_delta=" + chk_delta;
-    console.log("Fetching geographic data from", href);
+    console.log("Fetching geographic data from", href + "period/");
 
     $("#datasetSource").html("Loading &hellip;");
     $("#datasetName").html("Loading &hellip;");
 
-    d3.csv(href, function(error, data) {
-        d3.select('#map').datum(data);
-        drawMap();
+    // Only fetch the frames of the periods shown by the map
+    frames = {
+      url: href + "period/?is_adjusted=" + chk_adjust + "&is_delta=" + chk_delta,
+      loaded: {},
+      rows: {}
+    };
+
+    loadBreaks(geobreaks(), function() {
+      fetchFrames(geoSlider.current_date(), function(error) {
+          drawMap();
 
-        $("#datasetSource").text(source);
-        $("#datasetName").text(name);
+          $("#datasetSource").text(source);
+          $("#datasetName").text(error ? "Could not load " + name : name);
+      });
     });
 
     return false;
   });
 
+  /*
+   * Returns the url of the breaks of the selected dataset.
+   */
+  function geobreaks() {
+    var href = $("#menuGeographyDataset").find(":selected").val();
+    return href + "breaks/?is_adjusted=" + $("#chkGeoIsAdjust").is(":checked")
+         + "&is_delta=" + $("#chkGeoIsDelta").is(":checked");
+  }
+
+  /*
+   * Fetches the class breaks of a dataset across all states and periods,
+   * and colors the map with the interior breaks so that every period is
+   * on the same scale. Calls complete even if the breaks are unavailable.
+   */
+  function loadBreaks(href, complete) {
+    d3.json(href, function(error, result) {
+      if (!error && result.breaks[CLASSIFY]) {
+        map.domain(result.breaks[CLASSIFY].slice(1, -1));
+      } else {
+        map.domain(null);
+      }
+      complete();
+    });
+  }
+
+  /*
+   * Fetches the values of every state for a period (and the PREFETCH
+   * months on either side of it) unless they are already loaded, merges
+   * them into the rows of the map, then calls complete (with the error if
+   * the frame could not be fetched). If the period is loaded but a
+   * neighboring month is not, the neighbors are prefetched.
+   */
+  function fetchFrames(period, complete) {
+    complete = complete || function() {};
+    if (!frames) return complete();
+
+    var month = moment(period, geoSlider.dateFmt);
+    var ahead = month.clone().add(PREFETCH, "months").format(geoSlider.dateFmt);
+    var back  = month.clone().subtract(PREFETCH, "months").format(geoSlider.dateFmt);
+
+    if (frames.loaded[period]) {
+      complete();
+      if (!frames.loaded[ahead]) fetchFrames(ahead);
+      if (!frames.loaded[back]) fetchFrames(back);
+      return;
+    }
+
+    var url    = frames.url;
+    var href   = url + "&period=" + month.format("YYYY-MM")
+               + "&before=" + PREFETCH + "&after=" + PREFETCH;
+    frames.loaded[period] = true;
+
+    d3.json(href, function(error, frame) {
+      // Ignore frames of a dataset that is no longer selected
+      if (!frames || frames.url != url) return;
+      if (error) {
+        delete frames.loaded[period];
+        console.log("Could not fetch geographic data from", href);
+        return complete(error);
+      }
+
+      _.each(frame.periods, function(label) {
+        frames.loaded[label] = true;
+      });
+
+      _.each(frame.data, function(row) {
+        frames.rows[row.fips] = _.extend(frames.rows[row.fips] || {}, row);
+      });
+
+      d3.select('#map').datum(_.values(frames.rows));
+      complete();
+    });
+  }
+
 
   /*
    * Toggles the loader if data needs to be reloaded for some reason.
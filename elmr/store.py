@@ -0,0 +1,339 @@
+# elmr.store
+# Memory-mapped columnar store of every time series for the read path
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 21:18:40 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: store.py [] benjamin@bengfort.com $
+
+"""
+Memory-mapped columnar store of every time series for the read path.
+
+The whole dataset is a few hundred thousand (period, value) pairs, so after
+ingestion it is written once as a single contiguous float64 array of values
+(NaN for missing months) along with an index of the offset, length and start
+month of every series:
+
+    store/
+        0007-327213/
+            values.npy      # every series end to end
+            index.npy       # (series_id, offset, length, start) per series
+
+The directory is named for the version of the data (the latest ingestion
+and the latest record id), so a store is never modified once written. The
+values are memory mapped, so every web worker shares the same pages of the
+operating system's cache.
+
+Reads go through `series_array`, which answers from the store if it matches
+the current version of the data and falls back to the database otherwise.
+The current version is cached and cleared by the signals in `elmr.signals`;
+a store that has not been built yet is looked for again on the next read.
+When the store is enabled, every finished ingestion enqueues a `store` job
+(see `elmr.ingest`) so that the store follows each new version of the data.
+Only the store of the latest version is kept mapped in each process.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import time
+import shutil
+import elmr
+import numpy as np
+
+from sqlalchemy import func
+from elmr.cache import Cache
+from elmr.models import SeriesRecord, IngestionRecord
+from elmr.npy import to_array
+from elmr.arrays import series_values
+from elmr.queries import series_records
+from elmr.columnar import FREQUENCY
+from elmr.ordinal import ordinal, from_ordinal, labels, iso_label
+from elmr.signals import ingestion_finished, series_changed
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+VALUES = "values.npy"    # The contiguous array of every series
+INDEX  = "index.npy"     # The (series_id, offset, length, start) of each
+
+##########################################################################
+## Time Series Store
+##########################################################################
+
+
+class TimeSeriesStore(object):
+    """
+    A read only, memory-mapped store of every series in a data version.
+    """
+
+    def __init__(self, path):
+        self.path    = path
+        self.version = os.path.basename(os.path.normpath(path))
+        self.values  = np.load(os.path.join(path, VALUES), mmap_mode='r')
+        self.index   = dict(
+            (int(sid), (int(offset), int(length), int(start)))
+            for sid, offset, length, start in np.load(os.path.join(path, INDEX))
+        )
+
+    def get(self, series_id):
+        """
+        Returns the month index of the first period and the array of values
+        for the series. The array is empty if the series has no records.
+        """
+        if series_id not in self.index:
+            return 0, self.values[0:0]
+
+        offset, length, start = self.index[series_id]
+        return start, self.values[offset:offset + length]
+
+    def __contains__(self, series_id):
+        return series_id in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+##########################################################################
+## Versions
+##########################################################################
+
+
+def store_version():
+    """
+    Returns the version of the data in the database: the latest ingestion
+    and the latest record id, both of which are read from primary keys. Any
+    ingestion or recomputation of deltas changes the version.
+    """
+    session   = elmr.db.session
+    ingestion = session.query(func.max(IngestionRecord.id)).scalar() or 0
+    record    = session.query(func.max(SeriesRecord.id)).scalar() or 0
+    return "%04i-%i" % (ingestion, record)
+
+
+def store_path(version, root=None):
+    """
+    Returns the directory of the store for a version.
+    """
+    root = root or elmr.app.config['STORE_ROOT']
+    return os.path.join(root, version)
+
+##########################################################################
+## Store Build
+##########################################################################
+
+
+def build_store(root=None):
+    """
+    Writes the store for the current version of the data (if it does not
+    already exist) and returns its path, the number of series and values,
+    and the duration of the build.
+    """
+    start   = time.time()
+    version = store_version()
+    path    = store_path(version, root)
+
+    rows = elmr.db.session.query(
+        SeriesRecord.series_id, SeriesRecord.month, SeriesRecord.value,
+    ).order_by(SeriesRecord.series_id, SeriesRecord.month).all()
+
+    data = np.array(rows, dtype=np.float64).reshape(-1, 3)
+    values, index = pack(
+        data[:, 0].astype(np.int64), data[:, 1].astype(np.int64), data[:, 2]
+    )
+
+    if not os.path.exists(path):
+        # Write to a temporary directory then rename it into place
+        tmpdir = "%s.tmp-%i" % (path, os.getpid())
+        if os.path.exists(tmpdir):
+            shutil.rmtree(tmpdir)
+        os.makedirs(tmpdir)
+
+        np.save(os.path.join(tmpdir, VALUES), values)
+        np.save(os.path.join(tmpdir, INDEX), index)
+        os.rename(tmpdir, path)
+
+    clear()
+    return path, len(index), len(values), time.time() - start
+
+
+def pack(series, months, values):
+    """
+    Expects equal length arrays of series ids, month indices and values,
+    sorted by series id, and returns the contiguous array of every series
+    (NaN for missing months) along with the (series_id, offset, length,
+    start) index of every series. Entirely vectorized.
+    """
+    if len(series) == 0:
+        return np.zeros(0), np.zeros((0, 4), dtype=np.int64)
+
+    # The first row of each series
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(series)) + 1))
+    group  = np.cumsum(np.r_[0, np.diff(series) != 0])
+
+    starts  = np.minimum.reduceat(months, bounds)
+    lengths = np.maximum.reduceat(months, bounds) - starts + 1
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    packed  = np.full(lengths.sum(), np.nan)
+    packed[offsets[group] + months - starts[group]] = values
+
+    index   = np.column_stack((series[bounds], offsets, lengths, starts))
+    return packed, index.astype(np.int64)
+
+##########################################################################
+## Store Access
+##########################################################################
+
+## The current version and the loaded stores, cleared when data changes;
+## only the store of the latest version is kept mapped
+versions = Cache(int(elmr.app.config['CACHE_TIMEOUT']))
+stores   = Cache(maxsize=1)
+
+ingestion_finished.connect(versions.clear)
+series_changed.connect(versions.clear)
+
+
+def clear(*args, **kwargs):
+    """
+    Forgets the current version and loaded stores (signal connectable).
+    """
+    versions.clear()
+    stores.clear()
+
+
+def load_store(version):
+    """
+    Returns the store for the version or None if it has not been built.
+    """
+    path = store_path(version)
+    if not os.path.exists(os.path.join(path, INDEX)):
+        return None
+    return TimeSeriesStore(path)
+
+
+def get_store():
+    """
+    Returns the store for the current version of the data or None if the
+    store is disabled or has not been built for the current version.
+    """
+    if not elmr.app.config.get('USE_STORE'):
+        return None
+
+    version = versions.get("current", store_version)
+    store   = stores.get(version, lambda: load_store(version))
+
+    # Not built yet: forget the miss so the store is found once it is built
+    if store is None:
+        stores.discard(version)
+    return store
+
+##########################################################################
+## Series Access
+##########################################################################
+
+
+def series_array(series_id, start=None, end=None, last=None, source=None):
+    """
+    Returns the month index of the first period and the float64 array of
+    values (NaN for missing months) of the series, optionally limited to the
+    periods between the start and end dates and to the last N periods. The
+    array is read from the store if it is current, otherwise from the series
+    arrays (if enabled) or the records in the database. Passing the source of
+    the series lets the database only scan that source's records partition.
+    """
+    store = get_store()
+    if store is not None:
+        first, values = store.get(series_id)
+        return slice_values(first, values, start, end, last)
+
+    if elmr.app.config.get('USE_SERIES_ARRAYS'):
+        array = series_values(series_id)
+        if array is not None:
+            return slice_values(array[0], array[1], start, end, last)
+
+    return to_array(series_records(series_id, start, end, last, source))
+
+
+def slice_values(first, values, start=None, end=None, last=None):
+    """
+    Limits the array of values that begins at the month index first to the
+    periods between the start and end dates and to the last N periods with
+    values, in the same way as the database queries of `series_array`.
+    """
+    lo, hi = 0, len(values)
+
+    if start is not None:
+        lo = max(lo, ordinal(start) - first)
+    if end is not None:
+        hi = min(hi, ordinal(end) - first + 1)
+
+    values = values[lo:hi] if lo < hi else values[0:0]
+    first  = first + lo
+
+    # Only count and start from months that have values
+    present = np.flatnonzero(~np.isnan(values))
+    if last is not None and len(present) > last:
+        present = present[-last:]
+
+    if len(present) == 0:
+        return 0, np.zeros(0)
+
+    return first + present[0], np.array(values[present[0]:present[-1] + 1])
+
+
+def array_records(first, values):
+    """
+    Generates the (period, value) pairs of the months with values in an
+    array, in the same form as a query of the period and value of records.
+    """
+    for offset in np.flatnonzero(~np.isnan(values)):
+        yield from_ordinal(first + offset), float(values[offset])
+
+
+def array_columnar(first, values):
+    """
+    Returns the columnar dictionary (see `elmr.columnar.columnar`) of the
+    months from the first to the last value in an array, with None for the
+    missing months in between, without generating a record per month.
+    """
+    offsets = np.flatnonzero(~np.isnan(values))
+    if not len(offsets):
+        return {
+            "start": None, "end": None, "frequency": FREQUENCY, "values": [],
+        }
+
+    lo, hi = int(offsets[0]), int(offsets[-1])
+    window = values[lo:hi + 1]
+    data   = window.astype(object)
+    data[np.isnan(window)] = None
+
+    return {
+        "start": iso_label(first + lo),
+        "end": iso_label(first + hi),
+        "frequency": FREQUENCY,
+        "values": data.tolist(),
+    }
+
+
+def array_labels(first, values):
+    """
+    Returns the (label, value) pairs of the months with values in an array,
+    e.g. ("Sep 2008", 1.0), labelled from the precomputed label table.
+    """
+    offsets = np.flatnonzero(~np.isnan(values))
+    return zip(labels(first + offsets), values[offsets].tolist())
+
+
+def array_rows(first, values):
+    """
+    Returns the (month index, value) rows of the months with values in an
+    array, as expected by `elmr.npy.to_matrix`.
+    """
+    offsets = np.flatnonzero(~np.isnan(values))
+    return np.column_stack((first + offsets, values[offsets]))
@@ -20,7 +20,6 @@ Utility functions and classes for ELMR
 import re
 
 from datetime import datetime
-from datetime import timedelta
 from dateutil.tz import tzutc
 from calendar import monthrange
 from unicodedata import normalize
@@ -54,22 +53,25 @@ def months_since(dt):
 
 def months_between(dta, dtb):
     """
-    Computes the number of months between two datetimes. Note that dtb must
-    be bigger than dta in order for this function to work. Timezones also
-    matter!
+    Computes the number of whole months between two datetimes, e.g. the
+    number of monthly anniversaries of dta that have passed by dtb. If dta
+    falls on a day that does not exist in the month of dtb (e.g. the 31st),
+    the anniversary is the last day of that month. Returns 0 if dtb is
+    before dta. If both datetimes are timezone aware, they are compared in
+    the timezone of dtb.
     """
 
-    delta = 0
-    while True:
-        mdays = monthrange(dta.year, dta.month)[1]
-        dta += timedelta(days=mdays)
+    if dta.tzinfo is not None and dtb.tzinfo is not None:
+        dta = dta.astimezone(dtb.tzinfo)
 
-        if dta <= dtb:
-            delta += 1
-        else:
-            break
+    months = (dtb.year - dta.year) * 12 + (dtb.month - dta.month)
+
+    # The last month has only passed once the anniversary day and time pass
+    anniversary = min(dta.day, monthrange(dtb.year, dtb.month)[1])
+    if (dtb.day, dtb.time()) < (anniversary, dta.time()):
+        months -= 1
 
-    return delta
+    return max(months, 0)
 
 ##########################################################################
 ## Decorators and Descriptors
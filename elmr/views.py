@@ -18,52 +18,95 @@ Routes for the ELMR web application
 ##########################################################################
 
 import os
+import json
+import base64
 import StringIO
+import numpy as np
 
 from elmr import get_version
 from elmr import app, api, db
-from elmr.models import IngestionRecord
-from elmr.models import Series, SeriesRecord, StateSeries, USAState
+from elmr.models import IngestionRecord, Job
+from elmr.models import Series
 from elmr.utils import JSON_FMT, utcnow, months_since, slugify, parse_bool
-from elmr.fips import write_states_dataset
-
-from flask import request, make_response
+from elmr.fips import write_states_dataset, states_matrix, states_window
+from elmr.breaks import dataset_breaks
+from elmr.regions import region_series
+from elmr.dbstats import table_statistics, database_statistics
+from elmr.columnar import FORMATS, FREQUENCY, month_label
+from elmr.columnar import columnar_frame
+from elmr.resample import FREQUENCIES, AGGREGATES, MONTHLY
+from elmr.resample import resample, downsample, periods
+from elmr.resample import period_label, period_display
+from elmr.npy import wants_npy, to_matrix
+from elmr.npy import npy_response
+from elmr.period import period_start, period_end, period_range
+from elmr.store import series_array, array_records, array_rows
+from elmr.store import array_columnar
+from elmr.ordinal import ordinal, label
+from elmr.cache import Cache
+from elmr.catalog import get_catalog
+from elmr.signals import ingestion_finished, series_changed
+from elmr.snapshot import snapshot_response
+from elmr.encoding import output_json, RecordsArray, PairsArray, RowsArray
+from elmr.jobs import HANDLERS, enqueue, serialize
+
+from flask import request, make_response, abort
+from flask.ext.sqlalchemy import Pagination
 from flask.ext.restful import Resource, reqparse
 from flask import render_template, send_from_directory
 
+from urllib import urlencode
 from urlparse import urljoin
-from operator import itemgetter
-from collections import defaultdict
-from sqlalchemy import desc, extract
+from sqlalchemy import desc, func
+
+##########################################################################
+## Application Caches
+##########################################################################
+
+# Snapshot of the latest ingestion for the heartbeat, cleared on ingestion
+ingestions = Cache(int(app.config['CACHE_TIMEOUT']))
+ingestion_finished.connect(ingestions.clear)
 
 ##########################################################################
 ## Configure Application Routes
 ##########################################################################
 
+# Serve read API responses from the static snapshot when configured
+app.before_request(snapshot_response)
+
+# Encode JSON responses with the fast representation of `elmr.encoding`
+api.representation('application/json')(output_json)
+
 
 @app.route("/")
 def index():
-    sources = (
-        ("CPS", Series.query.filter_by(source="CPS").order_by('title')),
-        ("CESN", Series.query.filter_by(source="CESN").order_by('title')),
-        ("LAUS", Series.query.filter_by(source="LAUS").order_by('title')),
-        ("CESSM", Series.query.filter_by(source="CESSM").order_by('title')),
-    )
+    catalog = get_catalog()
+    sources = [
+        (source, catalog.source(source, order='title'))
+        for source in ("CPS", "CESN", "LAUS", "CESSM")
+    ]
     return render_template('home.html', sources=sources)
 
 
 @app.route("/admin/")
 def admin():
+    exact      = parse_bool(request.args.get('exact', False))
     ingestions = IngestionRecord.query.order_by(desc("id")).limit(20)
+    tables     = table_statistics(exact=exact)
     dbcounts   = {
-        "series": Series.query.count(),
-        "records": SeriesRecord.query.count(),
-        "ingests": IngestionRecord.query.count(),
-        "states_series": StateSeries.query.count(),
+        "series": tables.get("series", {}).get("rows", 0),
+        "records": tables.get("records", {}).get("rows", 0),
+        "ingests": tables.get("ingestions", {}).get("rows", 0),
+        "states_series": tables.get("states_series", {}).get("rows", 0),
     }
+    dbstats    = database_statistics()
+    dbstats["avg_added"] = db.session.query(
+        func.avg(IngestionRecord.num_added)
+    ).scalar()
     dbversion  = list(db.session.execute("SELECT * FROM migrate_version"))[0]
     return render_template('admin.html', ingestlog=ingestions,
-                           dbcounts=dbcounts, dbversion=dbversion)
+                           dbcounts=dbcounts, dbversion=dbversion,
+                           dbtables=tables, dbstats=dbstats, exact=exact)
 
 
 @app.route('/favicon.ico')
@@ -99,6 +142,10 @@ class SeriesView(Resource):
     """
     API for getting the detail of a single time series object, probably won't
     be used for our project, but available so that we can quickly get info.
+
+    The series can be aggregated to a lower `frequency` (quarterly, annual)
+    by the mean, last or sum of the months (the `how` argument) and reduced
+    to at most `max_points` points for charts that cannot show every month.
     """
 
     @property
@@ -110,7 +157,17 @@ class SeriesView(Resource):
             self._parser = reqparse.RequestParser()
             self._parser.add_argument('start_year', type=int)
             self._parser.add_argument('end_year', type=int)
+            self._parser.add_argument('start', type=period_start)
+            self._parser.add_argument('end', type=period_end)
+            self._parser.add_argument('last', type=int)
             self._parser.add_argument('delta', type=str)
+            self._parser.add_argument('format', type=str, default='records',
+                                      choices=FORMATS)
+            self._parser.add_argument('frequency', type=str, default=MONTHLY,
+                                      choices=FREQUENCIES.keys())
+            self._parser.add_argument('how', type=str, default='mean',
+                                      choices=AGGREGATES)
+            self._parser.add_argument('max_points', type=int)
         return self._parser
 
     @property
@@ -129,7 +186,11 @@ class SeriesView(Resource):
         """
 
         args    = self.parser.parse_args()
-        series  = Series.query.filter_by(blsid=blsid).first_or_404()
+        catalog = get_catalog()
+        series  = catalog.series(blsid)
+        if series is None:
+            abort(404)
+
         context = {
             "blsid": series.blsid,
             "source": series.source,
@@ -137,31 +198,104 @@ class SeriesView(Resource):
             "data": [],
         }
 
-        start   = args.get('start_year', None)
-        finish  = args.get('end_year', None)
+        start, finish = period_range(args.start, args.end,
+                                     args.start_year, args.end_year)
+
         delta   = parse_bool(args.get('delta', False))
         serid   = series.id
+        source  = series.source
+
+        if args.last is not None and args.last < 1:
+            return {
+                "success": False,
+                "message": "last must be a positive integer",
+            }, 400
 
         if delta:
             # Switch to the delta view of the time series
-            if series.delta:
-                serid = series.delta.id
+            delta = catalog.delta(series)
+            if delta is not None:
+                serid  = delta.id
+                source = delta.source
+
+        # Read the values from the store (or the database if it is stale)
+        first, values = series_array(
+            serid, start, finish, args.last, source
+        )
+
+        if args.frequency != MONTHLY or args.max_points is not None:
+            return self.get_resampled(series, first, values, args, context)
+
+        if wants_npy(args.format):
+            return npy_response(values, {
+                "blsid": series.blsid,
+                "source": series.source,
+                "title": series.title,
+                "start": month_label(first),
+                "frequency": FREQUENCY,
+            }, series.blsid)
 
-        # Start the records query
-        records = SeriesRecord.query.filter_by(series_id=serid)
-        ryear   = extract('year', SeriesRecord.period)
+        # Serialize the records
+        if args.format == "columnar":
+            context['data'] = array_columnar(first, values)
+            return context
 
-        if start is not None:
-            records = records.filter(ryear >= start)
+        context['data'] = RecordsArray(first, values)
+        return context
 
-        if finish is not None:
-            records = records.filter(ryear <= finish)
+    def get_resampled(self, series, first, values, args, context):
+        """
+        Returns the series aggregated to the requested frequency and/or
+        downsampled to the maximum number of points.
+        """
+        if args.max_points is not None and args.max_points < 1:
+            return {
+                "success": False,
+                "message": "max_points must be a positive integer",
+            }, 400
+
+        freq  = args.frequency
+        first, values, offsets = downsample(
+            first, values, freq, args.how, args.max_points
+        )
+
+        if wants_npy(args.format):
+            meta = {
+                "blsid": series.blsid,
+                "source": series.source,
+                "title": series.title,
+                "start": period_label(first, freq),
+                "frequency": freq,
+            }
+
+            if offsets is not None:
+                meta["offsets"] = offsets.tolist()
+
+            return npy_response(values, meta, series.blsid)
+
+        index  = periods(first, values, offsets, freq)
+        values = [None if np.isnan(v) else float(v) for v in values]
+
+        if args.format == "columnar":
+            context['data'] = {
+                "start": period_label(index[0], freq) if len(index) else None,
+                "end": period_label(index[-1], freq) if len(index) else None,
+                "frequency": freq,
+                "values": values,
+            }
+
+            if offsets is not None:
+                context['data']['offsets'] = offsets.tolist()
+
+            return context
+
+        for idx, value in zip(index, values):
+            if value is None:
+                continue
 
-        # Serialize the records
-        for record in records.all():
             context['data'].append({
-                "period": record.period.strftime("%b %Y"),
-                "value": record.value
+                "period": period_display(idx, freq),
+                "value": value,
             })
 
         return context
@@ -178,6 +312,7 @@ class SeriesView(Resource):
 
         series.title = args['title']
         db.session.commit()
+        series_changed.send(series)
 
         return {
             'blsid': series.blsid,
@@ -189,8 +324,18 @@ class SeriesView(Resource):
 class SeriesListView(Resource):
     """
     API for returning a list of time series objects.
+
+    By default the list is paginated by page number. Passing a `cursor`
+    argument (empty to start from the beginning) switches to keyset
+    pagination, which orders by `id` or `blsid` (the `order` argument) and
+    returns an opaque `next` cursor to fetch the following page. Keyset
+    pagination does not slow down on deep pages as offset scans do.
+
+    The series are listed from the in-process catalog (`elmr.catalog`).
     """
 
+    ORDERINGS = ("id", "blsid")
+
     @property
     def parser(self):
         """
@@ -201,6 +346,9 @@ class SeriesListView(Resource):
             self._parser.add_argument('page', type=int)
             self._parser.add_argument('per_page', type=int)
             self._parser.add_argument('source', type=str)
+            self._parser.add_argument('cursor', type=str)
+            self._parser.add_argument('order', type=str, default='id',
+                                      choices=self.ORDERINGS)
         return self._parser
 
     def get(self):
@@ -213,30 +361,108 @@ class SeriesListView(Resource):
         per_page = args.per_page or 20
         source   = args.source
 
-        if source is not None:
-            series = Series.query.filter_by(source=source)
-            series = series.paginate(page, per_page)
-        else:
-            series = Series.query.paginate(page, per_page)
+        if args.cursor is not None:
+            return self.get_keyset(source, args.cursor, args.order, per_page)
+
+        # Paginate by offset over the catalog's series of the source
+        if page < 1:
+            abort(404)
+
+        series = get_catalog().source(source)
+        items  = series[(page - 1) * per_page:page * per_page]
+        if not items and page != 1:
+            abort(404)
+
+        series = Pagination(None, page, per_page, len(series), items)
 
         context = {
             "page": series.page,
             "pages": series.pages,
             "per_page": series.per_page,
             "total": series.total,
-            "series": [],
+            "series": [self.serialize(item) for item in series.items],
         }
 
-        for item in series.items:
-            context["series"].append({
-                "url": self.get_detail_url(item.blsid),
-                "blsid": item.blsid,
-                "title": item.title,
-                "source": item.source,
-            })
+        return context
+
+    def get_keyset(self, source, cursor, order, per_page):
+        """
+        Returns the page of series that follows the cursor in the ordering.
+        """
+        if cursor:
+            try:
+                order, last = self.decode_cursor(cursor)
+            except ValueError:
+                return {
+                    "success": False,
+                    "message": "Could not parse cursor '%s'" % cursor,
+                }, 400
+
+        series = get_catalog().source(source, order=order)
+        total  = len(series)
+
+        if cursor:
+            series = [item for item in series if getattr(item, order) > last]
+
+        items  = series[:per_page + 1]
+
+        # Fetching one extra row tells us if there is another page
+        context = {
+            "per_page": per_page,
+            "order": order,
+            "total": total,
+            "cursor": None,
+            "next": None,
+            "series": [self.serialize(item) for item in items[:per_page]],
+        }
+
+        if len(items) > per_page:
+            last = getattr(items[per_page - 1], order)
+            context["cursor"] = self.encode_cursor(order, last)
+            context["next"]   = self.get_next_url(context["cursor"])
 
         return context
 
+    def serialize(self, item):
+        """
+        Returns the list representation of a series.
+        """
+        return {
+            "url": self.get_detail_url(item.blsid),
+            "blsid": item.blsid,
+            "title": item.title,
+            "source": item.source,
+        }
+
+    def encode_cursor(self, order, last):
+        """
+        Returns an opaque, URL safe cursor for the last item on a page.
+        """
+        return base64.urlsafe_b64encode(json.dumps([order, last]))
+
+    def decode_cursor(self, cursor):
+        """
+        Returns the ordering and last value of a cursor or raises ValueError.
+        """
+        try:
+            order, last = json.loads(base64.urlsafe_b64decode(str(cursor)))
+        except (TypeError, ValueError):
+            raise ValueError("Could not decode cursor")
+
+        if order not in self.ORDERINGS:
+            raise ValueError("Unknown ordering '%s'" % order)
+
+        return order, last
+
+    def get_next_url(self, cursor):
+        """
+        Returns the url of the next page for the given cursor.
+        """
+        params = request.args.to_dict()
+        params["cursor"] = cursor
+        query  = urlencode(sorted(params.items()))
+        return urljoin(request.url_root, "/api/series/?%s" % query)
+
     def get_detail_url(self, blsid):
         """
         Returns the blsid from the request object.
@@ -268,6 +494,11 @@ class SourceView(Resource):
             self._parser = reqparse.RequestParser()
             self._parser.add_argument('start_year', type=int)
             self._parser.add_argument('end_year', type=int)
+            self._parser.add_argument('start', type=period_start)
+            self._parser.add_argument('end', type=period_end)
+            self._parser.add_argument('last', type=int)
+            self._parser.add_argument('format', type=str, default='records',
+                                      choices=FORMATS)
         return self._parser
 
     def get(self, source):
@@ -292,44 +523,72 @@ class SourceView(Resource):
             return context, 404
 
         args    = self.parser.parse_args()
-        series  = Series.query.filter_by(source=source)
+        series  = get_catalog().source(source)
+
+        start, finish = period_range(
+            args.start, args.end,
+            args.start_year or int(app.config['STARTYEAR']),
+            args.end_year or int(app.config['ENDYEAR']),
+        )
 
-        start   = args.start_year or int(app.config['STARTYEAR'])
-        finish  = args.end_year or int(app.config['ENDYEAR'])
+        if args.last is not None and args.last < 1:
+            return {
+                "success": False,
+                "message": "last must be a positive integer",
+            }, 400
 
         context = {
             "title": "ELMR Ingested %s Data" % source,
             "version": get_version(),
             "period": {
-                "start": start,
-                "end": finish,
+                "start": label(ordinal(start)),
+                "end": label(ordinal(finish)),
             },
             "descriptions": {},
             "data": [],
         }
 
-        data = defaultdict(dict)
-        for s in series.all():
-            context["descriptions"][s.blsid] = s.title
-
-            records = SeriesRecord.query.filter_by(series_id=s.id)
-            ryear   = extract('year', SeriesRecord.period)
-            records = records.filter(ryear >= start)
-            records = records.filter(ryear <= finish)
+        binary = wants_npy(args.format)
+        rows   = array_records if args.format == "columnar" else array_rows
 
-            for record in records.all():
-                data[record.period][s.blsid] = record.value
-
-        data = sorted(data.items(), key=itemgetter(0))
-        for (date, values) in data:
-            values["YEAR"]  = date.year
-            values["MONTH"] = date.month
-            values["DATE"]  = date.strftime("%b %Y")
-
-            context["data"].append(values)
+        frame = {}
+        for s in series:
+            context["descriptions"][s.blsid] = s.title
 
-        context['period']['start'] = data[0][0].strftime("%b %Y")
-        context['period']['end']   = data[-1][0].strftime("%b %Y")
+            first, values  = series_array(
+                s.id, start, finish, args.last, s.source
+            )
+            frame[s.blsid] = list(rows(first, values))
+
+        if binary:
+            columns = sorted(frame.keys())
+            first, matrix = to_matrix([frame[col] for col in columns])
+            return npy_response(matrix, {
+                "title": context["title"],
+                "version": context["version"],
+                "start": month_label(first),
+                "frequency": FREQUENCY,
+                "columns": columns,
+                "descriptions": context["descriptions"],
+            }, source.lower())
+
+        if args.format == "columnar":
+            context["data"] = columnar_frame(frame)
+            context["period"]["start"] = context["data"]["start"]
+            context["period"]["end"]   = context["data"]["end"]
+            return context
+
+        # Align every series on the month ordinal, one row per month
+        columns = sorted(frame.keys())
+        first, matrix = to_matrix([frame[col] for col in columns])
+        rows    = RowsArray(first, columns, matrix)
+        offsets = rows.offsets
+
+        context["data"] = rows
+
+        if len(offsets):
+            context['period']['start'] = label(int(first + offsets[0]))
+            context['period']['end']   = label(int(first + offsets[-1]))
 
         return context
 
@@ -345,8 +604,7 @@ class SourceListView(Resource):
         }
 
         # Create sources model in the future
-        sql = "SELECT source, count(id) FROM series GROUP BY source"
-        for s in db.session.execute(sql):
+        for s in get_catalog().sources():
             context["sources"].append({
                 "url": self.get_detail_url(s[0]),
                 "name": s[0],
@@ -386,11 +644,10 @@ class GeoSourcesView(Resource):
             "sources": [],
         }
 
-        query = "SELECT DISTINCT source FROM states_series"
-        for row in db.session.execute(query):
+        for source in get_catalog().geo_sources():
             context["sources"].append({
-                "name": row[0],
-                "url": self.get_detail_url(row[0]),
+                "name": source,
+                "url": self.get_detail_url(source),
             })
 
         return context
@@ -428,23 +685,21 @@ class GeoDatasetsView(Resource):
             }
             return context, 404
 
-        query = "SELECT distinct %s FROM states_series WHERE source='%s'"
         field = {
             "LAUS": "dataset",
             "CESSM": "category",
         }[source]
 
-        query   = query % (field, source)
         context = {
             "title": "ELMR %s Datasets" % source,
             "field": field,
             "datasets": []
         }
 
-        for row in db.session.execute(query):
+        for dataset in get_catalog().datasets(source, field):
             context["datasets"].append({
-                "name": row[0],
-                "url": self.get_detail_url(source, row[0]),
+                "name": dataset,
+                "url": self.get_detail_url(source, dataset),
             })
 
         return context
@@ -457,6 +712,165 @@ class GeoDatasetsView(Resource):
         return urljoin(base, "/api/geo/%s/%s/" % (source, slugify(dataset)))
 
 
+def geo_source_error(source):
+    """
+    Returns the (context, status) of the error response if the source is not
+    an allowed geographic source, otherwise None.
+    """
+    if source in FORBIDDEN_GEO_SOURCES:
+        context = {
+            'success': False,
+            'message': "Source '%s' is not allowed." % source,
+        }
+        return context, 400
+
+    if source not in ALLOWED_GEO_SOURCES:
+        context = {
+            'success': False,
+            'message': "Source '%s' is not found." % source,
+        }
+        return context, 404
+
+
+class GeoPeriodView(Resource):
+    """
+    Returns the value of every state of a geographic dataset at one period,
+    or at a small window of months around it, so that the choropleth map can
+    fetch only the frames it shows and prefetch the neighboring months.
+    """
+
+    ## Maximum number of months before or after the period
+    MAX_WINDOW = 12
+
+    @property
+    def parser(self):
+        """
+        Returns the period request parser
+        """
+        if not hasattr(self, '_parser'):
+            self._parser = reqparse.RequestParser()
+            self._parser.add_argument('period', type=period_start,
+                                      required=True)
+            self._parser.add_argument('before', type=int, default=0)
+            self._parser.add_argument('after', type=int, default=0)
+            self._parser.add_argument('is_adjusted', type=str, default="true")
+            self._parser.add_argument('is_delta', type=str, default="false")
+        return self._parser
+
+    def get(self, source, dataset):
+        """
+        Returns the rows of the states, mapping the label of each period of
+        the window to the value of the state (missing values are omitted),
+        in the same form as the rows of the geographic CSV data set.
+        """
+        args   = self.parser.parse_args()
+        source = source.upper()
+
+        error = geo_source_error(source)
+        if error is not None:
+            return error
+
+        for arg in ('before', 'after'):
+            if not 0 <= args[arg] <= self.MAX_WINDOW:
+                context = {
+                    'success': False,
+                    'message': "%s must be between 0 and %i months." % (
+                        arg, self.MAX_WINDOW
+                    ),
+                }
+                return context, 400
+
+        adjusted = parse_bool(args['is_adjusted'])
+        delta    = parse_bool(args['is_delta'])
+
+        states, first, matrix = states_window(
+            source, dataset, args['period'], args['before'], args['after'],
+            adjusted, delta
+        )
+
+        periods = [label(first + idx) for idx in xrange(matrix.shape[1])]
+        data    = []
+        for (fips, name), values in zip(states, matrix):
+            row = {"fips": fips, "State": name}
+            for period, value in zip(periods, values):
+                if not np.isnan(value):
+                    row[period] = float(value)
+            data.append(row)
+
+        return {
+            "source": source,
+            "dataset": dataset,
+            "adjusted": adjusted,
+            "delta": delta,
+            "period": label(ordinal(args['period'])),
+            "periods": periods,
+            "data": data,
+        }
+
+
+class GeoBreaksView(Resource):
+    """
+    Returns the choropleth class breaks of a geographic dataset across all of
+    the states and periods, and the extents of the values at each period, so
+    that every frame of the map is colored on the same scale.
+    """
+
+    ## Bounds of the number of classes
+    MIN_CLASSES = 2
+    MAX_CLASSES = 12
+
+    @property
+    def parser(self):
+        """
+        Returns the breaks request parser
+        """
+        if not hasattr(self, '_parser'):
+            self._parser = reqparse.RequestParser()
+            self._parser.add_argument('classes', type=int, default=9)
+            self._parser.add_argument('is_adjusted', type=str, default="true")
+            self._parser.add_argument('is_delta', type=str, default="false")
+        return self._parser
+
+    def get(self, source, dataset):
+        """
+        Returns the quantile, equal interval and Jenks breaks of the dataset.
+        """
+        args   = self.parser.parse_args()
+        source = source.upper()
+
+        error = geo_source_error(source)
+        if error is not None:
+            return error
+
+        if not self.MIN_CLASSES <= args['classes'] <= self.MAX_CLASSES:
+            context = {
+                'success': False,
+                'message': "classes must be between %i and %i." % (
+                    self.MIN_CLASSES, self.MAX_CLASSES
+                ),
+            }
+            return context, 400
+
+        adjusted = parse_bool(args['is_adjusted'])
+        delta    = parse_bool(args['is_delta'])
+        result   = dataset_breaks(source, dataset, adjusted, delta,
+                                  args['classes'])
+
+        return {
+            "source": source,
+            "dataset": dataset,
+            "adjusted": adjusted,
+            "delta": delta,
+            "classes": args['classes'],
+            "domain": result["domain"],
+            "breaks": result["breaks"],
+            "extents": [
+                {"period": label(idx), "min": low, "max": high}
+                for idx, low, high in result["extents"]
+            ],
+        }
+
+
 @app.route('/api/geo/<source>/<dataset>/')
 def geography_csv(source, dataset):
     """
@@ -474,10 +888,12 @@ def geography_csv(source, dataset):
     is_delta   = parse_bool(request.args.get('is_delta', False))
 
     try:
-        start_year = int(start_year)
-        end_year = int(end_year)
+        start, finish = period_range(
+            request.args.get('start'), request.args.get('end'),
+            int(start_year), int(end_year)
+        )
     except ValueError:
-        return make_response("Bad value for start or end year parameter"), 400
+        return make_response("Bad value for start or end period parameter"), 400
 
     if source in FORBIDDEN_GEO_SOURCES:
         return make_response("Source '%s' is not geographic." % source), 400
@@ -486,11 +902,23 @@ def geography_csv(source, dataset):
         return make_response("Unknown data source -- '%s'" % source), 404
 
     # Determine the series from the source and the dataset
+    if wants_npy(request.args.get('format')):
+        states, first, matrix = states_matrix(source, dataset,
+                                              start, finish,
+                                              is_adjust, is_delta)
+        return npy_response(matrix, {
+            "source": source,
+            "dataset": dataset,
+            "start": month_label(first),
+            "frequency": FREQUENCY,
+            "fips": [fips for fips, _ in states],
+            "states": [name for _, name in states],
+        }, dataset)
 
     # Create a file-like object for the CSV to return, then write the series
     csv = StringIO.StringIO()
     write_states_dataset(csv, source, dataset,
-                         start_year, end_year,
+                         start, finish,
                          is_adjust, is_delta)
 
     output = make_response(csv.getvalue())
@@ -506,8 +934,20 @@ def geography_csv(source, dataset):
 class WealthOfNationsView(Resource):
     """
     Provides state information according to the Wealth of Nations format.
+
+    The animation can be played at a lower `frequency` (quarterly, annual),
+    aggregating the months by the `how` argument, with fewer frames. If
+    `regions` is true, the eight BEA regions are provided instead of the
+    states, aggregated from the series of their states by `elmr.regions`.
     """
 
+    # Handle Datasets (temporary names for now)
+    DATAMAP = {
+        "income": u"labor-force",
+        "population": u"employment",
+        "lifeExpectancy": u"unemployment-rate",
+    }
+
     @property
     def parser(self):
         """
@@ -518,6 +958,13 @@ class WealthOfNationsView(Resource):
             self._parser.add_argument('start_year', type=int, default=2000)
             self._parser.add_argument('end_year', type=int, default=2015)
             self._parser.add_argument('adjusted', type=bool, default=False)
+            self._parser.add_argument('format', type=str, default='records',
+                                      choices=FORMATS)
+            self._parser.add_argument('frequency', type=str, default=MONTHLY,
+                                      choices=FREQUENCIES.keys())
+            self._parser.add_argument('how', type=str, default='mean',
+                                      choices=AGGREGATES)
+            self._parser.add_argument('regions', type=str, default="false")
         return self._parser
 
     def get(self):
@@ -526,7 +973,12 @@ class WealthOfNationsView(Resource):
         args     = self.parser.parse_args()
         adjusted = args.adjusted
 
-        for state in USAState.query.order_by('name').all():
+        if parse_bool(args.regions):
+            return self.regional(args)
+
+        catalog  = get_catalog()
+
+        for state in catalog.states:
             context.append({
                 "name": state.name,
                 "region": state.region,
@@ -537,22 +989,131 @@ class WealthOfNationsView(Resource):
                 "lifeExpectancy": [],
             })
 
-            # Handle Datasets (temporary names for now)
-            datamap = {
-                "income": u"labor-force",
-                "population": u"employment",
-                "lifeExpectancy": u"unemployment-rate",
+            for key, slug in self.DATAMAP.items():
+                ss = catalog.state_series_entry(
+                    state.id, u"LAUS", slug, adjusted
+                )
+                series = catalog.get(ss.series_id)
+                first, values = series_array(series.id, source=series.source)
+
+                context[-1][key] = self.encode(first, values, args)
+
+        return context
+
+    def regional(self, args):
+        """
+        Returns the entries of the regions, named by the region, with the
+        regional series of each dataset.
+        """
+        context = {}
+
+        for key, slug in self.DATAMAP.items():
+            result = region_series(u"LAUS", slug, args.adjusted)
+            for name, states, values in result["regions"]:
+                entry = context.setdefault(name, {
+                    "name": name,
+                    "region": name,
+                    "states": states,
+                })
+                entry[key] = self.encode(result["first"], values, args)
+
+        return [context[name] for name in sorted(context)]
+
+    def encode(self, first, values, args):
+        """
+        Returns the monthly values of a series in the requested format and
+        frequency.
+        """
+        if args.frequency != MONTHLY:
+            return self.resampled(first, values, args)
+
+        if args.format == "columnar":
+            return array_columnar(first, values)
+
+        return PairsArray(first, values)
+
+    def resampled(self, first, values, args):
+        """
+        Returns the values of the series aggregated to the frequency.
+        """
+        freq    = args.frequency
+        first, values = resample(first, values, freq, args.how)
+        values = [None if np.isnan(v) else float(v) for v in values]
+
+        if args.format == "columnar":
+            if not values:
+                return {
+                    "start": None, "end": None,
+                    "frequency": freq, "values": [],
+                }
+
+            return {
+                "start": period_label(first, freq),
+                "end": period_label(periods(first, values, None, freq)[-1], freq),
+                "frequency": freq,
+                "values": values,
             }
 
-            for key, slug in datamap.items():
-                ss = state.series.filter_by(slug=slug)
-                ss = ss.filter_by(adjusted=adjusted, source="LAUS")
-                ss = ss.first()
-                for record in ss.series.records.order_by('period'):
-                    context[-1][key].append([
-                        record.period.strftime("%b %Y"),
-                        record.value
-                    ])
+        return [
+            [period_display(idx, freq), value]
+            for idx, value in zip(periods(first, values, None, freq), values)
+            if value is not None
+        ]
+
+
+class RegionsView(Resource):
+    """
+    Returns the series of a geographic dataset aggregated by BEA region:
+    levels are summed over the states of each region and rates are averaged
+    weighted by the labor force, so that clients can fetch eight regional
+    series rather than the series of every state.
+    """
+
+    @property
+    def parser(self):
+        """
+        Returns the regions request parser
+        """
+        if not hasattr(self, '_parser'):
+            self._parser = reqparse.RequestParser()
+            self._parser.add_argument('is_adjusted', type=str, default="true")
+            self._parser.add_argument('format', type=str, default='records',
+                                      choices=FORMATS)
+        return self._parser
+
+    def get(self, source, dataset):
+        """
+        Returns the regional series of the dataset.
+        """
+        args   = self.parser.parse_args()
+        source = source.upper()
+
+        error = geo_source_error(source)
+        if error is not None:
+            return error
+
+        adjusted = parse_bool(args['is_adjusted'])
+        result   = region_series(source, dataset, adjusted)
+        context  = {
+            "source": source,
+            "dataset": dataset,
+            "adjusted": adjusted,
+            "method": result["method"],
+            "weights": result["weights"],
+            "regions": [],
+        }
+
+        for name, states, values in result["regions"]:
+            if args.format == "columnar":
+                data = array_columnar(result["first"], values)
+            else:
+                data = RecordsArray(result["first"], values)
+
+            context["regions"].append({
+                "name": name,
+                "states": states,
+                "data": data,
+            })
 
         return context
 
@@ -566,6 +1127,10 @@ class HeartbeatView(Resource):
     Keep alive endpoint, if you get a 200 response, you know ELMR is alive!
     Also gives important status information like the version of ELMR, last
     ingestion time and so forth.
+
+    The latest ingestion is read from an in-process snapshot that is
+    refreshed when an ingestion finishes (or the cache times out), so that
+    constant polling by monitoring does not query the database.
     """
 
     def get(self):
@@ -578,10 +1143,10 @@ class HeartbeatView(Resource):
             }
         }
 
-        latest = IngestionRecord.query.order_by(desc('finished')).first()
+        latest = ingestions.get("latest", self.get_latest_ingestion)
 
         if latest is not None:
-            months = months_since(latest.finished)
+            months = months_since(latest)
 
             if months < 2:
                 context["status"] = "green"
@@ -591,11 +1156,136 @@ class HeartbeatView(Resource):
                 context["status"] = "red"
 
             tsfields = context['timestamps']
-            tsfields['ingestion']  = latest.finished.strftime(JSON_FMT)
+            tsfields['ingestion']  = latest.strftime(JSON_FMT)
             tsfields['monthdelta'] = months
 
         return context
 
+    def get_latest_ingestion(self):
+        """
+        Returns the finished timestamp of the latest ingestion or None.
+        """
+        latest = IngestionRecord.query.order_by(desc('finished')).first()
+        if latest is None:
+            return None
+        return latest.finished
+
+
+class LivenessView(Resource):
+    """
+    Liveness probe: returns 200 as long as the process can serve requests.
+    This endpoint never touches the database.
+    """
+
+    def get(self):
+        return {
+            'status': "alive",
+            'version': get_version(),
+        }
+
+
+class ReadinessView(Resource):
+    """
+    Readiness probe: returns 200 if a connection can be checked out of the
+    database pool and used, 503 otherwise, along with the pool statistics.
+    """
+
+    def get(self):
+        context = {
+            'status': "ready",
+            'version': get_version(),
+            'pool': self.get_pool_status(),
+        }
+
+        try:
+            connection = db.engine.connect()
+            try:
+                connection.execute("SELECT 1")
+            finally:
+                connection.close()
+        except Exception as e:
+            context['status']  = "unavailable"
+            context['message'] = str(e)
+            return context, 503
+
+        return context
+
+    def get_pool_status(self):
+        """
+        Returns the connection pool statistics that the pool provides.
+        """
+        pool   = db.engine.pool
+        status = {'class': pool.__class__.__name__}
+
+        for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+            if hasattr(pool, name):
+                status[name] = getattr(pool, name)()
+
+        return status
+
+##########################################################################
+## Background Jobs
+##########################################################################
+
+
+class JobListView(Resource):
+    """
+    Lists the most recent background jobs and enqueues new ones. Jobs are
+    run by a separate worker process (see `elmr.jobs`), so a POST returns
+    immediately with the queued job and its progress can then be polled.
+    """
+
+    @property
+    def parser(self):
+        """
+        Returns the argument parser for the list of jobs.
+        """
+        if not hasattr(self, '_parser'):
+            self._parser = reqparse.RequestParser()
+            self._parser.add_argument('status', type=unicode, default=None)
+            self._parser.add_argument('limit', type=int, default=20)
+        return self._parser
+
+    @property
+    def create_parser(self):
+        """
+        Returns the argument parser for new jobs.
+        """
+        if not hasattr(self, '_create_parser'):
+            self._create_parser = reqparse.RequestParser()
+            self._create_parser.add_argument(
+                'kind', type=unicode, required=True,
+                choices=sorted(HANDLERS.keys())
+            )
+        return self._create_parser
+
+    def get(self):
+        args = self.parser.parse_args()
+        jobs = Job.query.order_by(Job.id.desc())
+
+        if args['status']:
+            jobs = jobs.filter_by(status=args['status'])
+
+        jobs = jobs.limit(max(args['limit'], 1))
+        return {"jobs": [serialize(job) for job in jobs]}
+
+    def post(self):
+        args = self.create_parser.parse_args()
+        job  = enqueue(args['kind'])
+        return serialize(job), 201
+
+
+class JobView(Resource):
+    """
+    Returns the status and progress of a single background job.
+    """
+
+    def get(self, job_id):
+        job = Job.query.get_or_404(job_id)
+        context = serialize(job)
+        context["error"] = job.error
+        return context
+
 ##########################################################################
 ## API Endpoints resource
 ##########################################################################
@@ -609,10 +1299,13 @@ class APIListView(Resource):
 
     RESOURCES = {
         "heartbeat": "status",
+        "liveness": "status/live",
+        "readiness": "status/ready",
         "sources": "source",
         "series": "series",
         "geography": "geo",
-        "wealth of nations": "regions"
+        "wealth of nations": "regions",
+        "jobs": "jobs",
     }
 
     def get(self):
@@ -642,10 +1335,17 @@ endpoint(APIListView, '/api/')
 endpoint(SourceListView, '/api/source/', endpoint='source-list')
 endpoint(SourceView, '/api/source/<source>/', endpoint='source-detail')
 endpoint(HeartbeatView, '/api/status/', endpoint="status-detail")
+endpoint(LivenessView, '/api/status/live/', endpoint="status-live")
+endpoint(ReadinessView, '/api/status/ready/', endpoint="status-ready")
 endpoint(SeriesListView, '/api/series/', endpoint='series-list')
 endpoint(SeriesView, '/api/series/<blsid>/', endpoint='series-detail')
 endpoint(GeoSourcesView, '/api/geo/', endpoint='geography-list')
 endpoint(GeoDatasetsView, '/api/geo/<source>/', endpoint='geography-datasets')
+endpoint(GeoPeriodView, '/api/geo/<source>/<dataset>/period/', endpoint='geography-period')
+endpoint(GeoBreaksView, '/api/geo/<source>/<dataset>/breaks/', endpoint='geography-breaks')
 endpoint(WealthOfNationsView, '/api/regions/', endpoint='wealth-of-nations')
+endpoint(RegionsView, '/api/regions/<source>/<dataset>/', endpoint='regions-detail')
+endpoint(JobListView, '/api/jobs/', endpoint='job-list')
+endpoint(JobView, '/api/jobs/<int:job_id>/', endpoint='job-detail')
 
 # Did you forget to modify the API list view?
@@ -27,10 +27,13 @@ from flask.ext.testing import TestCase
 
 EXPECTED_ENDPOINTS = {
     "heartbeat": "status",
+    "liveness": "status/live",
+    "readiness": "status/ready",
     "series": "series",
     "sources": "source",
     "geography": "geo",
-    "wealth of nations": "regions"
+    "wealth of nations": "regions",
+    "jobs": "jobs",
 }
 
 
@@ -40,8 +43,7 @@ class APIListTests(TestCase):
     """
 
     def create_app(self):
-        elmr.app.config.from_object('elmr.config.TestingConfig')
-        return elmr.app
+        return elmr.configure('elmr.config.TestingConfig')
 
     def get_endpoint(self, name):
         """
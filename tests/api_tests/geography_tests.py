@@ -0,0 +1,235 @@
+# tests.api_tests.geography_tests
+# Test the period and breaks endpoints of the geography API.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 09:41:26 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: geography_tests.py [] benjamin@bengfort.com $
+
+"""
+Test the period and breaks endpoints of the geography API.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+
+from datetime import date
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series, USAState, StateSeries
+from elmr.catalog import catalogs
+from elmr.breaks import breaks
+from elmr.signals import ingestion_finished
+from elmr.queries import series_records
+from elmr.ordinal import ordinal, label
+from elmr.fips import states_window
+
+##########################################################################
+## Test Cases
+##########################################################################
+
+ENDPOINT = "/api/geo/%s/unemployment-rate/period/"
+
+## The fixtures have no states, so a few are created for the LAUS series
+STATES = (
+    (1, u"24", u"Maryland", u"MD", u"LASST240000000000003"),
+    (2, u"28", u"Mississippi", u"MS", u"LASST280000000000003"),
+    (3, u"51", u"Virginia", u"VA", None),
+)
+
+
+class GeoPeriodTests(TestCase):
+    """
+    Tests the values of every state at a period of a geographic dataset.
+    """
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+        cls.app = elmr.configure('elmr.config.TestingConfig')
+        with cls.app.app_context():
+            for idx, fips, name, abbr, blsid in STATES:
+                elmr.db.session.add(USAState(
+                    id=idx, fips=fips, name=name, abbr=abbr, region=u"South"
+                ))
+                series = Series.query.filter_by(blsid=blsid).first()
+                if series is not None:
+                    elmr.db.session.add(StateSeries(
+                        id=idx, state_id=idx, series_id=series.id,
+                        adjusted=True, dataset=u"Unemployment Rate",
+                        source=u"LAUS", slug=u"unemployment-rate",
+                    ))
+            elmr.db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        catalogs.clear()
+        breaks.clear()
+
+    def test_period(self):
+        """
+        Test the values of the states at a single period
+        """
+        response = self.client.get(ENDPOINT % "laus" + "?period=2007-03")
+        self.assert200(response)
+
+        result = response.json
+        self.assertEqual(result["source"], "LAUS")
+        self.assertEqual(result["period"], "Mar 2007")
+        self.assertEqual(result["periods"], ["Mar 2007"])
+        self.assertTrue(result["adjusted"])
+        self.assertFalse(result["delta"])
+
+        # Virginia has no series for the dataset
+        self.assertEqual(
+            [row["State"] for row in result["data"]],
+            [u"Maryland", u"Mississippi"]
+        )
+
+        for row in result["data"]:
+            self.assertIn("Mar 2007", row)
+            self.assertEqual(set(row), {"fips", "State", "Mar 2007"})
+
+    def test_window(self):
+        """
+        Test that the window matches the records of each state
+        """
+        response = self.client.get(
+            ENDPOINT % "LAUS" + "?period=2007-01&before=2&after=3"
+        )
+        self.assert200(response)
+
+        result = response.json
+        first  = ordinal(date(2006, 11, 1))
+        self.assertEqual(result["period"], "Jan 2007")
+        self.assertEqual(
+            result["periods"], [label(first + idx) for idx in xrange(6)]
+        )
+
+        for row in result["data"]:
+            blsid  = [s[4] for s in STATES if s[1] == row["fips"]][0]
+            series = Series.query.filter_by(blsid=blsid).first()
+            values = dict(
+                (label(month), value) for month, value in series_records(
+                    series.id, date(2006, 11, 1), date(2007, 4, 1)
+                )
+            )
+
+            self.assertEqual(len(values), 6)
+            for period in result["periods"]:
+                self.assertAlmostEqual(row[period], values[period])
+
+    def test_missing_values(self):
+        """
+        Test that periods without records are omitted from the rows
+        """
+        states, first, matrix = states_window(
+            "LAUS", "unemployment-rate", date(2008, 1, 1), 2, 0
+        )
+
+        self.assertEqual(first, ordinal(date(2007, 11, 1)))
+        self.assertEqual(matrix.shape, (2, 3))
+        self.assertEqual([fips for fips, _ in states], [u"24", u"28"])
+
+        response = self.client.get(
+            ENDPOINT % "LAUS" + "?period=2008-01&before=2"
+        )
+        self.assert200(response)
+        for row in response.json["data"]:
+            self.assertIn("Dec 2007", row)
+            self.assertNotIn("Jan 2008", row)
+
+    def test_bad_requests(self):
+        """
+        Test the errors of the period endpoint
+        """
+        response = self.client.get(ENDPOINT % "CPS" + "?period=2007-01")
+        self.assert400(response)
+
+        response = self.client.get(ENDPOINT % "UMD" + "?period=2007-01")
+        self.assert404(response)
+
+        response = self.client.get(ENDPOINT % "LAUS")
+        self.assert400(response)
+
+        response = self.client.get(ENDPOINT % "LAUS" + "?period=2007-13")
+        self.assert400(response)
+
+        response = self.client.get(
+            ENDPOINT % "LAUS" + "?period=2007-01&after=13"
+        )
+        self.assert400(response)
+
+        response = self.client.get(
+            ENDPOINT % "LAUS" + "?period=2007-01&before=-1"
+        )
+        self.assert400(response)
+
+    def test_breaks(self):
+        """
+        Test the class breaks of a dataset across states and periods
+        """
+        response = self.client.get(
+            "/api/geo/laus/unemployment-rate/breaks/?classes=4"
+        )
+        self.assert200(response)
+
+        result = response.json
+        low, high = result["domain"]
+        self.assertEqual(result["classes"], 4)
+        self.assertEqual(len(result["extents"]), 24)
+        self.assertEqual(result["extents"][0]["period"], "Jan 2006")
+
+        for method in ("quantile", "equal", "jenks"):
+            values = result["breaks"][method]
+            self.assertEqual(len(values), 5, method)
+            self.assertEqual(values, sorted(values))
+            self.assertAlmostEqual(values[0], low)
+            self.assertAlmostEqual(values[-1], high)
+
+        for extent in result["extents"]:
+            self.assertTrue(low <= extent["min"] <= extent["max"] <= high)
+
+    def test_breaks_cached(self):
+        """
+        Test that the breaks are cached until the next ingestion
+        """
+        url = "/api/geo/LAUS/unemployment-rate/breaks/"
+        self.assert200(self.client.get(url))
+        self.assertEqual(len(breaks), 1)
+
+        self.assert200(self.client.get(url))
+        self.assertEqual(len(breaks), 1)
+
+        ingestion_finished.send(None)
+        self.assertEqual(len(breaks), 0)
+
+    def test_breaks_bad_requests(self):
+        """
+        Test the errors and the empty datasets of the breaks endpoint
+        """
+        url = "/api/geo/%s/unemployment-rate/breaks/"
+        self.assert400(self.client.get(url % "CESN"))
+        self.assert404(self.client.get(url % "UMD"))
+        self.assert400(self.client.get(url % "LAUS" + "?classes=1"))
+        self.assert400(self.client.get(url % "LAUS" + "?classes=13"))
+
+        response = self.client.get("/api/geo/LAUS/not-a-dataset/breaks/")
+        self.assert200(response)
+        self.assertIsNone(response.json["domain"])
+        self.assertIsNone(response.json["breaks"]["jenks"])
+        self.assertEqual(response.json["extents"], [])
@@ -18,9 +18,11 @@ Integration testing the endpoints endpoints of the ELMR app.
 ##########################################################################
 
 import elmr
+import elmr.views
 
 from tests.initdb import syncdb, dropdb
 from elmr.models import IngestionRecord
+from elmr.signals import ingestion_finished
 from flask.ext.testing import TestCase
 from datetime import datetime, timedelta
 
@@ -33,11 +35,11 @@ from datetime import datetime, timedelta
 class HeartbeatTests(TestCase):
 
     def create_app(self):
-        elmr.app.config.from_object('elmr.config.TestingConfig')
-        return elmr.app
+        return elmr.configure('elmr.config.TestingConfig')
 
     def setUp(self):
         syncdb()
+        elmr.views.ingestions.clear()
 
     def tearDown(self):
         dropdb()
@@ -65,6 +67,7 @@ class HeartbeatTests(TestCase):
 
         elmr.db.session.add(record)
         elmr.db.session.commit()
+        ingestion_finished.send(record)
 
     def test_heartbeat(self):
         """
@@ -168,3 +171,36 @@ class HeartbeatTests(TestCase):
         self.assertEquals(response.status_code, 200)
         self.assertIn("status", response.json)
         self.assertEquals("red", response.json["status"])
+
+    def test_heartbeat_snapshot(self):
+        """
+        Test that the heartbeat snapshot is refreshed on ingestion
+        """
+        response = self.client.get("/api/status/")
+        self.assertEquals("white", response.json["status"])
+
+        self.create_ingestion_record(439, 1529)
+        response = self.client.get("/api/status/")
+        self.assertEquals("red", response.json["status"])
+
+        self.create_ingestion_record(2, 1529)
+        response = self.client.get("/api/status/")
+        self.assertEquals("green", response.json["status"])
+
+    def test_liveness(self):
+        """
+        Test the liveness probe
+        """
+        response = self.client.get("/api/status/live/")
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals("alive", response.json["status"])
+        self.assertEquals(elmr.get_version(), response.json["version"])
+
+    def test_readiness(self):
+        """
+        Test the readiness probe
+        """
+        response = self.client.get("/api/status/ready/")
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals("ready", response.json["status"])
+        self.assertIn("pool", response.json)
@@ -17,10 +17,14 @@ Test the series endpoint of the API.
 ## Imports
 ##########################################################################
 
+import io
 import elmr
+import json
 import random
+import numpy as np
 
 from elmr.models import Series
+from elmr.npy import NPY_MIMETYPE, META_HEADER
 from flask.ext.testing import TestCase
 from tests.initdb import syncdb, dropdb, loaddb
 
@@ -35,8 +39,7 @@ class SeriesGETTests(TestCase):
     """
 
     def create_app(self):
-        elmr.app.config.from_object('elmr.config.TestingConfig')
-        return elmr.app
+        return elmr.configure('elmr.config.TestingConfig')
 
     @classmethod
     def setUpClass(cls):
@@ -46,6 +49,12 @@ class SeriesGETTests(TestCase):
             s.blsid for s in Series.query.filter_by(is_delta=False)
         ]
 
+        # Series with every month of the fixtures (some have no records)
+        cls.FULL_SERIES_IDS = [
+            blsid for blsid in cls.SERIES_IDS
+            if Series.query.filter_by(blsid=blsid).first().records.count() == 24
+        ]
+
     @classmethod
     def tearDownClass(cls):
         dropdb()
@@ -57,6 +66,19 @@ class SeriesGETTests(TestCase):
         s = random.choice(self.SERIES_IDS)
         return "/api/series/%s/" % s
 
+    def get_random_full_endpoint(self):
+        """
+        Returns a random detail endpoint of a series with all of its records
+        """
+        s = random.choice(self.FULL_SERIES_IDS)
+        return "/api/series/%s/" % s
+
+    def relative(self, url):
+        """
+        Strips the scheme and host from a url returned by the API
+        """
+        return url.replace("http://localhost", "", 1)
+
     def test_add_slash_series_list(self):
         """
         Test that a slash is added to the end of the series list.
@@ -168,6 +190,60 @@ class SeriesGETTests(TestCase):
         self.assertEqual(response.json["total"], 0)
         self.assertEqual(len(response.json["series"]), 0)
 
+    def test_keyset_series_list(self):
+        """
+        Test walking the entire series list with keyset cursors
+        """
+        response = self.client.get("/api/series/?cursor=&per_page=500")
+        self.assertEquals(response.status_code, 200)
+
+        for key in ("per_page", "order", "total", "cursor", "next", "series"):
+            self.assertIn(key, response.json)
+
+        self.assertEqual(response.json["total"], 3368)
+
+        blsids = []
+        while True:
+            blsids.extend([s["blsid"] for s in response.json["series"]])
+            if response.json["next"] is None:
+                break
+
+            self.assertIsNotNone(response.json["cursor"])
+            response = self.client.get(self.relative(response.json["next"]))
+            self.assertEquals(response.status_code, 200)
+
+        self.assertEqual(len(blsids), 3368)
+        self.assertEqual(len(set(blsids)), 3368)
+
+    def test_keyset_series_list_by_blsid(self):
+        """
+        Test keyset pagination ordered by blsid and filtered by source
+        """
+        endpoint = "/api/series/?cursor=&order=blsid&source=CPS&per_page=30"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 200)
+        self.assertEqual(response.json["total"], 40)
+        self.assertEqual(len(response.json["series"]), 30)
+
+        first = [s["blsid"] for s in response.json["series"]]
+        self.assertEqual(first, sorted(first))
+
+        response = self.client.get(self.relative(response.json["next"]))
+        self.assertEquals(response.status_code, 200)
+        self.assertEqual(len(response.json["series"]), 10)
+        self.assertIsNone(response.json["next"])
+
+        for item in response.json["series"]:
+            self.assertEqual(item["source"], "CPS")
+            self.assertGreater(item["blsid"], first[-1])
+
+    def test_keyset_series_list_bad_cursor(self):
+        """
+        Test that an unparseable cursor returns a 400
+        """
+        response = self.client.get("/api/series/?cursor=bloopies")
+        self.assertEquals(response.status_code, 400)
+
     def test_get_series_detail(self):
         """
         Assert that a series detail can be fetched.
@@ -224,6 +300,167 @@ class SeriesGETTests(TestCase):
         self.assertEquals(response.status_code, 200)
         self.assertEquals(len(response.json['data']), 12)
 
+    def test_series_detail_month_range(self):
+        """
+        Test that a series detail can be filtered by month
+        """
+        endpoint = self.get_random_full_endpoint()
+        endpoint += "?start=2006-09&end=2007-02"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        self.assertEquals(len(data), 6)
+        self.assertEquals(data[0]['period'], "Sep 2006")
+        self.assertEquals(data[-1]['period'], "Feb 2007")
+
+    def test_series_detail_last(self):
+        """
+        Test that the last N periods of a series detail can be fetched
+        """
+        endpoint = self.get_random_full_endpoint()
+        response = self.client.get(endpoint + "?last=3")
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        self.assertEquals(
+            [item['period'] for item in data],
+            ["Oct 2007", "Nov 2007", "Dec 2007"]
+        )
+
+        # Asking for more periods than exist returns all of them
+        response = self.client.get(endpoint + "?last=100&end=2006")
+        self.assertEquals(len(response.json['data']), 12)
+
+    def test_series_detail_bad_period(self):
+        """
+        Test that unparseable periods or last return a 400
+        """
+        endpoint = self.get_random_detail_endpoint()
+        for query in ("?start=bloopies", "?end=2007-13", "?last=0"):
+            response = self.client.get(endpoint + query)
+            self.assertEquals(response.status_code, 400)
+
+    def test_series_detail_columnar(self):
+        """
+        Test the columnar format of a series detail
+        """
+        endpoint = self.get_random_full_endpoint() + "?format=columnar"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        for key in ("start", "end", "frequency", "values"):
+            self.assertIn(key, data)
+
+        self.assertEqual(data["start"], "2006-01")
+        self.assertEqual(data["end"], "2007-12")
+        self.assertEqual(data["frequency"], "monthly")
+        self.assertEqual(len(data["values"]), 24)
+
+    def test_series_detail_npy(self):
+        """
+        Test the binary NumPy format of a series detail
+        """
+        endpoint = self.get_random_full_endpoint()
+        response = self.client.get(endpoint, headers={"Accept": NPY_MIMETYPE})
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.mimetype, NPY_MIMETYPE)
+
+        values = np.load(io.BytesIO(response.data))
+        meta   = json.loads(response.headers[META_HEADER])
+
+        self.assertEqual(values.shape, (24,))
+        self.assertEqual(meta["start"], "2006-01")
+        self.assertEqual(meta["shape"], [24])
+
+    def test_series_detail_quarterly(self):
+        """
+        Test that a series detail can be aggregated to quarters
+        """
+        endpoint = self.get_random_full_endpoint() + "?frequency=quarterly"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        self.assertEqual(len(data), 8)
+        self.assertEqual(data[0]["period"], "Q1 2006")
+        self.assertEqual(data[-1]["period"], "Q4 2007")
+
+    def test_series_detail_annual_columnar(self):
+        """
+        Test the columnar format of an annual series detail
+        """
+        endpoint = self.get_random_full_endpoint()
+        endpoint += "?frequency=annual&how=last&format=columnar"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        self.assertEqual(data["start"], "2006")
+        self.assertEqual(data["end"], "2007")
+        self.assertEqual(data["frequency"], "annual")
+        self.assertEqual(len(data["values"]), 2)
+
+        # The last month of the year is the value of an annual "last"
+        monthly = self.client.get(
+            endpoint.split("?")[0] + "?format=columnar"
+        ).json['data']
+        self.assertEqual(data["values"][-1], monthly["values"][-1])
+
+    def test_series_detail_max_points(self):
+        """
+        Test that a series detail can be downsampled to a maximum of points
+        """
+        endpoint = self.get_random_full_endpoint()
+        response = self.client.get(endpoint + "?max_points=10")
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        full = self.client.get(endpoint).json['data']
+        self.assertEqual(len(data), min(10, len(full)))
+        self.assertEqual(data[0], full[0])
+        self.assertEqual(data[-1], full[-1])
+
+    def test_series_detail_max_points_columnar(self):
+        """
+        Test that a downsampled columnar series includes the offsets
+        """
+        endpoint = self.get_random_full_endpoint()
+        endpoint += "?max_points=6&format=columnar"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        self.assertEqual(len(data["values"]), 6)
+        self.assertEqual(len(data["offsets"]), 6)
+        self.assertEqual(data["offsets"][0], 0)
+        self.assertEqual(data["offsets"][-1], 23)
+
+    def test_series_detail_bad_max_points(self):
+        """
+        Test that a non positive max points returns a 400
+        """
+        endpoint = self.get_random_detail_endpoint() + "?max_points=0"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 400)
+
+    def test_series_detail_bad_frequency(self):
+        """
+        Test that an unknown frequency returns a 400
+        """
+        endpoint = self.get_random_detail_endpoint() + "?frequency=weekly"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 400)
+
+    def test_series_detail_bad_format(self):
+        """
+        Test that an unknown format returns a 400
+        """
+        endpoint = self.get_random_detail_endpoint() + "?format=bloopies"
+        response = self.client.get(endpoint)
+        self.assertEquals(response.status_code, 400)
+
     def test_missing_series_detail(self):
         """
         Test that an unknown series identifier returns 404
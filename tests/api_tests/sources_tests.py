@@ -17,12 +17,16 @@ Test the sources endpoint of the API.
 ## Imports
 ##########################################################################
 
+import io
 import elmr
+import json
+import numpy as np
 
 from flask.ext.testing import TestCase
 from tests.initdb import syncdb, dropdb, loaddb
 from tests import EXPECTED_VERSION
 from elmr.config import TestingConfig
+from elmr.npy import NPY_MIMETYPE, META_HEADER
 
 ##########################################################################
 ## Test Cases
@@ -35,8 +39,7 @@ class SourcesGETTests(TestCase):
     """
 
     def create_app(self):
-        elmr.app.config.from_object('elmr.config.TestingConfig')
-        return elmr.app
+        return elmr.configure('elmr.config.TestingConfig')
 
     @classmethod
     def setUpClass(cls):
@@ -158,6 +161,58 @@ class SourcesGETTests(TestCase):
         self.assertEqual(period['start'], start)
         self.assertEqual(period['end'], end)
 
+    def test_cps_source_columnar(self):
+        """
+        Test that the CPS source can be fetched in columnar format
+        """
+
+        response = self.client.get("/api/source/CPS/?format=columnar")
+        self.assertEquals(response.status_code, 200)
+
+        data = response.json['data']
+        for key in ("start", "end", "frequency", "values"):
+            self.assertIn(key, data)
+
+        self.assertEqual(len(data['values']), 40)
+        for values in data['values'].values():
+            self.assertEqual(len(values), 24)
+
+        period = response.json['period']
+        self.assertEqual(period['start'], "%s-01" % TestingConfig.STARTYEAR)
+        self.assertEqual(period['end'], "%s-12" % TestingConfig.ENDYEAR)
+
+    def test_cps_source_month_range(self):
+        """
+        Test that a source can be filtered by month and the last N periods
+        """
+
+        response = self.client.get("/api/source/CPS/?start=2006-11&end=2007-03")
+        self.assertEquals(response.status_code, 200)
+        self.assertEqual(len(response.json['data']), 5)
+        self.assertEqual(response.json['period']['start'], "Nov 2006")
+        self.assertEqual(response.json['period']['end'], "Mar 2007")
+
+        response = self.client.get("/api/source/CPS/?last=2")
+        self.assertEquals(response.status_code, 200)
+        self.assertEqual(len(response.json['data']), 2)
+        self.assertEqual(response.json['period']['start'], "Nov 2007")
+
+    def test_cps_source_npy(self):
+        """
+        Test that the CPS source can be fetched as a NumPy matrix
+        """
+
+        response = self.client.get("/api/source/CPS/?format=npy")
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(response.mimetype, NPY_MIMETYPE)
+
+        matrix = np.load(io.BytesIO(response.data))
+        meta   = json.loads(response.headers[META_HEADER])
+
+        self.assertEqual(matrix.shape, (24, 40))
+        self.assertEqual(len(meta["columns"]), 40)
+        self.assertEqual(meta["start"], "%s-01" % TestingConfig.STARTYEAR)
+
     def test_laus_source(self):
         """
         Test that the LAUS source can not be fetched
@@ -0,0 +1,170 @@
+# tests.arrays_tests
+# Testing the array per series storage.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 13:48:26 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: arrays_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the array per series storage.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+import numpy as np
+
+from datetime import date
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series, SeriesRecord, SeriesArray
+from elmr.config import TestingConfig
+from elmr.ordinal import ordinal
+from elmr.store import series_array
+from elmr.arrays import backfill, has_arrays, series_values
+from elmr.arrays import update_array, benchmark
+
+##########################################################################
+## Series Arrays Tests
+##########################################################################
+
+
+class SeriesArraysTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        backfill()
+
+    def tearDown(self):
+        self.app.config['USE_SERIES_ARRAYS'] = TestingConfig.USE_SERIES_ARRAYS
+        SeriesArray.query.delete()
+        elmr.db.session.commit()
+
+    def get_series_ids(self):
+        """
+        Returns every tenth series id (comparing all is slow)
+        """
+        return [s.id for s in Series.query.order_by(Series.id)][::10]
+
+    def test_backfill(self):
+        """
+        Test that every series with records has one array
+        """
+        expected = elmr.db.session.query(
+            elmr.db.func.count(elmr.db.distinct(SeriesRecord.series_id))
+        ).scalar()
+
+        self.assertTrue(has_arrays())
+        self.assertEqual(SeriesArray.query.count(), expected)
+        self.assertEqual(backfill(self.get_series_ids()[:3]), 3)
+        self.assertEqual(SeriesArray.query.count(), expected)
+
+    def test_arrays_match_records(self):
+        """
+        Test that the arrays give the same values as the records
+        """
+        queries = (
+            {},
+            {"start": date(2006, 9, 1), "end": date(2007, 2, 1)},
+            {"last": 5},
+        )
+
+        for sid in self.get_series_ids():
+            for kwargs in queries:
+                self.app.config['USE_SERIES_ARRAYS'] = True
+                stored = series_array(sid, **kwargs)
+
+                self.app.config['USE_SERIES_ARRAYS'] = False
+                actual = series_array(sid, **kwargs)
+
+                self.assertEqual(stored[0], actual[0])
+                np.testing.assert_array_equal(stored[1], actual[1])
+
+    def test_missing_array(self):
+        """
+        Test that series without an array are read from the records
+        """
+        sid = self.get_series_ids()[0]
+        SeriesArray.query.filter_by(series_id=sid).delete()
+        elmr.db.session.commit()
+
+        self.assertIsNone(series_values(sid))
+
+        self.app.config['USE_SERIES_ARRAYS'] = True
+        first, values = series_array(sid)
+        self.assertGreater(len(values), 0)
+
+    def test_update_array(self):
+        """
+        Test that values are written into the array in place
+        """
+        sid = self.get_series_ids()[0]
+        first, values = series_values(sid)
+
+        # A revision, a value before the start and one after a gap
+        update_array(sid, [
+            (first, 42.0),
+            (first - 2, 1.0),
+            (first + len(values) + 1, 2.0),
+        ])
+        elmr.db.session.commit()
+
+        start, data = series_values(sid)
+        self.assertEqual(start, first - 2)
+        self.assertEqual(len(data), len(values) + 4)
+        self.assertEqual(data[0], 1.0)
+        self.assertTrue(np.isnan(data[1]))
+        self.assertEqual(data[2], 42.0)
+        np.testing.assert_array_equal(data[3:-2], values[1:])
+        self.assertTrue(np.isnan(data[-2]))
+        self.assertEqual(data[-1], 2.0)
+
+    def test_update_without_array(self):
+        """
+        Test that series that have not been backfilled are not updated
+        """
+        SeriesArray.query.delete()
+        elmr.db.session.commit()
+
+        sid = self.get_series_ids()[0]
+        self.assertIsNone(update_array(sid, [(ordinal(date(2008, 1, 1)), 1.0)]))
+        self.assertIsNone(series_values(sid))
+
+    def test_endpoint_from_arrays(self):
+        """
+        Test that the series endpoint answers the same from the arrays
+        """
+        blsid    = Series.query.get(self.get_series_ids()[0]).blsid
+        endpoint = "/api/series/%s/?start=2006-06" % blsid
+        expected = self.client.get(endpoint).json
+
+        self.app.config['USE_SERIES_ARRAYS'] = True
+        self.assertEqual(self.client.get(endpoint).json, expected)
+
+    def test_benchmark(self):
+        """
+        Test the comparison of the storage layouts
+        """
+        results = benchmark(self.get_series_ids()[:5], repeat=1)
+
+        self.assertEqual(results["series"], 5)
+        for name in ("records", "arrays"):
+            self.assertGreater(results[name]["size"], 0)
+            self.assertGreaterEqual(results[name]["read"], 0)
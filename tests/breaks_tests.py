@@ -0,0 +1,143 @@
+# tests.breaks_tests
+# Testing the choropleth classification of the geographic datasets.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 13:05:37 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: breaks_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the choropleth classification of the geographic datasets.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import unittest
+import numpy as np
+import elmr.breaks
+
+from itertools import combinations
+from elmr.breaks import quantile_breaks, equal_breaks, jenks_breaks
+from elmr.breaks import period_extents
+
+##########################################################################
+## Helpers
+##########################################################################
+
+
+def deviations(values, breaks):
+    """
+    Returns the sum of the squared deviations of the classes of the breaks,
+    where each break after the first is the upper bound of a class.
+    """
+    total = 0.0
+    lower = -np.inf
+    for upper in breaks[1:]:
+        members = values[(values > lower) & (values <= upper)]
+        if len(members):
+            total += ((members - members.mean()) ** 2).sum()
+        lower = upper
+    return total
+
+
+def brute_force(values, classes):
+    """
+    Returns the least squared deviations of any split of the values.
+    """
+    points = np.unique(values)
+    best   = np.inf
+    for uppers in combinations(points[:-1], classes - 1):
+        breaks = [points[0]] + list(uppers) + [points[-1]]
+        best   = min(best, deviations(values, breaks))
+    return best
+
+##########################################################################
+## Breaks Tests
+##########################################################################
+
+
+class BreaksTests(unittest.TestCase):
+
+    def setUp(self):
+        self.sample = elmr.breaks.JENKS_SAMPLE
+
+    def tearDown(self):
+        elmr.breaks.JENKS_SAMPLE = self.sample
+
+    def test_quantile_breaks(self):
+        """
+        Test the breaks of classes with equal counts
+        """
+        values = np.arange(1, 101, dtype=np.float64)
+        breaks = quantile_breaks(values, 4)
+        self.assertEqual(len(breaks), 5)
+        self.assertEqual(breaks[0], 1.0)
+        self.assertEqual(breaks[-1], 100.0)
+        self.assertAlmostEqual(breaks[2], 50.5)
+
+    def test_equal_breaks(self):
+        """
+        Test the breaks of classes of equal width
+        """
+        values = np.array([2.0, 3.5, 10.0, 4.0])
+        self.assertEqual(
+            equal_breaks(values, 4).tolist(), [2.0, 4.0, 6.0, 8.0, 10.0]
+        )
+
+    def test_jenks_breaks(self):
+        """
+        Test that the Jenks breaks are the optimal classes
+        """
+        values = np.array([4.1, 4.2, 4.2, 4.4, 6.0, 6.1, 9.8, 10.0, 10.2])
+        breaks = jenks_breaks(values, 3)
+        self.assertEqual(breaks.tolist(), [4.1, 4.4, 6.1, 10.2])
+
+        random = np.random.RandomState(42)
+        for _ in xrange(10):
+            values = np.round(random.gamma(2.0, 2.0, 14), 1)
+            for classes in (2, 3, 4):
+                breaks = jenks_breaks(values, classes)
+                self.assertEqual(len(breaks), classes + 1)
+                self.assertAlmostEqual(
+                    deviations(values, breaks), brute_force(values, classes)
+                )
+
+    def test_jenks_few_values(self):
+        """
+        Test the Jenks breaks with fewer distinct values than classes
+        """
+        values = np.array([5.0, 5.0, 7.0])
+        self.assertEqual(jenks_breaks(values, 9).tolist(), [5.0, 5.0, 7.0])
+        self.assertEqual(jenks_breaks(np.array([3.0]), 4).tolist(), [3.0, 3.0])
+
+    def test_jenks_sample(self):
+        """
+        Test that many distinct values are classified on their quantiles
+        """
+        elmr.breaks.JENKS_SAMPLE = 50
+        values = np.concatenate([
+            np.linspace(0, 1, 500), np.linspace(10, 11, 500)
+        ])
+        breaks = jenks_breaks(values, 2)
+        self.assertEqual(breaks[0], 0.0)
+        self.assertEqual(breaks[-1], 11.0)
+        self.assertLessEqual(breaks[1], 1.0)
+        self.assertGreaterEqual(breaks[1], 0.9)
+
+    def test_period_extents(self):
+        """
+        Test the extents of the values of the states at each period
+        """
+        matrix = np.array([
+            [1.0, np.nan, 3.0],
+            [2.0, np.nan, np.nan],
+        ])
+        self.assertEqual(
+            period_extents(100, matrix), [(100, 1.0, 2.0), (102, 3.0, 3.0)]
+        )
+        self.assertEqual(period_extents(100, np.empty((0, 3))), [])
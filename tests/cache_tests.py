@@ -0,0 +1,96 @@
+# tests.cache_tests
+# Testing the elmr.cache module
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 14:22:31 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: cache_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the elmr.cache module
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import unittest
+
+from elmr.cache import Cache
+from blinker import Namespace
+
+##########################################################################
+## Cache Tests
+##########################################################################
+
+
+class CacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+    def loader(self):
+        self.calls += 1
+        return self.calls
+
+    def test_get_memoizes(self):
+        """
+        Test that the loader is only called once for a key
+        """
+        cache = Cache()
+        self.assertEqual(cache.get("a", self.loader), 1)
+        self.assertEqual(cache.get("a", self.loader), 1)
+        self.assertEqual(cache.get("b", self.loader), 2)
+        self.assertIn("a", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_timeout(self):
+        """
+        Test that values are recomputed after they expire
+        """
+        cache = Cache(timeout=0.01)
+        self.assertEqual(cache.get("a", self.loader), 1)
+        time.sleep(0.02)
+        self.assertEqual(cache.get("a", self.loader), 2)
+
+    def test_clear_on_signal(self):
+        """
+        Test that the cache can be cleared by a signal
+        """
+        cache  = Cache()
+        signal = Namespace().signal("test-signal")
+        signal.connect(cache.clear)
+
+        self.assertEqual(cache.get("a", self.loader), 1)
+        signal.send(self)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get("a", self.loader), 2)
+
+    def test_discard(self):
+        """
+        Test that a discarded value is recomputed
+        """
+        cache = Cache()
+        self.assertEqual(cache.get("a", self.loader), 1)
+        cache.discard("a")
+        cache.discard("b")
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.get("a", self.loader), 2)
+
+    def test_maxsize(self):
+        """
+        Test that the oldest values are evicted beyond the maxsize
+        """
+        cache = Cache(maxsize=2)
+        cache.get("a", self.loader)
+        cache.get("b", self.loader)
+        cache.get("c", self.loader)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertIn("c", cache)
@@ -0,0 +1,172 @@
+# tests.catalog_tests
+# Testing the in-process catalog of the series and state metadata.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 10:04:51 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: catalog_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the in-process catalog of the series and state metadata.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+
+from sqlalchemy import event
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series
+from elmr.signals import series_changed
+from elmr.catalog import Catalog, SeriesEntry, StateEntry, StateSeriesEntry
+from elmr.catalog import catalogs, get_catalog
+
+##########################################################################
+## Catalog Tests
+##########################################################################
+
+
+class CatalogTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        catalogs.clear()
+
+    def test_series_lookups(self):
+        """
+        Test that the catalog series match the database
+        """
+        catalog = get_catalog()
+        self.assertEqual(len(catalog), Series.query.count())
+
+        series = Series.query.filter_by(source=u"CPS", is_delta=False).first()
+        entry  = catalog.series(series.blsid)
+
+        self.assertEqual(entry.id, series.id)
+        self.assertEqual(entry.title, series.title)
+        self.assertEqual(catalog.get(series.id), entry)
+        self.assertEqual(catalog.delta(entry).id, series.delta.id)
+        self.assertIsNone(catalog.series(u"NOTABLSID"))
+
+    def test_source_lookups(self):
+        """
+        Test the series of a source and the sources
+        """
+        catalog = get_catalog()
+        titles  = [s.title for s in catalog.source(u"CPS", order='title')]
+        ids     = [s.id for s in catalog.source(u"CPS")]
+
+        self.assertEqual(len(ids), 40)
+        self.assertEqual(titles, sorted(titles))
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(catalog.source(u"UMD"), [])
+        self.assertIn((u"CPS", 40), catalog.sources())
+
+    def test_state_lookups(self):
+        """
+        Test the state and state series lookups
+        """
+        catalog = Catalog(
+            [SeriesEntry(1, u"LASST240000000000003", u"Maryland", u"LAUS",
+                         True, False, True, None)],
+            [StateEntry(2, u"24", u"Maryland", u"MD", u"Mideast"),
+             StateEntry(1, u"01", u"Alabama", u"AL", u"Southeast")],
+            [StateSeriesEntry(1, 2, 1, False, u"Unemployment Rate", u"LAUS",
+                              None, u"unemployment-rate"),
+             StateSeriesEntry(2, 2, 1, True, u"Unemployment Rate", u"LAUS",
+                              None, u"unemployment-rate")],
+        )
+
+        self.assertEqual(
+            [s.name for s in catalog.states], [u"Alabama", u"Maryland"]
+        )
+        self.assertEqual(catalog.state(u"24").abbr, u"MD")
+
+        entry = catalog.state_series_entry(2, u"LAUS", u"unemployment-rate")
+        self.assertEqual(entry.id, 1)
+        entry = catalog.state_series_entry(
+            2, u"LAUS", u"unemployment-rate", True
+        )
+        self.assertEqual(entry.id, 2)
+        self.assertIsNone(catalog.state_series_entry(1, u"LAUS", u"x"))
+
+        self.assertEqual(catalog.geo_sources(), [u"LAUS"])
+        self.assertEqual(
+            catalog.datasets(u"LAUS", "dataset"), [u"Unemployment Rate"]
+        )
+        self.assertEqual(catalog.datasets(u"LAUS", "category"), [])
+
+    def test_invalidation(self):
+        """
+        Test that the catalog is reloaded when a series changes
+        """
+        catalog = get_catalog()
+        self.assertIs(get_catalog(), catalog)
+
+        series_changed.send(None)
+        reloaded = get_catalog()
+        self.assertIsNot(reloaded, catalog)
+        self.assertGreater(reloaded.version, catalog.version)
+
+    def test_put_invalidates(self):
+        """
+        Test that editing a series title is seen by the catalog
+        """
+        series = Series.query.filter_by(source=u"CESN").first()
+        title  = series.title
+        get_catalog()
+
+        try:
+            response = self.client.put(
+                "/api/series/%s/" % series.blsid, data={"title": "Changed"}
+            )
+            self.assert200(response)
+            self.assertEqual(get_catalog().series(series.blsid).title,
+                             u"Changed")
+        finally:
+            series = Series.query.get(series.id)
+            series.title = title
+            elmr.db.session.commit()
+            series_changed.send(series)
+
+    def test_no_metadata_queries(self):
+        """
+        Test that a series request does not query the series metadata
+        """
+        series = Series.query.filter_by(source=u"CPS").first()
+        get_catalog()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(elmr.db.engine, "before_cursor_execute", record)
+        try:
+            response = self.client.get("/api/series/%s/" % series.blsid)
+            self.assert200(response)
+
+            response = self.client.get("/api/series/?source=CPS")
+            self.assert200(response)
+        finally:
+            event.remove(elmr.db.engine, "before_cursor_execute", record)
+
+        for statement in statements:
+            self.assertNotIn("FROM series", statement)
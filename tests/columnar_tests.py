@@ -0,0 +1,94 @@
+# tests.columnar_tests
+# Testing the elmr.columnar module
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 09:40:12 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: columnar_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the elmr.columnar module
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import unittest
+
+from datetime import date
+from elmr.columnar import month_index, month_label
+from elmr.columnar import columnar, columnar_frame
+
+##########################################################################
+## Columnar Tests
+##########################################################################
+
+
+class ColumnarTests(unittest.TestCase):
+
+    def test_month_index(self):
+        """
+        Test that consecutive months have consecutive indices
+        """
+        self.assertEqual(
+            month_index(date(2001, 1, 1)) - month_index(date(2000, 12, 1)), 1
+        )
+        self.assertEqual(month_label(month_index(date(2008, 9, 1))), "2008-09")
+        self.assertEqual(month_label(month_index(date(2008, 12, 1))), "2008-12")
+
+    def test_columnar(self):
+        """
+        Test the columnar representation of a series
+        """
+        records = [
+            (date(2006, 11, 1), 1.0),
+            (date(2006, 12, 1), 2.0),
+            (date(2007, 1, 1), 3.0),
+        ]
+
+        data = columnar(records)
+        self.assertEqual(data["start"], "2006-11")
+        self.assertEqual(data["end"], "2007-01")
+        self.assertEqual(data["frequency"], "monthly")
+        self.assertEqual(data["values"], [1.0, 2.0, 3.0])
+
+    def test_columnar_gaps(self):
+        """
+        Test that gaps in a series are filled with explicit nulls
+        """
+        records = [
+            (date(2006, 1, 1), 1.0),
+            (date(2006, 4, 1), 4.0),
+        ]
+
+        data = columnar(records)
+        self.assertEqual(data["values"], [1.0, None, None, 4.0])
+
+    def test_columnar_empty(self):
+        """
+        Test the columnar representation of an empty series
+        """
+        data = columnar([])
+        self.assertIsNone(data["start"])
+        self.assertEqual(data["values"], [])
+
+    def test_columnar_frame(self):
+        """
+        Test that a frame aligns all series to a common start and length
+        """
+        series = {
+            "A": [(date(2006, 1, 1), 1.0), (date(2006, 2, 1), 2.0)],
+            "B": [(date(2006, 2, 1), 5.0), (date(2006, 3, 1), 6.0)],
+            "C": [],
+        }
+
+        data = columnar_frame(series)
+        self.assertEqual(data["start"], "2006-01")
+        self.assertEqual(data["end"], "2006-03")
+        self.assertEqual(data["values"]["A"], [1.0, 2.0, None])
+        self.assertEqual(data["values"]["B"], [None, 5.0, 6.0])
+        self.assertEqual(data["values"]["C"], [None, None, None])
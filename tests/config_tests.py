@@ -47,6 +47,7 @@ class ConfigurationTests(unittest.TestCase):
         self.assertEqual(Config.STARTYEAR, "2000")
         self.assertEqual(Config.ENDYEAR, "2015")
         self.assertTrue(Config.FIXTURES.endswith("fixtures"))
+        self.assertEqual(Config.CACHE_TIMEOUT, "3600")
 
         self.assertTrue(TestingConfig.DEBUG)
         self.assertTrue(TestingConfig.TESTING)
@@ -0,0 +1,114 @@
+# tests.dbstats_tests
+# Testing the elmr.dbstats module
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 15:40:27 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: dbstats_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the elmr.dbstats module
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from tests.partitions_tests import execute_script, UPGRADE
+from elmr.partitions import is_partitioned
+from elmr.dbstats import hit_ratio, table_statistics, database_statistics
+
+##########################################################################
+## Database Statistics Tests
+##########################################################################
+
+
+class DatabaseStatisticsTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def test_hit_ratio(self):
+        """
+        Test the cache hit ratio computation
+        """
+        self.assertIsNone(hit_ratio(0, 0))
+        self.assertEqual(hit_ratio(3, 1), 0.75)
+
+    def test_table_statistics(self):
+        """
+        Test that table statistics are returned for the dashboard tables
+        """
+        stats = table_statistics()
+        for name in ("series", "records", "ingestions", "states_series"):
+            self.assertIn(name, stats)
+            for key in ("rows", "table_size", "index_size", "total_size"):
+                self.assertIn(key, stats[name])
+
+        self.assertGreater(stats["records"]["total_size"], 0)
+
+    def test_exact_table_statistics(self):
+        """
+        Test that exact row counts match the fixtures
+        """
+        stats = table_statistics(exact=True)
+        self.assertTrue(stats["series"]["exact"])
+        self.assertEqual(stats["series"]["rows"], 3368)
+        self.assertEqual(stats["records"]["rows"], 40348)
+
+    def test_database_statistics(self):
+        """
+        Test the database size and hit ratio
+        """
+        stats = database_statistics()
+        self.assertGreater(stats["size"], 0)
+
+
+class PartitionedStatisticsTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+        execute_script(UPGRADE)
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def test_partitioned_records(self):
+        """
+        Test that the records are reported as the sum of their partitions
+        """
+        self.assertTrue(is_partitioned())
+        elmr.db.session.execute("ANALYZE records")
+        elmr.db.session.commit()
+
+        stats = table_statistics()["records"]
+        self.assertGreater(stats["table_size"], 0)
+        self.assertGreater(stats["index_size"], 0)
+        self.assertGreater(stats["total_size"], stats["table_size"])
+        self.assertGreater(stats["rows"], 0)
+        self.assertIn("seq_scans", stats)
+
+        stats = table_statistics(exact=True)["records"]
+        self.assertEqual(stats["rows"], 40348)
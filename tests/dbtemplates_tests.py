@@ -0,0 +1,94 @@
+# tests.dbtemplates_tests
+# Testing the capture and restore of template databases.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 23 15:18:40 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: dbtemplates_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the capture and restore of template databases.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from tests.initdb import SERIES_FIXTURE, RECORDS_FIXTURE
+from elmr.models import Series, SeriesRecord
+from elmr.dbtemplates import fixture_key, template_name, templates
+from elmr.dbtemplates import has_template, capture, restore, drop
+
+##########################################################################
+## Template Tests
+##########################################################################
+
+KEY = "testkey"
+
+
+class DBTemplateTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        drop(KEY)
+        dropdb()
+
+    def test_fixture_key(self):
+        """
+        Test that the key is the hash of the fixtures and the extras
+        """
+        key = fixture_key([SERIES_FIXTURE])
+        self.assertEqual(len(key), 16)
+        self.assertEqual(key, fixture_key([SERIES_FIXTURE]))
+        self.assertNotEqual(key, fixture_key([RECORDS_FIXTURE]))
+        self.assertNotEqual(key, fixture_key([SERIES_FIXTURE], "records"))
+        self.assertEqual(template_name(key), "elmrtest_tpl_" + key)
+
+    def test_capture_restore(self):
+        """
+        Test restoring the database to the captured template
+        """
+        records = SeriesRecord.query.count()
+        name, _ = capture(KEY)
+        self.assertEqual(name, "elmrtest_tpl_testkey")
+        self.assertTrue(has_template(KEY))
+        self.assertIn(name, [template for template, _ in templates()])
+
+        # Changes after the capture are discarded by the restore
+        SeriesRecord.query.delete()
+        Series.query.filter(Series.delta_id.isnot(None)).update(
+            {"delta_id": None}, synchronize_session=False
+        )
+        Series.query.delete()
+        elmr.db.session.commit()
+        self.assertEqual(SeriesRecord.query.count(), 0)
+
+        name, seconds = restore(KEY)
+        self.assertLess(seconds, 1.0)
+        self.assertEqual(SeriesRecord.query.count(), records)
+        self.assertGreater(Series.query.count(), 0)
+
+    def test_missing_template(self):
+        """
+        Test that restoring a template that was never captured fails
+        """
+        with self.assertRaises(LookupError):
+            restore("notcaptured")
+
+        self.assertFalse(has_template("notcaptured"))
+        self.assertEqual(drop("notcaptured"), "elmrtest_tpl_notcaptured")
@@ -0,0 +1,190 @@
+# tests.encoding_tests
+# Testing the fast JSON representation of the API responses.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 15:02:44 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: encoding_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the fast JSON representation of the API responses.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import elmr
+import unittest
+import numpy as np
+import elmr.encoding
+
+from flask import Response
+from elmr.ordinal import ordinal
+from datetime import date
+from elmr.encoding import get_encoder, json_labels, json_floats
+from elmr.encoding import RecordsArray, PairsArray, RowsArray
+from elmr.encoding import substitute, output_json
+
+##########################################################################
+## Encoding Tests
+##########################################################################
+
+SEP2008 = ordinal(date(2008, 9, 1))
+
+
+class EncodingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.app = elmr.configure('elmr.config.TestingConfig')
+        self.chunksize = elmr.encoding.CHUNKSIZE
+
+    def tearDown(self):
+        elmr.encoding.CHUNKSIZE = self.chunksize
+        self.app.config['PRETTY_JSON'] = False
+
+    def test_get_encoder(self):
+        """
+        Test selecting the JSON encoder
+        """
+        name, dumps = get_encoder("json")
+        self.assertEqual(name, "json")
+        self.assertEqual(dumps({"a": [1, 2]}), '{"a":[1,2]}')
+
+        name, dumps = get_encoder("auto")
+        self.assertIn(name, elmr.encoding.ENCODERS)
+        self.assertEqual(json.loads(dumps({"a": [1, 2]})), {"a": [1, 2]})
+
+        with self.assertRaises(ImportError):
+            get_encoder("notanencoder")
+
+    def test_json_labels(self):
+        """
+        Test the quoted labels of month ordinals
+        """
+        self.assertEqual(
+            json_labels([SEP2008, SEP2008 + 4]).tolist(),
+            ['"Sep 2008"', '"Jan 2009"']
+        )
+        self.assertEqual(json_labels([1850 * 12]).tolist(), ['"Jan 1850"'])
+        self.assertEqual(json_labels([]).tolist(), [])
+
+    def test_json_floats(self):
+        """
+        Test the JSON numbers of values
+        """
+        values  = [4.7, 0.1 + 0.2, 4.7, np.nan, 1e16, -3.0]
+        encoded = json_floats(values).tolist()
+
+        self.assertEqual(encoded[3], "null")
+        self.assertEqual(encoded[0], encoded[2])
+        for value, text in zip(values, encoded):
+            if not np.isnan(value):
+                self.assertEqual(json.loads(text), value)
+
+        matrix = json_floats(np.array([[1.0, np.nan], [2.5, 1.0]]))
+        self.assertEqual(matrix.shape, (2, 2))
+        self.assertEqual(matrix.tolist(), [["1.0", "null"], ["2.5", "1.0"]])
+
+    def test_records_array(self):
+        """
+        Test encoding a series as records
+        """
+        values = np.array([1.0, np.nan, 2.5, 3.25])
+        array  = RecordsArray(SEP2008, values)
+
+        self.assertEqual(len(array), 3)
+        self.assertEqual(json.loads("".join(array.iterencode())), [
+            {"period": "Sep 2008", "value": 1.0},
+            {"period": "Nov 2008", "value": 2.5},
+            {"period": "Dec 2008", "value": 3.25},
+        ])
+        self.assertEqual(array.tolist()[0]["period"], "Sep 2008")
+
+        empty = RecordsArray(0, np.zeros(0))
+        self.assertEqual("".join(empty.iterencode()), "[]")
+
+    def test_chunks(self):
+        """
+        Test that arrays are encoded and streamed in chunks
+        """
+        elmr.encoding.CHUNKSIZE = 2
+        values = np.arange(5, dtype=np.float64)
+        chunks = list(PairsArray(SEP2008, values).iterencode())
+
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(json.loads("".join(chunks)), [
+            ["Sep 2008", 0.0], ["Oct 2008", 1.0], ["Nov 2008", 2.0],
+            ["Dec 2008", 3.0], ["Jan 2009", 4.0],
+        ])
+
+    def test_rows_array(self):
+        """
+        Test encoding aligned series as rows
+        """
+        matrix = np.array([[1.0, np.nan], [np.nan, np.nan], [2.0, 3.0]])
+        rows   = RowsArray(SEP2008, ["A", "B"], matrix)
+
+        self.assertEqual(rows.offsets.tolist(), [0, 2])
+        self.assertEqual(rows.tolist(), [
+            {"A": 1.0, "YEAR": 2008, "MONTH": 9, "DATE": "Sep 2008"},
+            {"A": 2.0, "B": 3.0, "YEAR": 2008, "MONTH": 11,
+             "DATE": "Nov 2008"},
+        ])
+
+    def test_substitute(self):
+        """
+        Test replacing encoded arrays with placeholders
+        """
+        array  = PairsArray(SEP2008, np.ones(2))
+        arrays = []
+        data   = substitute(
+            [{"name": "Maryland", "income": array, "values": [1, 2]}], arrays
+        )
+
+        self.assertEqual(arrays, [array])
+        self.assertEqual(data[0]["income"], elmr.encoding.TOKEN % 0)
+        self.assertEqual(data[0]["values"], [1, 2])
+
+    def test_output_json(self):
+        """
+        Test the streamed and the plain JSON responses
+        """
+        data = {
+            "title": u"Unemployment Rate \u2014 \"Seas\"",
+            "data": RecordsArray(SEP2008, np.array([4.7, 5.0])),
+        }
+
+        with self.app.test_request_context():
+            response = output_json(data, 200, {"X-Test": "yes"})
+            self.assertIsInstance(response, Response)
+            self.assertTrue(response.is_streamed)
+            self.assertEqual(response.headers["X-Test"], "yes")
+            self.assertEqual(json.loads(response.get_data()), {
+                "title": u"Unemployment Rate \u2014 \"Seas\"",
+                "data": [{"period": "Sep 2008", "value": 4.7},
+                         {"period": "Oct 2008", "value": 5.0}],
+            })
+
+            response = output_json({"status": "alive"}, 200)
+            self.assertFalse(response.is_streamed)
+            self.assertEqual(response.get_data(), '{"status":"alive"}')
+
+    def test_pretty_json(self):
+        """
+        Test that responses are only pretty printed if configured
+        """
+        data = {"b": PairsArray(SEP2008, np.ones(1)), "a": 1}
+
+        with self.app.test_request_context():
+            self.app.config['PRETTY_JSON'] = True
+            response = output_json(data, 200)
+            self.assertEqual(
+                response.get_data(),
+                json.dumps({"a": 1, "b": [["Sep 2008", 1.0]]},
+                           indent=4, sort_keys=True) + "\n"
+            )
@@ -0,0 +1,194 @@
+# tests.explain_tests
+# Query plan regression checks for the hot read queries of the API.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 20:55:30 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: explain_tests.py [] benjamin@bengfort.com $
+
+"""
+Query plan regression checks for the hot read queries of the API.
+
+The queries are captured as the endpoints execute them, then run through
+`EXPLAIN` with sequential scans disabled (the fixtures are small enough
+that the planner would otherwise prefer them). PostgreSQL still plans a
+sequential scan if no index can answer the query, so any `Seq Scan on
+records` in a plan means the query has lost its index.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+import psycopg2
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from elmr.models import Series, SeriesRecord
+from elmr.period import filter_periods
+from elmr.fips import get_period_range
+from elmr.queries import SECTION_SQL
+from elmr.ordinal import ordinal
+from sqlalchemy import text
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb, parse_dburi
+
+##########################################################################
+## Query Recorder
+##########################################################################
+
+
+class QueryRecorder(object):
+    """
+    Context manager that records the SQL statements (and parameters) that
+    are executed against the database engine.
+    """
+
+    def __init__(self, engine):
+        self.engine  = engine
+        self.queries = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.queries.append((statement, parameters))
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self.record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self.record)
+
+##########################################################################
+## Test Cases
+##########################################################################
+
+
+class ExplainTests(TestCase):
+
+    ENDPOINTS = (
+        "/api/series/%(blsid)s/",
+        "/api/series/%(blsid)s/?start=2006-09&end=2007-02",
+        "/api/series/%(blsid)s/?last=3",
+        "/api/series/%(blsid)s/?format=npy",
+        "/api/series/%(blsid)s/?frequency=quarterly",
+        "/api/source/CPS/",
+        "/api/source/CPS/?format=columnar",
+    )
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+        # Statistics and the visibility map are needed for index only scans
+        connection = psycopg2.connect(parse_dburi())
+        connection.autocommit = True
+        connection.cursor().execute("VACUUM ANALYZE")
+        connection.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def explain(self, statement, parameters):
+        """
+        Returns the text of the query plan with sequential scans disabled.
+        """
+        conn = elmr.db.session.connection()
+        conn.execute("SET enable_seqscan = off")
+        try:
+            rows = conn.execute("EXPLAIN " + statement, parameters)
+            return "\n".join(row[0] for row in rows)
+        finally:
+            conn.execute("RESET enable_seqscan")
+
+    def record_queries(self, endpoint):
+        """
+        Requests the endpoint and returns the queries on the records table.
+        """
+        with QueryRecorder(elmr.db.engine) as recorder:
+            response = self.client.get(endpoint)
+            self.assertEqual(response.status_code, 200, endpoint)
+
+        return [
+            (sql, params) for sql, params in recorder.queries
+            if "FROM records" in sql
+        ]
+
+    def test_no_sequential_scans(self):
+        """
+        Test that no hot read query falls back to a sequential scan of records
+        """
+        blsid   = elmr.db.session.execute(
+            "SELECT s.blsid FROM series s JOIN records r ON r.series_id = s.id "
+            "WHERE NOT s.is_delta LIMIT 1"
+        ).scalar()
+
+        checked = 0
+        for endpoint in self.ENDPOINTS:
+            endpoint = endpoint % {"blsid": blsid}
+            queries  = self.record_queries(endpoint)
+            self.assertTrue(queries, "no records queries for %s" % endpoint)
+
+            for sql, params in queries:
+                plan = self.explain(sql, params)
+                self.assertNotIn(
+                    "Seq Scan on records", plan,
+                    "%s\n%s\n%s" % (endpoint, sql, plan)
+                )
+                checked += 1
+
+        self.assertGreater(checked, len(self.ENDPOINTS))
+
+    def test_index_only_series_read(self):
+        """
+        Test that a series read is answered from the composite index alone
+        """
+        blsid   = elmr.db.session.execute(
+            "SELECT s.blsid FROM series s JOIN records r ON r.series_id = s.id "
+            "LIMIT 1"
+        ).scalar()
+
+        queries = self.record_queries("/api/series/%s/?start=2006-09" % blsid)
+        plan    = self.explain(*queries[-1])
+
+        self.assertIn("Index Only Scan using records_series_month_value_idx", plan)
+
+    def test_states_dataset_query(self):
+        """
+        Test that the per-state records query of the geography datasets uses
+        an index (the fixtures have no states, so the query is built directly)
+        """
+        series  = Series.query.filter_by(source="LAUS").first()
+        start, end = get_period_range(2006, 2007)
+        records = filter_periods(series.records, SeriesRecord.month,
+                                 start, end)
+
+        compiled = records.statement.compile(dialect=postgresql.dialect())
+        plan     = self.explain(str(compiled), compiled.params)
+        self.assertNotIn("Seq Scan on records", plan)
+
+    def test_cross_section_query(self):
+        """
+        Test that the cross section of many series at a period is answered
+        from the composite index
+        """
+        series   = Series.query.filter_by(source="LAUS").limit(50).all()
+        compiled = text(SECTION_SQL).compile(dialect=postgresql.dialect())
+        start, _ = get_period_range(2007, 2007)
+        plan     = self.explain(str(compiled), {
+            "series_ids": [s.id for s in series],
+            "sources": ["LAUS"],
+            "start": ordinal(start) - 1,
+            "end": ordinal(start) + 1,
+        })
+
+        self.assertNotIn("Seq Scan on records", plan)
+        self.assertIn("records_series_month_value_idx", plan)
@@ -0,0 +1,172 @@
+# tests.fips_tests
+# Testing the classification of the state series.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 18:10:55 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: fips_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the classification of the state series.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series, USAState, StateSeries
+from elmr.catalog import catalogs, get_catalog
+from elmr.fips import classify_series, build_state_series
+from elmr.fips import get_conus_states, get_state_series_info
+from elmr.fips import get_state_series
+
+##########################################################################
+## FIPS Tests
+##########################################################################
+
+
+class FIPSTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+        # The fixtures have no states, only two are classified
+        app = elmr.configure('elmr.config.TestingConfig')
+        with app.app_context():
+            elmr.db.session.add_all([
+                USAState(id=1, fips=u"US24", name=u"Maryland", abbr=u"MD"),
+                USAState(id=2, fips=u"US28", name=u"Mississippi", abbr=u"MS"),
+            ])
+            elmr.db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        catalogs.clear()
+
+    def tearDown(self):
+        StateSeries.query.delete()
+        elmr.db.session.commit()
+        catalogs.clear()
+
+    def test_classify_series(self):
+        """
+        Test classifying the LAUS and CESSM series titles
+        """
+        info = classify_series(
+            u"Maryland, Trade, Transportation, and Utilities, "
+            u"Seasonally adjusted - labor force"
+        )
+        self.assertEqual(info, {
+            "state": u"Maryland",
+            "category": u"Trade, Transportation, and Utilities",
+            "adjusted": True,
+            "dataset": u"labor force",
+            "slug": u"trade-transportation-and-utilities",
+        })
+
+        info = classify_series(
+            u"Mississippi, not seasonally adjusted - unemployment rate"
+        )
+        self.assertIsNone(info["category"])
+        self.assertFalse(info["adjusted"])
+        self.assertEqual(info["slug"], u"unemployment-rate")
+
+        with self.assertRaises(ValueError):
+            classify_series(u"Unemployment Rate")
+
+    def test_build_state_series(self):
+        """
+        Test classifying the state series of the fixtures
+        """
+        series = Series.query.filter(
+            Series.source.in_(["LAUS", "CESSM"]), Series.is_delta == False
+        )
+        states = series.filter(
+            Series.title.startswith(u"Maryland,") |
+            Series.title.startswith(u"Mississippi,")
+        ).count()
+
+        report = build_state_series()
+        self.assertEqual(report["added"], states)
+        self.assertEqual(report["updated"], 0)
+
+        # Every other state is unknown, all of the titles parse
+        for blsid, title, reason in report["failures"]:
+            self.assertTrue(reason.startswith("Unknown state"), reason)
+        self.assertEqual(len(report["failures"]), series.count() - states)
+
+        catalog = get_catalog()
+        self.assertEqual(len(catalog.geo_series()), states)
+        self.assertEqual(len(catalog.geo_series("LAUS")), 16)
+
+        state  = catalog.state(u"US24")
+        series = get_state_series(state, "LAUS", "unemployment-rate", True)
+        self.assertEqual(series.blsid, u"LASST240000000000003")
+        self.assertEqual(
+            catalog.classification(series.id).dataset, u"unemployment rate"
+        )
+
+        report = build_state_series(["LAUS"])
+        self.assertEqual(report["added"], 0)
+        self.assertEqual(report["unchanged"], 16)
+
+    def test_build_failures(self):
+        """
+        Test that titles which cannot be parsed are reported and corrections
+        are updated
+        """
+        build_state_series(["LAUS"])
+        series = Series.query.filter_by(blsid=u"LASST240000000000003").first()
+        title  = series.title
+
+        try:
+            series.title = u"Maryland unemployment rate"
+            elmr.db.session.commit()
+
+            report = build_state_series(["LAUS"])
+            self.assertIn(series.blsid, [f[0] for f in report["failures"]])
+
+            series.title = u"Maryland, not seasonally adjusted - unemployment rate"
+            elmr.db.session.commit()
+
+            report = build_state_series(["LAUS"])
+            self.assertEqual(report["updated"], 1)
+            entry  = get_catalog().classification(series.id)
+            self.assertFalse(entry.adjusted)
+        finally:
+            series.title = title
+            elmr.db.session.commit()
+
+    def test_catalog_lookups(self):
+        """
+        Test the state lookups read the classification, not the titles
+        """
+        self.assertEqual(get_conus_states(), [])
+
+        build_state_series()
+        self.assertEqual(get_conus_states(), [u"Maryland", u"Mississippi"])
+
+        rows = list(get_state_series_info("laus"))
+        self.assertEqual(len(rows), 16)
+        self.assertEqual(
+            set(rows[0]),
+            {"state", "blsid", "adjusted", "dataset", "source", "category"}
+        )
+
+        with self.assertRaises(ValueError):
+            list(get_state_series_info("CPS"))
@@ -0,0 +1,174 @@
+# tests.fixtures_tests
+# Testing the bulk loading of the shipped fixtures.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Fri Oct 23 11:30:04 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: fixtures_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the bulk loading of the shipped fixtures.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import elmr
+import unittest
+import elmr.fixtures
+
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, FIXTURES
+from elmr.models import Series, SeriesRecord, USAState, StateSeries
+from elmr.fixtures import CopyStream, load_fixtures, series_rows, record_rows
+
+##########################################################################
+## Copy Stream Tests
+##########################################################################
+
+
+class CopyStreamTests(unittest.TestCase):
+
+    def setUp(self):
+        self.every = elmr.fixtures.PROGRESS_ROWS
+
+    def tearDown(self):
+        elmr.fixtures.PROGRESS_ROWS = self.every
+
+    def test_read(self):
+        """
+        Test that the rows are encoded as CSV in chunks of the read size
+        """
+        elmr.fixtures.PROGRESS_ROWS = 2
+        counts = []
+        rows   = [(u"LNS14000000", u"Unemployment, \xe9", i) for i in xrange(5)]
+        stream = CopyStream(rows, counts.append)
+
+        chunks = []
+        while True:
+            chunk = stream.read(16)
+            if not chunk:
+                break
+            self.assertLessEqual(len(chunk), 16)
+            chunks.append(chunk)
+
+        lines = "".join(chunks).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[0], 'LNS14000000,"Unemployment, \xc3\xa9",0')
+        self.assertEqual(stream.count, 5)
+        self.assertEqual(counts, [2, 4])
+
+    def test_readers(self):
+        """
+        Test reading the series and the records of the shipped fixtures
+        """
+        path   = os.path.join(FIXTURES, "seriesids.json.gz")
+        series = dict((row[0], row) for row in series_rows(path))
+        self.assertEqual(len(series), 1684)
+        self.assertEqual(series[u"LASST240000000000003"][2], u"LAUS")
+        self.assertTrue(series[u"LASST240000000000003"][3])
+        self.assertFalse(series[u"LNS14000000"][3])
+
+        path = os.path.join(FIXTURES, "cps_dataset.csv.gz")
+        row  = next(record_rows(path))
+        self.assertEqual(row[0], "cps_dataset.csv.gz")
+        self.assertEqual(row[2:4], ("2015-03-01", 2015 * 12 + 2))
+
+##########################################################################
+## Load Fixtures Tests
+##########################################################################
+
+
+class LoadFixturesTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    def setUp(self):
+        syncdb()
+        elmr.db.session.add_all([
+            USAState(id=1, fips=u"US24", name=u"Maryland", abbr=u"MD"),
+            USAState(id=2, fips=u"US28", name=u"Mississippi", abbr=u"MS"),
+        ])
+        elmr.db.session.commit()
+
+    def tearDown(self):
+        dropdb()
+
+    def indexes(self, table):
+        return set(name for name, in elmr.db.session.execute(
+            "SELECT indexname FROM pg_indexes WHERE tablename = :table",
+            {"table": table}
+        ))
+
+    def test_load_fixtures(self):
+        """
+        Test bulk loading the series, records and state series fixtures
+        """
+        indexes  = self.indexes("records"), self.indexes("states_series")
+        progress = []
+        report, rebuild = load_fixtures(
+            FIXTURES, lambda *args: progress.append(args)
+        )
+
+        names = [entry[0] for entry in report]
+        self.assertEqual(
+            names,
+            ["seriesids.json.gz", "cps_dataset.csv.gz", "state_series.csv.gz"]
+        )
+        self.assertEqual([args[0] for args in progress], names)
+
+        counts = dict((entry[0], entry[1:3]) for entry in report)
+        self.assertEqual(counts["seriesids.json.gz"], (1684, 1684))
+        self.assertEqual(Series.query.count(), 1684)
+
+        rows, loaded = counts["cps_dataset.csv.gz"]
+        self.assertEqual(loaded, SeriesRecord.query.count())
+        self.assertEqual(rows, loaded)
+        self.assertGreater(loaded, 0)
+
+        # Only the state series of the known states are loaded
+        rows, loaded = counts["state_series.csv.gz"]
+        self.assertEqual(rows, 1611)
+        self.assertEqual(loaded, StateSeries.query.count())
+        self.assertEqual(
+            loaded, Series.query.filter(
+                Series.title.startswith(u"Maryland,") |
+                Series.title.startswith(u"Mississippi,")
+            ).count()
+        )
+
+        series = Series.query.filter_by(blsid=u"LNS14000000").first()
+        record = series.records.first()
+        self.assertEqual(record.source, u"CPS")
+        self.assertEqual(
+            record.month, record.period.year * 12 + record.period.month - 1
+        )
+
+        entry = StateSeries.query.filter_by(series_id=series.id).first()
+        self.assertIsNone(entry)
+
+        # The deferred indexes are rebuilt
+        self.assertGreaterEqual(rebuild, 0)
+        self.assertEqual(self.indexes("records"), indexes[0])
+        self.assertEqual(self.indexes("states_series"), indexes[1])
+
+    def test_load_twice(self):
+        """
+        Test that loading the fixtures again adds nothing
+        """
+        load_fixtures(FIXTURES)
+        records = SeriesRecord.query.count()
+
+        report, _ = load_fixtures(FIXTURES)
+        for name, rows, loaded, seconds in report:
+            self.assertGreater(rows, 0)
+            self.assertEqual(loaded, 0, name)
+
+        self.assertEqual(SeriesRecord.query.count(), records)
+        self.assertEqual(Series.query.count(), 1684)
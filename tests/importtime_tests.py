@@ -0,0 +1,71 @@
+# tests.importtime_tests
+# Testing the application factory and the deferred imports.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 23:04:22 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: importtime_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the application factory and the deferred imports.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import sys
+import json
+import elmr
+import unittest
+import subprocess
+
+from elmr.importtime import TIMER, BASE_PATH, measure
+
+##########################################################################
+## Import Time Tests
+##########################################################################
+
+
+class ImportTimeTests(unittest.TestCase):
+
+    def test_measure(self):
+        """
+        Test measuring the import time of a statement
+        """
+        seconds, modules = measure("import elmr.columnar", repeat=1)
+        self.assertGreater(seconds, 0.0)
+        self.assertGreater(modules, 0)
+
+    def test_deferred_imports(self):
+        """
+        Test that importing elmr does not import the views and their dependencies
+        """
+        statement = (
+            "import sys, elmr\n"
+            "print(json.dumps(sorted(m for m in sys.modules if sys.modules[m])))"
+        )
+
+        # The timer prints its result last, so use the line before it
+        script  = TIMER % {"path": BASE_PATH, "statement": statement}
+        output  = subprocess.check_output([sys.executable, "-c", script])
+        modules = set(json.loads(output.strip().splitlines()[-2]))
+
+        self.assertIn("elmr", modules)
+        for name in ("elmr.views", "elmr.filters", "humanize", "numpy", "migrate"):
+            self.assertNotIn(name, modules)
+
+    def test_configure(self):
+        """
+        Test that configuring the app registers the resources
+        """
+        app   = elmr.configure('elmr.config.TestingConfig')
+        rules = set(rule.rule for rule in app.url_map.iter_rules())
+
+        self.assertIs(app, elmr.app)
+        self.assertTrue(app.config['TESTING'])
+        self.assertIn("/api/series/<blsid>/", rules)
+        self.assertIn("naturalsize", app.jinja_env.filters)
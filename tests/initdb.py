@@ -20,8 +20,14 @@ Helper functions for initializing the test database and loading fixtures.
 import re
 import os
 import elmr
+import elmr.models
 import psycopg2
 
+from sqlalchemy.exc import DBAPIError
+from elmr.utils import parse_bool
+from elmr.signals import series_changed
+from elmr.dbtemplates import fixture_key, has_template, capture, restore
+
 ##########################################################################
 ## Module Variables
 ##########################################################################
@@ -36,6 +42,18 @@ RECORDS_FIXTURE    = os.path.join(TESTDATA, "records.csv")
 SERIES_FIXTURE     = os.path.join(TESTDATA, "series.csv")
 INGESTIONS_FIXTURE = os.path.join(TESTDATA, "ingestions.csv")
 
+## Restore the loaded fixtures from a template database (needs CREATEDB)
+USE_TEMPLATES = parse_bool(os.environ.get("ELMR_TEST_TEMPLATES", "true"))
+
+## Columns that are not in the fixtures but are derived from other columns
+DERIVED_COLUMNS = {
+    "records": {
+        "month": "CAST(EXTRACT(year FROM period) * 12 + "
+                 "EXTRACT(month FROM period) - 1 AS integer)",
+        "source": "(SELECT source FROM series WHERE series.id = series_id)",
+    },
+}
+
 ## Compiled regular expressions
 DBURI_REGEX = re.compile(
     r'^postgresql\+psycopg2:\/\/(?P<U>.+):(?P<P>.+)@(?P<H>.+)/(?P<D>.+)$',
@@ -90,24 +108,52 @@ def loaddb(**kwargs):
 
     If a keyword argument is ommitted, it's assumed to be True.
     Exceptions are not captured - they are passed on!
-    """
 
-    # TABLENAME: FIXTUREPATH
-    fixtures = {
-        "ingestions": INGESTIONS_FIXTURE,
-        "series": SERIES_FIXTURE,
-        "records": RECORDS_FIXTURE,
-    }
+    The first time the fixtures are loaded the database is captured as a
+    template (see `elmr.dbtemplates`) keyed by the hash of the fixtures and
+    of the schema, and from then on it is restored from the template rather
+    than loaded again. Set ELMR_TEST_TEMPLATES=false to always load them.
+    """
+    global USE_TEMPLATES
+
+    # (TABLENAME, FIXTUREPATH) in order of their foreign keys
+    fixtures = (
+        ("ingestions", INGESTIONS_FIXTURE),
+        ("series", SERIES_FIXTURE),
+        ("records", RECORDS_FIXTURE),
+    )
+    tables = [table for table, _ in fixtures if kwargs.get(table, True)]
+
+    if USE_TEMPLATES:
+        key = fixture_key([path for _, path in fixtures], *tables)
+        try:
+            if has_template(key):
+                restore(key)
+                return
+        except DBAPIError:
+            # The server cannot restore the template, so load the fixtures
+            USE_TEMPLATES = False
 
     # Connect directly to PostgreSQL
     connection = psycopg2.connect(parse_dburi())
 
-    for table, fixture in fixtures.items():
-        if kwargs.get(table, True):
-            load_fixture(connection, table, fixture)
+    for table, fixture in fixtures:
+        if table in tables:
+            load_fixture(connection, table, fixture,
+                         DERIVED_COLUMNS.get(table))
 
     connection.close()
 
+    # Metadata cached from a previous database is stale
+    series_changed.send(None)
+
+    if USE_TEMPLATES:
+        try:
+            capture(key)
+        except DBAPIError:
+            # The role cannot create databases, so always load the fixtures
+            USE_TEMPLATES = False
+
 
 def dropdb(metatables=False):
     """
@@ -118,6 +164,7 @@ def dropdb(metatables=False):
     """
     elmr.db.session.remove()
     elmr.db.drop_all()
+    series_changed.send(None)
 
     if metatables:
         DROP_META_TABLE_SQL = "DROP TABLE migrate_version"
@@ -151,13 +198,20 @@ def parse_dburi(dburi=None):
     return dsn % value
 
 
-def load_fixture(conn, table, path):
+def load_fixture(conn, table, path, derived=None):
     """
     Given a connection to a database (e.g. a straight up psycopg2 connection),
     this function will open a CSV file at path, and dump it to PostgreSQL via
     the `copy_expert` command.
+
+    If derived maps columns missing from the fixture to SQL expressions of
+    the other columns, the fixture is copied into a temporary table first
+    and then inserted along with the derived columns.
     """
 
+    if derived:
+        return load_derived_fixture(conn, table, path, derived)
+
     COPY_SQL = """
         COPY %s FROM STDIN WITH
             CSV
@@ -170,3 +224,32 @@ def load_fixture(conn, table, path):
         cursor.copy_expert(sql=COPY_SQL % table, file=f)
         conn.commit()
         cursor.close()
+
+
+def load_derived_fixture(conn, table, path, derived):
+    """
+    Loads a fixture whose table has columns that are derived from the other
+    columns (e.g. the month ordinal of the period of records).
+    """
+
+    with open(path, 'r') as f:
+        columns = ", ".join(f.readline().strip().replace('"', '').split(","))
+
+    cursor = conn.cursor()
+    cursor.execute(
+        "CREATE TEMP TABLE fixture AS SELECT %s FROM %s WITH NO DATA"
+        % (columns, table)
+    )
+    conn.commit()
+
+    load_fixture(conn, "fixture", path)
+
+    cursor.execute(
+        "INSERT INTO %s (%s, %s) SELECT %s, %s FROM fixture" % (
+            table, columns, ", ".join(derived.keys()),
+            columns, ", ".join(derived.values()),
+        )
+    )
+    cursor.execute("DROP TABLE fixture")
+    conn.commit()
+    cursor.close()
@@ -0,0 +1,373 @@
+# tests.jobs_tests
+# Testing the background job queue and worker.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 00:12:44 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: jobs_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the background job queue and worker.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import sys
+import json
+import elmr
+import shutil
+import socket
+import tempfile
+import subprocess
+import elmr.ingest.fetch
+
+from datetime import datetime, timedelta
+
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb
+from elmr.models import Job, Series, IngestionRecord
+from elmr.ingest import enqueue_jobs
+from elmr.signals import ingestion_finished
+from elmr.jobs import HANDLERS, handler, enqueue, claim, run, work, update
+from elmr.jobs import reap
+from elmr.jobs import QUEUED, RUNNING, FINISHED, FAILED
+
+##########################################################################
+## Testing Handlers
+##########################################################################
+
+
+@handler(u"practice")
+def run_practice(job, fail=False, steps=1):
+    """
+    Records progress for each step and fails if requested.
+    """
+    for step in xrange(steps):
+        update(job, progress=float(step) / steps)
+
+    if fail:
+        raise ValueError("asked to fail")
+
+    return u"Ran %i steps" % steps
+
+##########################################################################
+## Job Queue Tests
+##########################################################################
+
+
+class JobQueueTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    def setUp(self):
+        syncdb()
+
+    def tearDown(self):
+        elmr.db.session.remove()
+        dropdb()
+
+    def test_handlers(self):
+        """
+        Test that the admin jobs have handlers
+        """
+        for kind in ("ingest", "deltas", "store", "snapshot"):
+            self.assertIn(kind, HANDLERS)
+
+    def test_enqueue(self):
+        """
+        Test that enqueued jobs are queued with their parameters
+        """
+        job = enqueue(u"practice", steps=3)
+
+        self.assertIsNotNone(job.id)
+        self.assertEqual(job.status, QUEUED)
+        self.assertEqual(json.loads(job.params), {"steps": 3})
+        self.assertIsNone(job.started)
+
+    def test_enqueue_unknown(self):
+        """
+        Test that jobs without a handler can't be enqueued
+        """
+        with self.assertRaises(ValueError):
+            enqueue(u"bogus")
+
+        self.assertEqual(Job.query.count(), 0)
+
+    def test_claim(self):
+        """
+        Test that the oldest job is claimed exactly once
+        """
+        first  = enqueue(u"practice")
+        second = enqueue(u"practice")
+
+        job = claim(u"worker-a")
+        self.assertEqual(job.id, first.id)
+        self.assertEqual(job.status, RUNNING)
+        self.assertEqual(job.worker, u"worker-a")
+        self.assertIsNotNone(job.started)
+
+        job = claim(u"worker-b")
+        self.assertEqual(job.id, second.id)
+        self.assertIsNone(claim(u"worker-c"))
+
+    def test_run(self):
+        """
+        Test that a successful job is finished with its message
+        """
+        enqueue(u"practice", steps=4)
+        job = run(claim(u"worker"))
+
+        self.assertEqual(job.status, FINISHED)
+        self.assertEqual(job.progress, 1.0)
+        self.assertEqual(job.message, u"Ran 4 steps")
+        self.assertIsNotNone(job.finished)
+        self.assertIsNone(job.error)
+
+    def test_run_failed(self):
+        """
+        Test that a failing job records the error
+        """
+        enqueue(u"practice", fail=True)
+        job = run(claim(u"worker"))
+
+        self.assertEqual(job.status, FAILED)
+        self.assertEqual(job.message, u"asked to fail")
+        self.assertIn(u"ValueError", job.error)
+        self.assertIsNotNone(job.finished)
+
+    def test_work_once(self):
+        """
+        Test that the worker runs every queued job then stops
+        """
+        for fail in (False, True, False):
+            enqueue(u"practice", fail=fail)
+
+        self.assertEqual(work(once=True), 3)
+        self.assertEqual(Job.query.filter_by(status=QUEUED).count(), 0)
+        self.assertEqual(Job.query.filter_by(status=FINISHED).count(), 2)
+        self.assertEqual(Job.query.filter_by(status=FAILED).count(), 1)
+
+    def test_reap_dead_worker(self):
+        """
+        Test that the running jobs of a dead worker process are failed
+        """
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+
+        enqueue(u"practice")
+        enqueue(u"practice")
+        dead = claim(u"%s:%i" % (socket.gethostname(), process.pid))
+        live = claim(u"%s:%i" % (socket.gethostname(), os.getpid()))
+
+        self.assertEqual(reap(), 1)
+        self.assertEqual(Job.query.get(dead.id).status, FAILED)
+        self.assertIsNotNone(Job.query.get(dead.id).finished)
+        self.assertEqual(Job.query.get(live.id).status, RUNNING)
+
+    def test_reap_timeout(self):
+        """
+        Test that jobs running for longer than the timeout are failed
+        """
+        enqueue(u"practice")
+        enqueue(u"practice")
+        stale = claim(u"elsewhere:1")
+        fresh = claim(u"elsewhere:2")
+        update(stale, started=datetime.now() - timedelta(days=1))
+
+        self.assertEqual(reap(), 1)
+        self.assertEqual(Job.query.get(stale.id).status, FAILED)
+        self.assertIn(u"Timed out", Job.query.get(stale.id).message)
+        self.assertEqual(Job.query.get(fresh.id).status, RUNNING)
+
+    def test_run_ingest(self):
+        """
+        Test that ingest jobs use the configured years and record progress
+        """
+        for idx in xrange(3):
+            elmr.db.session.add(Series(blsid=u"TEST%i" % idx, source=u"TEST"))
+        elmr.db.session.commit()
+
+        job      = enqueue(u"ingest", sources=[u"TEST"], blocksize=1,
+                           ratelimit=0, fixtures=tempfile.mkdtemp())
+        progress = []
+
+        def fetch_series(sids, path, startyear, endyear):
+            progress.append((Job.query.get(job.id).progress, startyear, endyear))
+
+        original = elmr.ingest.fetch.fetch_series
+        try:
+            elmr.ingest.fetch.fetch_series = fetch_series
+            job = run(claim(u"worker"))
+        finally:
+            elmr.ingest.fetch.fetch_series = original
+            shutil.rmtree(json.loads(job.params)["fixtures"])
+
+        self.assertEqual(job.status, FINISHED, job.error)
+        self.assertEqual([p for p, _, _ in progress][:3], [0.0, 1.0 / 3, 2.0 / 3])
+        self.assertEqual(progress[0][1:], (
+            self.app.config['STARTYEAR'], self.app.config['ENDYEAR']
+        ))
+
+        log = job.ingestion
+        self.assertEqual(log.start_year.year, int(self.app.config['STARTYEAR']))
+        self.assertEqual(log.end_year.year, int(self.app.config['ENDYEAR']))
+
+##########################################################################
+## Job API Tests
+##########################################################################
+
+
+class JobAPITests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    def setUp(self):
+        syncdb()
+
+    def tearDown(self):
+        elmr.db.session.remove()
+        dropdb()
+
+    def test_enqueue_job(self):
+        """
+        Test that posting a job queues it without running it
+        """
+        response = self.client.post("/api/jobs/", data={"kind": "store"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json["kind"], "store")
+        self.assertEqual(response.json["status"], QUEUED)
+
+        job = Job.query.get(response.json["id"])
+        self.assertEqual(job.status, QUEUED)
+
+    def test_enqueue_bad_kind(self):
+        """
+        Test that posting an unknown kind of job is a bad request
+        """
+        response = self.client.post("/api/jobs/", data={"kind": "bogus"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post("/api/jobs/")
+        self.assertEqual(response.status_code, 400)
+
+    def test_job_list(self):
+        """
+        Test listing the most recent jobs
+        """
+        for _ in xrange(3):
+            enqueue(u"practice")
+        run(claim(u"worker"))
+
+        response = self.client.get("/api/jobs/")
+        self.assertEqual(response.status_code, 200)
+
+        jobs = response.json["jobs"]
+        self.assertEqual(len(jobs), 3)
+        self.assertGreater(jobs[0]["id"], jobs[-1]["id"])
+
+        response = self.client.get("/api/jobs/?status=finished")
+        self.assertEqual(len(response.json["jobs"]), 1)
+
+    def test_job_detail(self):
+        """
+        Test polling a single job for its progress
+        """
+        job = enqueue(u"practice", fail=True)
+        run(claim(u"worker"))
+
+        response = self.client.get("/api/jobs/%i/" % job.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["status"], FAILED)
+        self.assertIn("ValueError", response.json["error"])
+
+        response = self.client.get("/api/jobs/%i/" % (job.id + 100))
+        self.assertEqual(response.status_code, 404)
+
+##########################################################################
+## Ingestion Follow-up Tests
+##########################################################################
+
+## Runs the ingest command of the admin script without fetching from BLS
+INGEST_SCRIPT = """
+import imp, argparse, tempfile
+admin = imp.load_source("elmr_admin", %(script)r)
+
+import elmr, elmr.ingest.fetch
+elmr.app.config['USE_STORE'] = True
+elmr.ingest.fetch.fetch_series = lambda *args, **kwargs: None
+
+print(admin.ingest_data(argparse.Namespace(
+    func=None, fixtures=tempfile.mkdtemp(), start_year=None, end_year=None,
+    cleanup=True, blocksize=10, ratelimit=0, title="Test CLI Ingestion",
+    sources=["NOTASOURCE"], reload=False,
+)))
+"""
+
+
+class IngestionJobsTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    def setUp(self):
+        syncdb()
+
+    def tearDown(self):
+        self.app.config['USE_STORE'] = False
+        elmr.db.session.remove()
+        dropdb()
+
+    def test_receiver_connected(self):
+        """
+        Test that the ingestion module connects the follow-up jobs
+        """
+        self.assertIn(enqueue_jobs, list(ingestion_finished.receivers_for(None)))
+
+    def test_ingestion_enqueues_store(self):
+        """
+        Test that a finished ingestion enqueues a store job if enabled
+        """
+        ingestion_finished.send(None)
+        self.assertEqual(Job.query.filter_by(kind=u"store").count(), 0)
+
+        self.app.config['USE_STORE'] = True
+        ingestion_finished.send(None)
+        self.assertEqual(Job.query.filter_by(kind=u"store").count(), 1)
+
+    def test_ingestion_enqueues_snapshot(self):
+        """
+        Test that a finished ingestion enqueues a snapshot job if served
+        """
+        ingestion_finished.send(None)
+        self.assertEqual(Job.query.filter_by(kind=u"snapshot").count(), 0)
+
+        try:
+            self.app.config['SERVE_SNAPSHOT'] = True
+            ingestion_finished.send(None)
+        finally:
+            self.app.config['SERVE_SNAPSHOT'] = False
+
+        self.assertEqual(Job.query.filter_by(kind=u"snapshot").count(), 1)
+
+    def test_cli_ingestion_enqueues_store(self):
+        """
+        Test that the ingest command of the admin script enqueues a store job
+        """
+        script = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "bin", "elmr-admin.py"
+        )
+        output = subprocess.check_output([
+            sys.executable, "-c", INGEST_SCRIPT % {"script": script}
+        ])
+
+        self.assertIn("Ingested 0 rows", output)
+        self.assertEqual(IngestionRecord.query.count(), 1)
+        self.assertEqual(Job.query.filter_by(kind=u"store").count(), 1)
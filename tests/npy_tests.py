@@ -0,0 +1,68 @@
+# tests.npy_tests
+# Testing the elmr.npy module
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 11:48:02 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: npy_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the elmr.npy module
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import unittest
+import numpy as np
+
+from elmr.npy import to_array, to_matrix
+
+##########################################################################
+## Array Construction Tests
+##########################################################################
+
+
+class ArrayTests(unittest.TestCase):
+
+    def test_to_array(self):
+        """
+        Test that rows are placed by month index with NaN for gaps
+        """
+        start, values = to_array([(24072, 1.0), (24073, 2.0), (24075, 4.0)])
+
+        self.assertEqual(start, 24072)
+        self.assertEqual(values.dtype, np.float64)
+        self.assertEqual(len(values), 4)
+        self.assertEqual(values[0], 1.0)
+        self.assertEqual(values[1], 2.0)
+        self.assertTrue(np.isnan(values[2]))
+        self.assertEqual(values[3], 4.0)
+
+    def test_to_array_empty(self):
+        """
+        Test the array of an empty query
+        """
+        start, values = to_array([])
+        self.assertEqual(len(values), 0)
+
+    def test_to_matrix(self):
+        """
+        Test that columns are aligned on a common start period
+        """
+        start, matrix = to_matrix([
+            [(10, 1.0), (11, 2.0)],
+            [(11, 5.0), (12, 6.0)],
+            [],
+        ])
+
+        self.assertEqual(start, 10)
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertEqual(matrix[0, 0], 1.0)
+        self.assertTrue(np.isnan(matrix[0, 1]))
+        self.assertEqual(matrix[2, 1], 6.0)
+        self.assertTrue(np.isnan(matrix[:, 2]).all())
@@ -0,0 +1,136 @@
+# tests.ordinal_tests
+# Testing the integer month ordinal representation of periods
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 12:20:37 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: ordinal_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the integer month ordinal representation of periods
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+import unittest
+import numpy as np
+
+from datetime import date
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series, SeriesRecord
+from elmr.ordinal import ordinal, from_ordinal, ordinal_column
+from elmr.ordinal import ordinals, datetimes, years, months
+from elmr.ordinal import label, iso_label, labels, ISO_LABELS
+
+##########################################################################
+## Ordinal Tests
+##########################################################################
+
+
+class OrdinalTests(unittest.TestCase):
+
+    def test_ordinal(self):
+        """
+        Test that consecutive months have consecutive ordinals
+        """
+        self.assertEqual(ordinal(date(2008, 9, 1)), 2008 * 12 + 8)
+        self.assertEqual(
+            ordinal(date(2001, 1, 1)) - ordinal(date(2000, 12, 1)), 1
+        )
+        self.assertEqual(from_ordinal(ordinal(date(2008, 9, 17))),
+                         date(2008, 9, 1))
+
+    def test_vectorized(self):
+        """
+        Test the vectorized conversions agree with the scalar ones
+        """
+        periods = [date(1999, 12, 1), date(2000, 1, 1), date(2015, 3, 1)]
+        idx = ordinals(periods)
+
+        self.assertEqual(idx.tolist(), [ordinal(p) for p in periods])
+        self.assertEqual(years(idx).tolist(), [1999, 2000, 2015])
+        self.assertEqual(months(idx).tolist(), [12, 1, 3])
+        self.assertEqual(
+            datetimes(idx).tolist(), [p for p in periods]
+        )
+
+    def test_labels(self):
+        """
+        Test the label tables match strftime
+        """
+        for period in (date(1900, 1, 1), date(2008, 9, 1), date(2099, 12, 1)):
+            idx = ordinal(period)
+            self.assertEqual(label(idx), period.strftime("%b %Y"))
+            self.assertEqual(iso_label(idx), period.strftime("%Y-%m"))
+
+        idx = np.arange(ordinal(date(2007, 11, 1)), ordinal(date(2008, 3, 1)))
+        self.assertEqual(
+            labels(idx), ["Nov 2007", "Dec 2007", "Jan 2008", "Feb 2008"]
+        )
+        self.assertEqual(labels(idx[:2], ISO_LABELS), ["2007-11", "2007-12"])
+        self.assertEqual(labels([]), [])
+
+    def test_labels_outside_table(self):
+        """
+        Test labels for months outside of the precomputed table
+        """
+        idx = ordinal(date(1850, 6, 1))
+        self.assertEqual(label(idx), "Jun 1850")
+        self.assertEqual(iso_label(idx), "1850-06")
+        self.assertEqual(labels([idx, idx + 1]), ["Jun 1850", "Jul 1850"])
+
+##########################################################################
+## Record Month Tests
+##########################################################################
+
+
+class RecordMonthTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def test_fixture_months(self):
+        """
+        Test that the stored month of every record is the ordinal of its period
+        """
+        mismatched = SeriesRecord.query.filter(
+            SeriesRecord.month != ordinal_column(SeriesRecord.period)
+        ).count()
+
+        self.assertGreater(SeriesRecord.query.count(), 0)
+        self.assertEqual(mismatched, 0)
+
+    def test_record_default_month(self):
+        """
+        Test that new records are given the ordinal of their period
+        """
+        series = Series.query.first()
+        last   = elmr.db.session.query(elmr.db.func.max(SeriesRecord.id))
+        record = SeriesRecord(
+            id=last.scalar() + 1, series_id=series.id,
+            period=date(2008, 9, 1), value=1.0
+        )
+
+        elmr.db.session.add(record)
+        elmr.db.session.commit()
+
+        self.assertEqual(record.month, ordinal(date(2008, 9, 1)))
+
+        elmr.db.session.delete(record)
+        elmr.db.session.commit()
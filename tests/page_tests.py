@@ -36,8 +36,7 @@ class TemplateTests(TestCase):
     render_templates = False
 
     def create_app(self):
-        elmr.app.config.from_object('elmr.config.TestingConfig')
-        return elmr.app
+        return elmr.configure('elmr.config.TestingConfig')
 
     @classmethod
     def setUpClass(cls):
@@ -61,6 +60,23 @@ class TemplateTests(TestCase):
         reponse = self.client.get("/admin/")
         self.assert_template_used('admin.html')
 
+    def test_admin_statistics(self):
+        """
+        Assert that the admin page reports estimated and exact table stats.
+        """
+        reponse = self.client.get("/admin/")
+        tables  = self.get_context_variable('dbtables')
+        self.assertFalse(self.get_context_variable('exact'))
+        for name in ("series", "records", "ingestions", "states_series"):
+            self.assertIn(name, tables)
+            self.assertFalse(tables[name]["exact"])
+
+        reponse = self.client.get("/admin/?exact=true")
+        tables  = self.get_context_variable('dbtables')
+        self.assertTrue(self.get_context_variable('exact'))
+        self.assertTrue(tables["records"]["exact"])
+        self.assertEqual(tables["records"]["rows"], 0)
+
     def test_benjamin_development_template(self):
         """
         Assert that the benjamin development page uses the benjamin template.
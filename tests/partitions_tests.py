@@ -0,0 +1,248 @@
+# tests.partitions_tests
+# Testing the partitioning of the records table by source.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 16:02:37 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: partitions_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the partitioning of the records table by source.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import elmr
+import psycopg2
+
+from datetime import date
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb, parse_dburi
+from elmr.models import Series, SeriesRecord
+from elmr.partitions import partition_name, is_partitioned, partitions
+from elmr.partitions import create_partition, load_partition
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+VERSIONS = os.path.join(
+    os.path.dirname(elmr.__file__), "migrations", "versions"
+)
+
+UPGRADE   = os.path.join(VERSIONS, "014_records_partitions_postgresql_upgrade.sql")
+DOWNGRADE = os.path.join(VERSIONS, "014_records_partitions_postgresql_downgrade.sql")
+
+
+def execute_script(path):
+    """
+    Runs a migration script directly against the test database.
+    """
+    connection = psycopg2.connect(parse_dburi())
+    connection.autocommit = True
+
+    with open(path, 'r') as f:
+        connection.cursor().execute(f.read())
+
+    connection.close()
+
+##########################################################################
+## Partitions Tests
+##########################################################################
+
+
+class PartitionsTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+        execute_script(UPGRADE)
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def count_by_source(self):
+        """
+        Returns the number of records of each source
+        """
+        query = elmr.db.session.query(
+            SeriesRecord.source, elmr.db.func.count(SeriesRecord.id)
+        ).group_by(SeriesRecord.source)
+        return dict(query.all())
+
+    def test_partition_name(self):
+        """
+        Test the partition name of a source
+        """
+        self.assertEqual(partition_name("CPS"), "records_cps")
+        self.assertEqual(
+            partition_name("LAUS-ANALYSIS"), "records_laus_analysis"
+        )
+
+        for source in (None, "", "cps", "CPS'; DROP TABLE series; --"):
+            with self.assertRaises(ValueError):
+                partition_name(source)
+
+    def test_partitions(self):
+        """
+        Test that the records are partitioned by source
+        """
+        self.assertTrue(is_partitioned())
+
+        names = set(part["relname"] for part in partitions())
+        for source in ("CPS", "CESN", "LAUS", "CESSM", "CPS-ANALYSIS"):
+            self.assertIn(partition_name(source), names)
+        self.assertIn("records_default", names)
+
+        # Every record is in the partition of the source of its series
+        query = elmr.db.session.query(SeriesRecord).join(Series).filter(
+            SeriesRecord.source != Series.source
+        )
+        self.assertEqual(query.count(), 0)
+
+        count = elmr.db.session.execute(
+            "SELECT count(*) FROM records_cps WHERE source <> 'CPS'"
+        ).scalar()
+        self.assertEqual(count, 0)
+
+    def test_partition_pruning(self):
+        """
+        Test that filtering on the source only scans its partition
+        """
+        series = Series.query.filter_by(source=u"CPS").first()
+        plan   = elmr.db.session.execute(
+            "EXPLAIN SELECT month, value FROM records "
+            "WHERE series_id = :sid AND source = 'CPS'", {"sid": series.id}
+        )
+        plan   = "\n".join(row[0] for row in plan)
+
+        self.assertIn("records_cps", plan)
+        self.assertNotIn("records_laus", plan)
+        self.assertNotIn("records_default", plan)
+
+    def test_api(self):
+        """
+        Test that the series API reads from the partitioned records
+        """
+        series   = Series.query.filter_by(source=u"CPS").first()
+        response = self.client.get("/api/series/%s/" % series.blsid)
+
+        self.assert200(response)
+        self.assertEqual(
+            len(response.json["data"]), series.records.count()
+        )
+
+    def test_insert(self):
+        """
+        Test that inserted records are routed by the source of their series
+        """
+        series = Series.query.filter_by(source=u"LAUS").first()
+        nextid = elmr.db.session.query(
+            elmr.db.func.max(SeriesRecord.id)
+        ).scalar() + 1
+
+        record = SeriesRecord(
+            id=nextid, series_id=series.id, period=date(2015, 1, 1), value=1.0
+        )
+        elmr.db.session.add(record)
+        elmr.db.session.commit()
+
+        try:
+            self.assertEqual(record.source, u"LAUS")
+            count = elmr.db.session.execute(
+                "SELECT count(*) FROM records_laus WHERE id = :id",
+                {"id": nextid}
+            ).scalar()
+            self.assertEqual(count, 1)
+        finally:
+            elmr.db.session.delete(record)
+            elmr.db.session.commit()
+
+    def test_create_partition(self):
+        """
+        Test creating the partition of a new source
+        """
+        self.assertEqual(create_partition("TESTING"), "records_testing")
+        self.assertEqual(create_partition("TESTING"), "records_testing")
+
+        names = set(part["relname"] for part in partitions())
+        self.assertIn("records_testing", names)
+
+        elmr.db.session.execute("DROP TABLE records_testing")
+        elmr.db.session.commit()
+
+    def test_load_partition(self):
+        """
+        Test that loading a partition replaces only the source's records
+        """
+        before = self.count_by_source()
+        series = Series.query.filter_by(source=u"CESSM").order_by(Series.id)
+        series = series.limit(2).all()
+
+        rows = [
+            (s.id, date(2015, month, 1), month / 7.0, None)
+            for s in series for month in xrange(1, 4)
+        ]
+
+        self.assertEqual(load_partition("CESSM", rows), 6)
+        self.assertTrue(is_partitioned())
+
+        after = self.count_by_source()
+        self.assertEqual(after.pop(u"CESSM"), 6)
+        before.pop(u"CESSM")
+        self.assertEqual(after, before)
+
+        records = series[0].records.order_by(SeriesRecord.month)
+        self.assertEqual(
+            [(r.period, r.month, r.value) for r in records],
+            [(date(2015, 1, 1), 24180, 1 / 7.0),
+             (date(2015, 2, 1), 24181, 2 / 7.0),
+             (date(2015, 3, 1), 24182, 3 / 7.0)]
+        )
+
+        # The swapped in partition still enforces its bound
+        self.assertIn(
+            "records_cessm", set(part["relname"] for part in partitions())
+        )
+        with self.assertRaises(Exception):
+            elmr.db.session.execute(
+                "INSERT INTO records_cessm (series_id, source, period, "
+                "month, value) VALUES (:sid, 'CPS', '2015-04-01', 24183, 1)",
+                {"sid": series[0].id}
+            )
+        elmr.db.session.rollback()
+
+        # Restore the fixtures for the other tests
+        dropdb()
+        syncdb()
+        loaddb()
+        execute_script(UPGRADE)
+
+    def test_downgrade(self):
+        """
+        Test that the downgrade restores an unpartitioned records table
+        """
+        before = self.count_by_source()
+        elmr.db.session.remove()
+
+        execute_script(DOWNGRADE)
+        try:
+            self.assertFalse(is_partitioned())
+            count = elmr.db.session.execute(
+                "SELECT count(*) FROM records"
+            ).scalar()
+            self.assertEqual(count, sum(before.values()))
+        finally:
+            elmr.db.session.remove()
+            execute_script(UPGRADE)
@@ -0,0 +1,86 @@
+# tests.period_tests
+# Testing the elmr.period module
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 20:02:45 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: period_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the elmr.period module
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import unittest
+
+from datetime import date
+from elmr.models import SeriesRecord
+from elmr.period import parse_period, period_range, months, filter_periods
+
+##########################################################################
+## Period Parsing Tests
+##########################################################################
+
+
+class PeriodTests(unittest.TestCase):
+
+    def test_parse_month(self):
+        """
+        Test parsing a month precision period
+        """
+        self.assertEqual(parse_period("2008-09"), date(2008, 9, 1))
+        self.assertEqual(parse_period("2008-9", end=True), date(2008, 9, 1))
+        self.assertEqual(parse_period("2008-09-15"), date(2008, 9, 1))
+
+    def test_parse_year(self):
+        """
+        Test that a year starts in January and ends in December
+        """
+        self.assertEqual(parse_period("2008"), date(2008, 1, 1))
+        self.assertEqual(parse_period("2008", end=True), date(2008, 12, 1))
+        self.assertEqual(parse_period(2008, end=True), date(2008, 12, 1))
+
+    def test_parse_bad_period(self):
+        """
+        Test that unparseable periods raise ValueError
+        """
+        for value in ("bloopies", "08-09", "2008-13", "2008-00", ""):
+            with self.assertRaises(ValueError):
+                parse_period(value)
+
+    def test_period_range(self):
+        """
+        Test that month precision takes precedence over the years
+        """
+        self.assertEqual(
+            period_range("2008-09", None, 2000, 2010),
+            (date(2008, 9, 1), date(2010, 12, 1))
+        )
+        self.assertEqual(period_range(), (None, None))
+
+    def test_months(self):
+        """
+        Test generating the months of a range across years
+        """
+        result = list(months(date(2008, 11, 1), date(2009, 2, 1)))
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[0], date(2008, 11, 1))
+        self.assertEqual(result[-1], date(2009, 2, 1))
+
+    def test_sargable_filter(self):
+        """
+        Test that the period filter does not wrap the column in a function
+        """
+        query = SeriesRecord.query
+        query = filter_periods(query, SeriesRecord.period,
+                               date(2008, 9, 1), date(2009, 2, 1))
+        sql   = str(query.statement).lower()
+
+        self.assertIn("records.period between", sql)
+        self.assertNotIn("extract", sql)
@@ -0,0 +1,121 @@
+# tests.queries_tests
+# Testing the read-only Core queries of the read paths.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Wed Oct 21 12:02:15 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: queries_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the read-only Core queries of the read paths.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+
+from datetime import date
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series
+from elmr.queries import statements, records_sql, series_records
+from elmr.queries import series_array_row, orm_series_records, benchmark
+
+##########################################################################
+## Queries Tests
+##########################################################################
+
+
+class QueriesTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def test_records_sql(self):
+        """
+        Test the SQL of the records query with and without predicates
+        """
+        self.assertEqual(
+            records_sql(),
+            "SELECT month, value FROM records WHERE series_id = :series_id"
+        )
+
+        sql = records_sql(source=True, start=True, end=True, last=True)
+        for predicate in ("source = :source", "month >= :start",
+                          "month <= :end", "OFFSET :offset LIMIT 1"):
+            self.assertIn(predicate, sql)
+
+    def test_matches_orm(self):
+        """
+        Test that the Core and ORM reads return the same records
+        """
+        series = Series.query.filter_by(source=u"CPS").limit(3).all()
+        ranges = (
+            {},
+            {"start": date(2006, 9, 1)},
+            {"end": date(2007, 2, 1)},
+            {"start": date(2006, 9, 1), "end": date(2007, 2, 1)},
+            {"last": 3},
+            {"start": date(2006, 1, 1), "end": date(2006, 12, 1), "last": 4},
+            {"last": 1000},
+        )
+
+        for s in series:
+            for kwargs in ranges:
+                for source in (None, s.source):
+                    core = series_records(s.id, source=source, **kwargs)
+                    orm  = orm_series_records(s.id, source=source, **kwargs)
+
+                    self.assertEqual(sorted(core), sorted(map(tuple, orm)))
+                    for row in core:
+                        self.assertIsInstance(row, tuple)
+
+    def test_compiled_once(self):
+        """
+        Test that each combination of predicates is compiled once
+        """
+        s = Series.query.filter_by(source=u"CESN").first()
+        series_records(s.id, start=date(2007, 1, 1))
+        count = len(statements)
+
+        key = ("records", False, True, False, False)
+        self.assertIn(key, statements)
+        compiled = statements[key]
+
+        series_records(s.id, start=date(2006, 1, 1))
+        self.assertEqual(len(statements), count)
+        self.assertIs(statements[key], compiled)
+
+    def test_no_records(self):
+        """
+        Test reads of a series without records or an array
+        """
+        self.assertEqual(series_records(0), [])
+        self.assertEqual(series_records(0, last=3), [])
+        self.assertIsNone(series_array_row(0))
+
+    def test_benchmark(self):
+        """
+        Test the benchmark of the ORM and Core reads
+        """
+        results = benchmark("CPS", "unemployment-rate", repeat=1)
+
+        self.assertEqual(results["source"]["series"], 40)
+        self.assertEqual(results["geography"]["series"], 0)
+        for name in ("source", "geography"):
+            for reader in ("orm", "core"):
+                self.assertGreaterEqual(results[name][reader], 0.0)
@@ -0,0 +1,208 @@
+# tests.regions_tests
+# Testing the aggregation of the state series by BEA region.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 22 16:40:12 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: regions_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the aggregation of the state series by BEA region.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import elmr
+import unittest
+import numpy as np
+
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series, USAState, StateSeries
+from elmr.catalog import catalogs
+from elmr.queries import series_records
+from elmr.npy import to_array
+from elmr.regions import aggregate, regions, region_series, WMEAN, SUM
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+## The fixtures have no states, so a few are created for the LAUS series
+STATES = (
+    (1, u"10", u"Delaware", u"Mideast"),
+    (2, u"24", u"Maryland", u"Mideast"),
+    (3, u"28", u"Mississippi", u"Southeast"),
+)
+
+DATASETS = (
+    (u"03", u"Unemployment Rate", u"unemployment-rate"),
+    (u"05", u"Employment", u"employment"),
+    (u"06", u"Labor Force", u"labor-force"),
+)
+
+
+def blsid(fips, code):
+    return u"LASST%s00000000000%s" % (fips, code)
+
+
+def values(fips, code):
+    series = Series.query.filter_by(blsid=blsid(fips, code)).first()
+    return to_array(series_records(series.id))[1]
+
+##########################################################################
+## Aggregation Tests
+##########################################################################
+
+
+class AggregateTests(unittest.TestCase):
+
+    def test_sum(self):
+        """
+        Test summing the levels of the states of each region
+        """
+        members = np.array([[1.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        levels  = np.array([[1.0, 2.0], [3.0, np.nan], [5.0, 6.0]])
+
+        result  = aggregate(members, levels)
+        self.assertEqual(result[0, 0], 4.0)
+        self.assertTrue(np.isnan(result[0, 1]))
+        self.assertEqual(result[1].tolist(), [5.0, 6.0])
+
+    def test_weighted_mean(self):
+        """
+        Test averaging the rates of the states of each region by weights
+        """
+        members = np.array([[1.0, 1.0]])
+        rates   = np.array([[4.0, 4.0, 2.0], [8.0, 6.0, 3.0]])
+        weights = np.array([[100.0, 100.0, np.nan], [300.0, 100.0, 50.0]])
+
+        result  = aggregate(members, rates, weights)
+        self.assertEqual(result[0, 0], 7.0)
+        self.assertEqual(result[0, 1], 5.0)
+        self.assertTrue(np.isnan(result[0, 2]))
+
+##########################################################################
+## Regions Tests
+##########################################################################
+
+
+class RegionsTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+        app = elmr.configure('elmr.config.TestingConfig')
+        with app.app_context():
+            idx = 0
+            for state_id, fips, name, region in STATES:
+                elmr.db.session.add(USAState(
+                    id=state_id, fips=fips, name=name, region=region
+                ))
+                for code, dataset, slug in DATASETS:
+                    idx += 1
+                    series = Series.query.filter_by(
+                        blsid=blsid(fips, code)
+                    ).first()
+                    elmr.db.session.add(StateSeries(
+                        id=idx, state_id=state_id, series_id=series.id,
+                        adjusted=True, dataset=dataset, source=u"LAUS",
+                        slug=slug,
+                    ))
+            elmr.db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        catalogs.clear()
+        regions.clear()
+
+    def test_levels(self):
+        """
+        Test that the levels of the states of a region are summed
+        """
+        result = region_series("LAUS", "labor-force")
+        self.assertEqual(result["method"], SUM)
+        self.assertIsNone(result["weights"])
+        self.assertEqual(
+            [(name, states) for name, states, _ in result["regions"]],
+            [(u"Mideast", 2), (u"Southeast", 1)]
+        )
+
+        mideast = result["regions"][0][2]
+        self.assertEqual(len(mideast), 24)
+        self.assertTrue(np.allclose(
+            mideast, values(u"10", u"06") + values(u"24", u"06")
+        ))
+
+    def test_rates(self):
+        """
+        Test that the rates are weighted by the labor force
+        """
+        result = region_series("LAUS", "unemployment-rate")
+        self.assertEqual(result["method"], WMEAN)
+        self.assertEqual(result["weights"], "labor-force")
+
+        force  = values(u"10", u"06"), values(u"24", u"06")
+        rates  = values(u"10", u"03"), values(u"24", u"03")
+        expect = (rates[0] * force[0] + rates[1] * force[1]) / sum(force)
+
+        self.assertTrue(np.allclose(result["regions"][0][2], expect))
+        self.assertTrue(np.allclose(
+            result["regions"][1][2], values(u"28", u"03")
+        ))
+
+    def test_regions_endpoint(self):
+        """
+        Test the regional series of a dataset
+        """
+        response = self.client.get(
+            "/api/regions/laus/unemployment-rate/?is_adjusted=true"
+        )
+        self.assert200(response)
+
+        result = response.json
+        self.assertEqual(result["method"], WMEAN)
+        self.assertEqual(len(result["regions"]), 2)
+        self.assertEqual(result["regions"][1]["name"], u"Southeast")
+        self.assertEqual(result["regions"][1]["data"][0]["period"], "Jan 2006")
+        self.assertEqual(len(result["regions"][1]["data"]), 24)
+
+        response = self.client.get("/api/regions/CPS/unemployment-rate/")
+        self.assert400(response)
+
+        response = self.client.get("/api/regions/laus/not-a-dataset/")
+        self.assert200(response)
+        self.assertEqual(response.json["regions"], [])
+
+    def test_wealth_of_nations_regions(self):
+        """
+        Test the wealth of nations entries of the regions
+        """
+        response = self.client.get("/api/regions/?regions=true&adjusted=true")
+        self.assert200(response)
+
+        result = response.json
+        self.assertEqual([r["name"] for r in result], [u"Mideast", u"Southeast"])
+        for entry in result:
+            self.assertEqual(entry["region"], entry["name"])
+            for key in ("income", "population", "lifeExpectancy"):
+                self.assertEqual(len(entry[key]), 24)
+
+        response = self.client.get(
+            "/api/regions/?regions=true&adjusted=true&frequency=annual"
+        )
+        self.assert200(response)
+        self.assertEqual(len(response.json[0]["income"]), 2)
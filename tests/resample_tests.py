@@ -0,0 +1,174 @@
+# tests.resample_tests
+# Testing the elmr.resample module
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 18:52:16 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: resample_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the elmr.resample module
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import unittest
+import numpy as np
+
+from elmr.resample import period_label, period_display
+from elmr.resample import resample, lttb, downsample, periods
+
+## January 2006 as a month index
+JAN2006 = 2006 * 12
+
+##########################################################################
+## Period Label Tests
+##########################################################################
+
+
+class PeriodLabelTests(unittest.TestCase):
+
+    def test_period_label(self):
+        """
+        Test the ISO labels of each frequency
+        """
+        sep2008 = 2008 * 12 + 8
+        self.assertEqual(period_label(sep2008), "2008-09")
+        self.assertEqual(period_label(sep2008 - 2, "quarterly"), "2008-Q3")
+        self.assertEqual(period_label(sep2008, "annual"), "2008")
+
+    def test_period_display(self):
+        """
+        Test the display labels of each frequency
+        """
+        sep2008 = 2008 * 12 + 8
+        self.assertEqual(period_display(sep2008), "Sep 2008")
+        self.assertEqual(period_display(sep2008, "quarterly"), "Q3 2008")
+        self.assertEqual(period_display(sep2008, "annual"), "2008")
+
+##########################################################################
+## Resample Tests
+##########################################################################
+
+
+class ResampleTests(unittest.TestCase):
+
+    def test_monthly(self):
+        """
+        Test that monthly resampling returns the values unchanged
+        """
+        start, values = resample(JAN2006, [1.0, 2.0, 3.0])
+        self.assertEqual(start, JAN2006)
+        self.assertEqual(values.tolist(), [1.0, 2.0, 3.0])
+
+    def test_quarterly_mean(self):
+        """
+        Test aggregating to quarters by the mean
+        """
+        start, values = resample(JAN2006, np.arange(1.0, 7.0), "quarterly")
+        self.assertEqual(start, JAN2006)
+        self.assertEqual(values.tolist(), [2.0, 5.0])
+
+    def test_quarterly_last_and_sum(self):
+        """
+        Test aggregating to quarters by the last value and the sum
+        """
+        data = np.arange(1.0, 7.0)
+        self.assertEqual(resample(JAN2006, data, "quarterly", "last")[1].tolist(), [3.0, 6.0])
+        self.assertEqual(resample(JAN2006, data, "quarterly", "sum")[1].tolist(), [6.0, 15.0])
+
+    def test_partial_periods(self):
+        """
+        Test that a series starting mid period is aligned to the period
+        """
+        # Feb 2006 through Apr 2006
+        start, values = resample(JAN2006 + 1, [2.0, 4.0, 6.0], "quarterly")
+        self.assertEqual(start, JAN2006)
+        self.assertEqual(values.tolist(), [3.0, 6.0])
+
+    def test_gaps(self):
+        """
+        Test that missing months are ignored and empty periods are NaN
+        """
+        data = [1.0, np.nan, 3.0, np.nan, np.nan, np.nan, 7.0]
+        start, values = resample(JAN2006, data, "quarterly", "last")
+        self.assertEqual(values[0], 3.0)
+        self.assertTrue(np.isnan(values[1]))
+        self.assertEqual(values[2], 7.0)
+
+    def test_annual(self):
+        """
+        Test aggregating to years
+        """
+        start, values = resample(JAN2006, np.ones(24), "annual", "sum")
+        self.assertEqual(values.tolist(), [12.0, 12.0])
+
+    def test_bad_arguments(self):
+        """
+        Test that unknown frequencies and aggregates raise ValueError
+        """
+        with self.assertRaises(ValueError):
+            resample(JAN2006, [1.0], "weekly")
+
+        with self.assertRaises(ValueError):
+            resample(JAN2006, [1.0], "quarterly", "median")
+
+##########################################################################
+## Downsample Tests
+##########################################################################
+
+
+class DownsampleTests(unittest.TestCase):
+
+    def test_lttb_threshold(self):
+        """
+        Test LTTB keeps the endpoints and the number of points
+        """
+        data = np.sin(np.linspace(0, 10, 200))
+        idx  = lttb(data, 20)
+
+        self.assertEqual(len(idx), 20)
+        self.assertEqual(idx[0], 0)
+        self.assertEqual(idx[-1], 199)
+        self.assertTrue((np.diff(idx) > 0).all())
+
+    def test_lttb_keeps_peak(self):
+        """
+        Test LTTB keeps an outlying peak in the series
+        """
+        data = np.zeros(100)
+        data[37] = 50.0
+        self.assertIn(37, lttb(data, 10))
+
+    def test_lttb_small(self):
+        """
+        Test LTTB on series with fewer points than the threshold
+        """
+        data = [1.0, np.nan, 2.0]
+        self.assertEqual(lttb(data, 10).tolist(), [0, 2])
+        self.assertEqual(lttb(np.arange(10.0), 2).tolist(), [0, 9])
+
+    def test_downsample(self):
+        """
+        Test resampling followed by downsampling
+        """
+        start, values, offsets = downsample(JAN2006, np.arange(120.0), "quarterly", "mean", 10)
+
+        self.assertEqual(start, JAN2006)
+        self.assertEqual(len(values), 10)
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(offsets[-1], 39)
+        self.assertEqual(periods(start, values, offsets, "quarterly")[-1], JAN2006 + 117)
+
+    def test_downsample_no_max(self):
+        """
+        Test that no offsets are returned without downsampling
+        """
+        start, values, offsets = downsample(JAN2006, np.arange(12.0))
+        self.assertIsNone(offsets)
+        self.assertEqual(len(values), 12)
@@ -0,0 +1,205 @@
+# tests.schedule_tests
+# Testing the release calendar ingestion scheduler.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 09:52:17 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: schedule_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the release calendar ingestion scheduler.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import elmr
+import unittest
+
+from datetime import date, datetime, timedelta
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Job
+from elmr.jobs import claim, FINISHED
+from elmr.schedule import Release, ReleaseCalendar
+from elmr.schedule import latest_period, due_sources, schedule
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+## Releases around the end of the test data (2006 - 2007)
+NATIONAL = Release("The Employment Situation", ["CPS", "CESN"], {
+    "2007-11": "2007-12-07",
+    "2007-12": "2008-01-04",
+    "2008-01": "2008-02-01",
+})
+
+STATES   = Release("State Employment and Unemployment", ["LAUS", "CESSM"], {
+    "2007-12": "2008-01-25",
+    "2008-01": "2008-03-07",
+})
+
+##########################################################################
+## Release Calendar Tests
+##########################################################################
+
+
+class ReleaseCalendarTests(unittest.TestCase):
+
+    def test_latest(self):
+        """
+        Test the latest release on or before a date
+        """
+        self.assertIsNone(NATIONAL.latest(date(2007, 12, 6)))
+        self.assertEqual(
+            NATIONAL.latest(date(2008, 1, 4)),
+            (date(2007, 12, 1), date(2008, 1, 4))
+        )
+        self.assertEqual(
+            NATIONAL.latest(date(2009, 1, 1)),
+            (date(2008, 1, 1), date(2008, 2, 1))
+        )
+
+    def test_upcoming(self):
+        """
+        Test the next release after a date
+        """
+        self.assertEqual(
+            STATES.upcoming(date(2008, 1, 25)),
+            (date(2008, 1, 1), date(2008, 3, 7))
+        )
+        self.assertIsNone(STATES.upcoming(date(2008, 3, 7)))
+
+    def test_calendar_sources(self):
+        """
+        Test that a source is published by a single release
+        """
+        calendar = ReleaseCalendar([NATIONAL, STATES])
+        self.assertIs(calendar.release("CESN"), NATIONAL)
+        self.assertIs(calendar.release("LAUS"), STATES)
+
+        with self.assertRaises(ValueError):
+            ReleaseCalendar([NATIONAL, NATIONAL])
+
+    def test_load_calendar(self):
+        """
+        Test that the shipped calendar covers every ingested source
+        """
+        calendar = ReleaseCalendar.load(elmr.config.Config.RELEASE_CALENDAR)
+        for source in ("CPS", "CESN", "LAUS", "CESSM"):
+            release = calendar.release(source)
+            self.assertGreater(len(release.schedule), 0)
+
+            # Every release comes after the period that it reports
+            for period, released in release.schedule:
+                self.assertGreater(released, period)
+
+##########################################################################
+## Scheduler Tests
+##########################################################################
+
+
+class ScheduleTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        self.calendar = ReleaseCalendar([NATIONAL, STATES])
+
+    def tearDown(self):
+        Job.query.delete()
+        elmr.db.session.commit()
+
+    def test_latest_period(self):
+        """
+        Test the latest period of a source in the database
+        """
+        self.assertEqual(latest_period("CESN"), date(2007, 12, 1))
+        self.assertIsNone(latest_period("BOGUS"))
+
+    def test_nothing_due(self):
+        """
+        Test that sources with the latest released period are not due
+        """
+        self.assertEqual(due_sources(self.calendar, date(2008, 1, 31)), [])
+
+        job, due = schedule(self.calendar, date(2008, 1, 31))
+        self.assertIsNone(job)
+        self.assertEqual(Job.query.count(), 0)
+
+    def test_due_sources(self):
+        """
+        Test that only the sources of a new release are due
+        """
+        due = due_sources(self.calendar, date(2008, 2, 1))
+        self.assertEqual(due, [
+            ("CESN", date(2008, 1, 1), date(2008, 2, 1)),
+            ("CPS", date(2008, 1, 1), date(2008, 2, 1)),
+        ])
+
+        due = due_sources(self.calendar, date(2008, 3, 10))
+        self.assertEqual(
+            [source for source, _, _ in due], ["CESN", "CESSM", "CPS", "LAUS"]
+        )
+
+    def test_schedule(self):
+        """
+        Test that an ingestion job is enqueued for the due sources
+        """
+        job, due = schedule(self.calendar, date(2008, 2, 1))
+
+        self.assertEqual(job.kind, "ingest")
+        params = json.loads(job.params)
+        self.assertEqual(params["sources"], ["CESN", "CPS"])
+        self.assertEqual(params["startyear"], 2007)
+        self.assertEqual(params["endyear"], 2008)
+
+    def test_schedule_pending(self):
+        """
+        Test that sources are not enqueued twice while pending
+        """
+        first, _ = schedule(self.calendar, date(2008, 2, 1))
+        later    = datetime.now() + timedelta(days=1)
+        job, due = schedule(self.calendar, date(2008, 2, 1), now=later)
+
+        self.assertIsNone(job)
+        self.assertEqual(due, [])
+
+        # The state sources are due later and are enqueued on their own
+        job, due = schedule(self.calendar, date(2008, 3, 7), now=later)
+        self.assertEqual(json.loads(job.params)["sources"], ["CESSM", "LAUS"])
+
+    def test_schedule_retry(self):
+        """
+        Test that a source is retried until its period appears
+        """
+        first, _ = schedule(self.calendar, date(2008, 2, 1))
+        job = claim(u"worker")
+        job.status = FINISHED
+        elmr.db.session.commit()
+
+        # Not retried before the retry interval, then retried after it
+        soon     = datetime.now() + timedelta(minutes=10)
+        job, due = schedule(self.calendar, date(2008, 2, 1), now=soon)
+        self.assertIsNone(job)
+
+        later    = datetime.now() + timedelta(hours=2)
+        job, due = schedule(self.calendar, date(2008, 2, 1), now=later)
+        self.assertIsNotNone(job)
+        self.assertNotEqual(job.id, first.id)
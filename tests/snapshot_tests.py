@@ -0,0 +1,240 @@
+# tests.snapshot_tests
+# Tests for the static API snapshot build and serving.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 17:38:51 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: snapshot_tests.py [] benjamin@bengfort.com $
+
+"""
+Tests for the static API snapshot build and serving.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import gzip
+import json
+import elmr
+import shutil
+import tempfile
+import unittest
+
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.snapshot import snapshot_filename, snapshot_requests
+from elmr.snapshot import build_snapshot, CURRENT
+
+##########################################################################
+## Snapshot Filename Tests
+##########################################################################
+
+
+class SnapshotFilenameTests(unittest.TestCase):
+
+    def test_no_query(self):
+        """
+        Test the snapshot filename without a query string
+        """
+        self.assertEqual(
+            snapshot_filename("/api/source/CPS/", {}, "json"),
+            os.path.join("api", "source", "CPS", "index.json")
+        )
+
+    def test_sorted_query(self):
+        """
+        Test the snapshot filename sorts the query string
+        """
+        query = {"is_delta": "false", "is_adjusted": "true"}
+        self.assertEqual(
+            snapshot_filename("/api/geo/laus/unemployment-rate/", query, "csv"),
+            os.path.join(
+                "api", "geo", "laus", "unemployment-rate",
+                "index.is_adjusted=true&is_delta=false.csv"
+            )
+        )
+
+    def test_unicode_query(self):
+        """
+        Test the snapshot filename encodes unicode queries as utf-8
+        """
+        self.assertEqual(
+            snapshot_filename(u"/api/series/", {u"x": u"\xe9"}, "json"),
+            os.path.join("api", "series", "index.x=%C3%A9.json")
+        )
+
+    def test_relative_path(self):
+        """
+        Test the snapshot filename rejects relative path segments
+        """
+        with self.assertRaises(ValueError):
+            snapshot_filename("/api/series/../../secret/", {}, "json")
+
+        with self.assertRaises(ValueError):
+            snapshot_filename("/api/./source/", {}, "json")
+
+##########################################################################
+## Snapshot Build and Serve Tests
+##########################################################################
+
+
+class SnapshotTests(TestCase):
+
+    REQUESTS = [
+        ("/api/", {}),
+        ("/api/source/", {}),
+        ("/api/source/CPS/", {}),
+        ("/api/geo/laus/unemployment-rate/", {}),
+        ("/api/status/", {}),
+    ]
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.app.config['SNAPSHOT_ROOT'] = self.root
+
+    def tearDown(self):
+        self.app.config['SERVE_SNAPSHOT'] = False
+        self.app.config['SNAPSHOT_ROOT']  = elmr.config.TestingConfig.SNAPSHOT_ROOT
+        shutil.rmtree(self.root)
+
+    def test_snapshot_requests(self):
+        """
+        Test the snapshot covers the read API but not the status endpoints
+        """
+        requests = list(snapshot_requests())
+        paths    = set(path for path, _ in requests)
+
+        self.assertIn("/api/source/CPS/", paths)
+        self.assertIn("/api/source/cps/", paths)
+        self.assertIn("/api/regions/", paths)
+        self.assertIn(("/api/series/", {"page": 2}), requests)
+        self.assertFalse(any(p.startswith("/api/status/") for p in paths))
+
+    def test_build_snapshot(self):
+        """
+        Test building a snapshot writes plain and gzipped responses
+        """
+        target, count, nbyte, _ = build_snapshot(requests=self.REQUESTS)
+        current = os.path.join(self.root, CURRENT)
+
+        self.assertEqual(count, len(self.REQUESTS) - 1)
+        self.assertGreater(nbyte, 0)
+        self.assertEqual(os.path.realpath(current), os.path.realpath(target))
+
+        fname = os.path.join(current, "api", "source", "CPS", "index.json")
+        with open(fname, 'rb') as f:
+            data = json.load(f)
+        with gzip.open(fname + ".gz", 'rb') as f:
+            self.assertEqual(json.load(f), data)
+
+        self.assertEqual(data["title"], "ELMR Ingested CPS Data")
+        self.assertTrue(os.path.exists(os.path.join(
+            current, "api", "geo", "laus", "unemployment-rate", "index.csv"
+        )))
+
+    def test_serve_snapshot(self):
+        """
+        Test that snapshot responses are served when configured
+        """
+        build_snapshot(requests=self.REQUESTS)
+        fname = os.path.join(self.root, CURRENT, "api", "index.json")
+        with open(fname, 'wb') as f:
+            f.write(json.dumps({"snapshot": True}))
+
+        response = self.client.get("/api/")
+        self.assertNotIn("snapshot", response.json)
+
+        self.app.config['SERVE_SNAPSHOT'] = True
+        response = self.client.get("/api/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {"snapshot": True})
+
+        # Misses fall through to the live view
+        response = self.client.get("/api/source/CESN/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["title"], "ELMR Ingested CESN Data")
+
+    def test_serve_gzipped_snapshot(self):
+        """
+        Test that the precompressed response is served if accepted
+        """
+        build_snapshot(requests=self.REQUESTS)
+        self.app.config['SERVE_SNAPSHOT'] = True
+
+        response = self.client.get(
+            "/api/geo/laus/unemployment-rate/",
+            headers={"Accept-Encoding": "gzip"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.mimetype, "text/csv")
+        self.assertIn("Content-Disposition", response.headers)
+
+    def test_status_not_served(self):
+        """
+        Test that the status endpoints are never served from the snapshot
+        """
+        build_snapshot(requests=self.REQUESTS)
+        self.app.config['SERVE_SNAPSHOT'] = True
+
+        fname = os.path.join(self.root, CURRENT, "api", "status", "index.json")
+        self.assertFalse(os.path.exists(fname))
+
+    def test_case_sensitive_paths(self):
+        """
+        Test that the snapshot does not serve mis-cased BLS IDs
+        """
+        build_snapshot(requests=[("/api/series/LNS14000000/", {})])
+        self.app.config['SERVE_SNAPSHOT'] = True
+
+        response = self.client.get("/api/series/LNS14000000/")
+        self.assert200(response)
+
+        response = self.client.get("/api/series/lns14000000/")
+        self.assert404(response)
+
+    def test_path_traversal(self):
+        """
+        Test that the snapshot never serves files outside of the snapshot
+        """
+        build_snapshot(requests=[("/api/series/", {})])
+        self.app.config['SERVE_SNAPSHOT'] = True
+
+        # The snapshot is at root/<version>/api/series/index.json
+        secret = os.path.join(self.root, "secret")
+        os.makedirs(secret)
+        with open(os.path.join(secret, "index.json"), 'wb') as f:
+            f.write(json.dumps({"secret": True}))
+
+        response = self.client.get("/api/series/..%2f..%2f..%2fsecret/")
+        self.assertNotEqual(response.status_code, 200)
+        self.assertNotIn("secret", response.data)
+
+    def test_unicode_query_served(self):
+        """
+        Test that requests with unicode queries fall through to the views
+        """
+        build_snapshot(requests=self.REQUESTS)
+        self.app.config['SERVE_SNAPSHOT'] = True
+
+        response = self.client.get("/api/source/CPS/?x=%C3%A9")
+        self.assert200(response)
+        self.assertEqual(response.json["title"], "ELMR Ingested CPS Data")
@@ -0,0 +1,230 @@
+# tests.store_tests
+# Testing the memory-mapped time series store.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 21:56:09 2026 -0400
+#
+# Copyright (C) 2015 University of Maryland
+# For license information, see LICENSE.txt
+#
+# ID: store_tests.py [] benjamin@bengfort.com $
+
+"""
+Testing the memory-mapped time series store.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import elmr
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import elmr.store
+
+from datetime import date, datetime
+from flask.ext.testing import TestCase
+from tests.initdb import syncdb, dropdb, loaddb
+from elmr.models import Series, IngestionRecord, Job
+from elmr.signals import ingestion_finished
+from elmr.config import TestingConfig
+from elmr.store import pack, build_store, get_store, series_array
+from elmr.store import array_records, array_columnar
+from elmr.columnar import columnar
+
+##########################################################################
+## Pack Tests
+##########################################################################
+
+
+class PackTests(unittest.TestCase):
+
+    def test_pack(self):
+        """
+        Test that series are packed end to end with NaN for gaps
+        """
+        series = np.array([3, 3, 3, 7, 7])
+        months = np.array([10, 11, 13, 5, 6])
+        values = np.array([1.0, 2.0, 4.0, 5.0, 6.0])
+
+        packed, index = pack(series, months, values)
+
+        self.assertEqual(index.tolist(), [[3, 0, 4, 10], [7, 4, 2, 5]])
+        self.assertEqual(len(packed), 6)
+        self.assertEqual(packed[:2].tolist(), [1.0, 2.0])
+        self.assertTrue(np.isnan(packed[2]))
+        self.assertEqual(packed[3:].tolist(), [4.0, 5.0, 6.0])
+
+    def test_pack_empty(self):
+        """
+        Test packing no records
+        """
+        packed, index = pack(np.zeros(0), np.zeros(0), np.zeros(0))
+        self.assertEqual(len(packed), 0)
+        self.assertEqual(index.shape, (0, 4))
+
+    def test_array_columnar(self):
+        """
+        Test the columnar array matches the columnar records
+        """
+        nan    = float('nan')
+        values = np.array([nan, 1.5, nan, nan, 2.0, nan])
+        data   = array_columnar(24096, values)
+
+        self.assertEqual(data, columnar(array_records(24096, values)))
+        self.assertEqual(data["start"], "2008-02")
+        self.assertEqual(data["values"], [1.5, None, None, 2.0])
+        self.assertIs(type(data["values"][0]), float)
+
+    def test_array_columnar_empty(self):
+        """
+        Test the columnar array of no values
+        """
+        data = array_columnar(24096, np.array([float('nan')]))
+        self.assertEqual(data, columnar([]))
+
+##########################################################################
+## Store Tests
+##########################################################################
+
+
+class StoreTests(TestCase):
+
+    def create_app(self):
+        return elmr.configure('elmr.config.TestingConfig')
+
+    @classmethod
+    def setUpClass(cls):
+        syncdb()
+        loaddb()
+
+    @classmethod
+    def tearDownClass(cls):
+        dropdb()
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.app.config['STORE_ROOT'] = self.root
+        self.app.config['USE_STORE']  = True
+        elmr.store.clear()
+
+    def tearDown(self):
+        self.app.config['STORE_ROOT'] = TestingConfig.STORE_ROOT
+        self.app.config['USE_STORE']  = TestingConfig.USE_STORE
+        elmr.store.clear()
+        shutil.rmtree(self.root)
+
+    def get_series_ids(self):
+        """
+        Returns every tenth series id (comparing all is slow)
+        """
+        return [s.id for s in Series.query.order_by(Series.id)][::10]
+
+    def test_no_store(self):
+        """
+        Test that without a store the database is used
+        """
+        self.assertIsNone(get_store())
+
+        self.app.config['USE_STORE'] = False
+        build_store()
+        self.assertIsNone(get_store())
+
+    def test_store_miss_not_cached(self):
+        """
+        Test that a store built after a miss is found without clearing
+        """
+        self.assertIsNone(get_store())
+        self.assertEqual(len(elmr.store.stores), 0)
+
+        # Build the store as another process would, without clearing
+        version = elmr.store.store_version()
+        clear   = elmr.store.clear
+        try:
+            elmr.store.clear = lambda: None
+            build_store()
+        finally:
+            elmr.store.clear = clear
+
+        self.assertIsNotNone(get_store())
+        self.assertEqual(get_store().path, elmr.store.store_path(version))
+
+    def test_build_store(self):
+        """
+        Test that the store is written for the version and memory mapped
+        """
+        path, nseries, nvalues, _ = build_store()
+
+        self.assertTrue(os.path.exists(os.path.join(path, "values.npy")))
+        self.assertGreater(nseries, 0)
+        self.assertGreaterEqual(nvalues, nseries)
+
+        store = get_store()
+        self.assertIsNotNone(store)
+        self.assertEqual(store.path, path)
+        self.assertIsInstance(store.values, np.memmap)
+        self.assertEqual(len(store), nseries)
+
+    def test_store_matches_database(self):
+        """
+        Test that the store gives the same arrays as the database
+        """
+        build_store()
+        queries = (
+            {},
+            {"start": date(2006, 9, 1), "end": date(2007, 2, 1)},
+            {"end": date(2006, 12, 1), "last": 5},
+            {"last": 30},
+            {"start": date(2010, 1, 1)},
+        )
+
+        for sid in self.get_series_ids():
+            for kwargs in queries:
+                self.app.config['USE_STORE'] = True
+                stored = series_array(sid, **kwargs)
+
+                self.app.config['USE_STORE'] = False
+                actual = series_array(sid, **kwargs)
+
+                self.assertEqual(stored[0], actual[0])
+                np.testing.assert_array_equal(stored[1], actual[1])
+
+    def test_endpoint_from_store(self):
+        """
+        Test that the series endpoint answers the same from the store
+        """
+        blsid    = Series.query.first().blsid
+        endpoint = "/api/series/%s/?start=2006-06" % blsid
+        expected = self.client.get(endpoint).json
+
+        build_store()
+        self.assertEqual(self.client.get(endpoint).json, expected)
+
+    def test_stale_store(self):
+        """
+        Test that the store is not used once the data has changed
+        """
+        build_store()
+        self.assertIsNotNone(get_store())
+
+        latest = IngestionRecord.query.order_by(IngestionRecord.id.desc()).first()
+        record = IngestionRecord(
+            id=latest.id + 1,
+            title=u"ELMR Testing Stale Store",
+            version=elmr.get_version(),
+            start_year=date(2006, 1, 1), end_year=date(2007, 1, 1),
+            duration=0.0, started=datetime.now(), finished=datetime.now(),
+        )
+        elmr.db.session.add(record)
+        elmr.db.session.commit()
+
+        # The version is cached until the data change signals are sent
+        self.assertIsNotNone(get_store())
+        elmr.signals.ingestion_finished.send(record)
+        self.assertIsNone(get_store())
+
+        elmr.db.session.delete(record)
+        elmr.db.session.commit()
@@ -73,6 +73,36 @@ class TimeHelperTests(unittest.TestCase):
         dtb = dta + timedelta(days=1000)
         self.assertEqual(months_between(dta, dtb), 32)
 
+    def test_months_between_month_end(self):
+        """
+        Test the months between helper at the end of the month
+        """
+
+        dta = datetime(2015, 1, 31, 12, 0, 0)
+        self.assertEqual(months_between(dta, datetime(2015, 2, 27, 12)), 0)
+        self.assertEqual(months_between(dta, datetime(2015, 2, 28, 12)), 1)
+        self.assertEqual(months_between(dta, datetime(2015, 3, 30, 12)), 1)
+        self.assertEqual(months_between(dta, datetime(2015, 3, 31, 12)), 2)
+        self.assertEqual(months_between(dta, datetime(2016, 2, 29, 12)), 13)
+
+    def test_months_between_reversed(self):
+        """
+        Test that months between is zero if the second date is earlier
+        """
+
+        dta = datetime(2015, 4, 15, 12, 0, 0)
+        dtb = dta - timedelta(days=90)
+        self.assertEqual(months_between(dta, dtb), 0)
+
+    def test_months_between_large(self):
+        """
+        Test that months between does not depend on a loop over months
+        """
+
+        dta = datetime(1, 1, 1, 0, 0, 0)
+        dtb = datetime(9999, 12, 31, 0, 0, 0)
+        self.assertEqual(months_between(dta, dtb), 119987)
+
     def test_months_between_tz_aware(self):
         """
         Test the months between helper with timezones